@@ -1,6 +1,7 @@
 """
 Methods to interact with the Asgard API to perform various tasks.
 """
+# pylint: disable=too-many-lines
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
@@ -9,12 +10,18 @@ import os
 import logging
 import time
 import copy
-from collections import defaultdict
+import threading
+from collections import defaultdict, OrderedDict
+from contextlib import contextmanager
+from functools import wraps
+from concurrent.futures import Future
 import requests
+from requests.adapters import HTTPAdapter
 import six
 import tubular.ec2 as ec2
 
-from tubular.utils.retry import retry
+from tubular.utils.retry import retry, giveup_on, decorrelated_jitter, DELAY_SECONDS
+from tubular.utils.concurrency import run_concurrently
 from tubular.exception import (
     BackendError,
     BackendDataError,
@@ -30,11 +37,27 @@ from tubular.exception import (
 from tubular.utils import WAIT_SLEEP_TIME, DISABLE_OLD_ASG_WAIT_TIME
 
 ASGARD_API_ENDPOINT = os.environ.get("ASGARD_API_ENDPOINTS", "http://dummy.url:8091/us-east-1")
-ASGARD_API_TOKEN = "asgardApiToken={}".format(os.environ.get("ASGARD_API_TOKEN", "dummy-token"))
+ASGARD_API_TOKEN_VALUE = os.environ.get("ASGARD_API_TOKEN", "dummy-token")
+ASGARD_API_TOKEN = "asgardApiToken={}".format(ASGARD_API_TOKEN_VALUE)
 # Asgard's ASG creation times out at 25 minutes - set tubular's timeout to 26 minutes (1560 seconds).
 ASGARD_NEW_ASG_CREATION_TIMEOUT = int(os.environ.get("ASGARD_NEW_ASG_CREATION_TIMEOUT", 1560))
+# Maximum number of clusters in which new ASGs are created at the same time during a deploy.
+ASGARD_NEW_ASG_CONCURRENCY = int(os.environ.get("ASGARD_NEW_ASG_CONCURRENCY", 4))
+# Maximum number of ASGs enabled or disabled at the same time during a red/black cutover.
+ASGARD_CUTOVER_CONCURRENCY = int(os.environ.get("ASGARD_CUTOVER_CONCURRENCY", 8))
+# Maximum number of AMIs deployed at the same time by deploy_many.
+ASGARD_DEPLOY_CONCURRENCY = int(os.environ.get("ASGARD_DEPLOY_CONCURRENCY", 4))
 ASGARD_ELB_HEALTH_TIMEOUT = int(os.environ.get("ASGARD_ELB_HEALTH_TIMEOUT", 600))
 REQUESTS_TIMEOUT = float(os.environ.get("REQUESTS_TIMEOUT", 10))
+# Number of per-host connection pools and the number of keep-alive connections kept in each pool.
+ASGARD_POOL_CONNECTIONS = int(os.environ.get("ASGARD_POOL_CONNECTIONS", 4))
+ASGARD_POOL_MAXSIZE = int(os.environ.get("ASGARD_POOL_MAXSIZE", 16))
+# Seconds before the first poll of an Asgard task and the factor by which the delay between polls grows.
+# The delay between polls never grows beyond WAIT_SLEEP_TIME.
+ASGARD_TASK_POLL_INITIAL = float(os.environ.get("ASGARD_TASK_POLL_INITIAL", 0.5))
+ASGARD_TASK_POLL_BACKOFF = float(os.environ.get("ASGARD_TASK_POLL_BACKOFF", 1.5))
+# Seconds for which ASG and cluster information fetched during a deploy is reused.
+ASGARD_INFO_CACHE_TTL = float(os.environ.get("ASGARD_INFO_CACHE_TTL", 10))
 
 CLUSTER_LIST_URL = "{}/cluster/list.json".format(ASGARD_API_ENDPOINT)
 ASG_ACTIVATE_URL = "{}/cluster/activate".format(ASGARD_API_ENDPOINT)
@@ -43,10 +66,285 @@ ASG_DELETE_URL = "{}/cluster/delete".format(ASGARD_API_ENDPOINT)
 NEW_ASG_URL = "{}/cluster/createNextGroup".format(ASGARD_API_ENDPOINT)
 ASG_INFO_URL = "{}/autoScaling/show/{}.json".format(ASGARD_API_ENDPOINT, "{}")
 CLUSTER_INFO_URL = "{}/cluster/show/{}.json".format(ASGARD_API_ENDPOINT, "{}")
+# Failures which would recur on every attempt, so are raised without retrying.
+NON_RETRYABLE_EXCEPTIONS = (
+    ResourceDoesNotExistException,
+    CannotDeleteActiveASG,
+    CannotDeleteLastASG,
+    CannotDisableActiveASG,
+)
+# Waits between attempts start at a second and grow at random up to RETRY_DELAY_SECONDS, so that
+# calls which failed together, such as those of a concurrent cutover, do not retry together.
+RETRY_WAIT = decorrelated_jitter(base_seconds=1, max_seconds=float(DELAY_SECONDS))
 
 LOG = logging.getLogger(__name__)
 
 
+def _counting_pool_class(pool_class, on_new_connection):
+    """
+    Returns:
+        type: A subclass of the urllib3 connection pool class pool_class which calls
+              on_new_connection each time it opens a new connection.
+    """
+    class _CountingConnectionPool(pool_class):
+        """
+        A connection pool which reports each connection it opens.
+        """
+        def _new_conn(self):
+            on_new_connection()
+            return super(_CountingConnectionPool, self)._new_conn()
+    return _CountingConnectionPool
+
+
+class _CountingHTTPAdapter(HTTPAdapter):
+    """
+    An HTTPAdapter which counts the requests it sends so that they can be compared
+    with the number of connections its pools had to open to send them.
+
+    Both counts are kept for the life of the adapter, so they are not lowered when
+    pools are evicted from the pool manager.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._lock = threading.Lock()
+        self.requests_sent = 0
+        self._connections_opened = 0
+        super(_CountingHTTPAdapter, self).__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):  # pylint: disable=arguments-differ
+        super(_CountingHTTPAdapter, self).init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            scheme: _counting_pool_class(pool_class, self._count_connection)
+            for scheme, pool_class in six.iteritems(self.poolmanager.pool_classes_by_scheme)
+        }
+
+    def _count_connection(self):
+        """
+        Record that a pool opened a new connection.
+        """
+        with self._lock:
+            self._connections_opened += 1
+
+    def send(self, request, *args, **kwargs):  # pylint: disable=arguments-differ
+        with self._lock:
+            self.requests_sent += 1
+        return super(_CountingHTTPAdapter, self).send(request, *args, **kwargs)
+
+    def connections_opened(self):
+        """
+        Returns:
+            int: The number of connections opened by this adapter's connection pools since it was created.
+        """
+        with self._lock:
+            return self._connections_opened
+
+
+class AsgardClient(object):
+    """
+    Owns the pooled, keep-alive HTTP session used for every call made to Asgard.
+
+    The Asgard API token is attached to the session once, so callers only need to pass
+    the URL and any payload.
+    """
+
+    def __init__(
+            self,
+            api_token=ASGARD_API_TOKEN_VALUE,
+            timeout=REQUESTS_TIMEOUT,
+            pool_connections=ASGARD_POOL_CONNECTIONS,
+            pool_maxsize=ASGARD_POOL_MAXSIZE,
+    ):
+        """
+        Arguments:
+            api_token(str): The Asgard API token sent with every request.
+            timeout(float): Seconds to wait for a connection/response from Asgard.
+            pool_connections(int): Number of per-host connection pools to cache.
+            pool_maxsize(int): Maximum number of keep-alive connections kept in each pool.
+        """
+        self.timeout = timeout
+        self._adapter = _CountingHTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session = requests.Session()
+        self.session.params = {'asgardApiToken': api_token}
+        self.session.headers['Connection'] = 'keep-alive'
+        self.session.mount('http://', self._adapter)
+        self.session.mount('https://', self._adapter)
+
+    def get(self, url, **kwargs):
+        """
+        Send a GET request to Asgard over the pooled session.
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        return self.session.get(url, **kwargs)
+
+    def post(self, url, data=None, **kwargs):
+        """
+        Send a POST request to Asgard over the pooled session.
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        return self.session.post(url, data=data, **kwargs)
+
+    def prepared_url(self, url):
+        """
+        Returns:
+            str: The full URL, including the API token, that a GET of url would request.
+        """
+        return self.session.prepare_request(requests.Request('GET', url)).url
+
+    def connection_stats(self):
+        """
+        Returns:
+            dict: Counts of the requests sent, the connections opened to send them and
+                  the number of requests which reused an already open connection.
+        """
+        requests_sent = self._adapter.requests_sent
+        connections_opened = self._adapter.connections_opened()
+        return {
+            'requests': requests_sent,
+            'connections': connections_opened,
+            'reused': max(requests_sent - connections_opened, 0),
+        }
+
+    def close(self):
+        """
+        Close all pooled connections.
+        """
+        self.session.close()
+
+
+_CLIENT = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def get_client():
+    """
+    Returns:
+        AsgardClient: The client used by the functions in this module, created on first use.
+    """
+    global _CLIENT  # pylint: disable=global-statement
+    with _CLIENT_LOCK:
+        if _CLIENT is None:
+            _CLIENT = AsgardClient()
+        return _CLIENT
+
+
+def set_client(client):
+    """
+    Replace the client used by the functions in this module.
+
+    Arguments:
+        client(AsgardClient): The client to use, or None to create a default client on next use.
+    """
+    global _CLIENT  # pylint: disable=global-statement
+    with _CLIENT_LOCK:
+        _CLIENT = client
+
+
+class _InfoCache(object):
+    """
+    A read-through cache of Asgard resource information, keyed by URL.
+
+    Entries are only stored and served while at least one scope is open, so information is
+    shared between the lookups made by a single deploy but never across separate runs.
+    """
+
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._open_scopes = 0
+
+    @contextmanager
+    def scope(self):
+        """
+        Cache information fetched from Asgard until the outermost scope is closed.
+        """
+        with self._lock:
+            self._open_scopes += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._open_scopes -= 1
+                if self._open_scopes == 0:
+                    self._entries.clear()
+
+    def get(self, url, fetch):
+        """
+        Return the cached information for url, calling fetch(url) if it is missing or expired.
+        """
+        with self._lock:
+            caching = self._open_scopes > 0
+            expires, info = self._entries.get(url, (0, None))
+            if caching and expires > time.time():
+                self.hits += 1
+                return info
+            if caching:
+                self.misses += 1
+
+        info = fetch(url)
+        with self._lock:
+            if self._open_scopes:
+                self._entries[url] = (time.time() + self.ttl, info)
+        return info
+
+    def invalidate(self, *urls):
+        """
+        Drop the cached information for each of the urls.
+        """
+        with self._lock:
+            for url in urls:
+                self._entries.pop(url, None)
+
+    def invalidate_asg(self, asg):
+        """
+        Drop the cached information for an ASG along with all cached cluster information,
+        as the ASG's cluster is not necessarily known.
+        """
+        cluster_prefix = CLUSTER_INFO_URL.format("")[:-len(".json")]
+        with self._lock:
+            self._entries.pop(ASG_INFO_URL.format(asg), None)
+            for url in [url for url in self._entries if url.startswith(cluster_prefix)]:
+                del self._entries[url]
+
+    def stats(self):
+        """
+        Returns:
+            dict: Counts of cache hits and misses.
+        """
+        return {'hits': self.hits, 'misses': self.misses}
+
+
+_INFO_CACHE = _InfoCache(ASGARD_INFO_CACHE_TTL)
+
+
+def _within_info_cache(func):
+    """
+    Decorator which shares ASG and cluster information fetched from Asgard, and the
+    ec2 ASG inventory, across a call of func.
+    """
+    @wraps(func)
+    def _wrapper(*args, **kwargs):
+        """
+        Call func within an info cache scope and an ASG inventory snapshot.
+        """
+        with _INFO_CACHE.scope(), ec2.asg_inventory():
+            return func(*args, **kwargs)
+    return _wrapper
+
+
+def _log_connection_stats():
+    """
+    Log how many Asgard requests were able to reuse a pooled connection or cached information,
+    and how long Asgard tasks took to finish.
+    """
+    LOG.info("Asgard connection stats: {} - info cache stats: {}".format(
+        get_client().connection_stats(), _INFO_CACHE.stats()
+    ))
+    LOG.info("Asgard task latency: {}".format(task_latency_stats()))
+
+
 def _parse_json(url, response):
     """
     Protect against non-JSON responses that are sometimes returned from Asgard.
@@ -59,7 +357,79 @@ def _parse_json(url, response):
     return response_json
 
 
-@retry()
+class ClusterIndex(object):
+    """
+    An index of Asgard's cluster list, mapping each ASG name to the clusters it belongs to.
+    """
+
+    def __init__(self, cluster_json):
+        """
+        Arguments:
+            cluster_json(list): The parsed response of the cluster list endpoint.
+
+        Raises:
+            BackendDataError: A cluster is missing the 'cluster' or 'autoScalingGroups' keys.
+        """
+        self.asgs_by_cluster = OrderedDict()
+        self.clusters_by_asg = defaultdict(list)
+        for cluster in cluster_json:
+            if "autoScalingGroups" not in cluster or "cluster" not in cluster:
+                msg = "Expected 'cluster' and 'autoScalingGroups' keys in dict: {}".format(cluster)
+                raise BackendDataError(msg)
+
+            self.asgs_by_cluster[cluster['cluster']] = cluster['autoScalingGroups']
+            for asg in cluster['autoScalingGroups']:
+                self.clusters_by_asg[asg].append(cluster['cluster'])
+
+    def clusters_for_asgs(self, asgs):
+        """
+        Find the clusters of many ASGs in a single pass.
+
+        Arguments:
+            asgs(iterable): ASG names.
+
+        Returns:
+            dict: A mapping of the name of each cluster containing any of the ASGs
+                  to all the ASGs in that cluster, in cluster list order.
+        """
+        relevant_cluster_names = set()
+        for asg in set(asgs):
+            relevant_cluster_names.update(self.clusters_by_asg.get(asg, ()))
+
+        return OrderedDict(
+            (cluster, cluster_asgs) for cluster, cluster_asgs in six.iteritems(self.asgs_by_cluster)
+            if cluster in relevant_cluster_names
+        )
+
+
+def _fetch_cluster_index(url):
+    """
+    Build a ClusterIndex from Asgard's cluster list.
+    """
+    client = get_client()
+    LOG.debug("Getting Cluster List from: {}".format(client.prepared_url(url)))
+    response = client.get(url)
+    index = ClusterIndex(_parse_json(url, response))
+    LOG.debug("Indexed {} ASGs in {} clusters.".format(len(index.clusters_by_asg), len(index.asgs_by_cluster)))
+    return index
+
+
+def cluster_index():
+    """
+    Get an index of all Asgard clusters. Within a deploy the index is fetched once and reused
+    until a new ASG is created or an ASG is deleted.
+
+    Returns:
+        ClusterIndex: The index of Asgard's current cluster list.
+
+    Raises:
+        BackendDataError: We got bad data from the backend. We can't
+            get cluster information from it.
+    """
+    return _INFO_CACHE.get(CLUSTER_LIST_URL, _fetch_cluster_index)
+
+
+@retry(wait=RETRY_WAIT, giveup=giveup_on(*NON_RETRYABLE_EXCEPTIONS))
 def clusters_for_asgs(asgs):
     """
     An autoscaling group can belong to multiple clusters potentially.
@@ -93,31 +463,10 @@ def clusters_for_asgs(asgs):
         BackendDataError: We got bad data from the backend. We can't
             get cluster information from it.
     """
+    return dict(cluster_index().clusters_for_asgs(asgs))
 
-    request = requests.Request('GET', CLUSTER_LIST_URL, params=ASGARD_API_TOKEN)
-    url = request.prepare().url
-    LOG.debug("Getting Cluster List from: {}".format(url))
-    response = requests.get(CLUSTER_LIST_URL, params=ASGARD_API_TOKEN, timeout=REQUESTS_TIMEOUT)
-    cluster_json = _parse_json(url, response)
-
-    relevant_clusters = {}
-    for cluster in cluster_json:
-        if "autoScalingGroups" not in cluster or "cluster" not in cluster:
-            msg = "Expected 'cluster' and 'autoScalingGroups' keys in dict: {}".format(cluster)
-            raise BackendDataError(msg)
 
-        for asg in cluster['autoScalingGroups']:
-            LOG.debug("Membership: {} in {}: {}".format(asg, asgs, asg in asgs))
-            if asg in asgs:
-                relevant_clusters[cluster['cluster']] = cluster['autoScalingGroups']
-                # A cluster can have multiple relevant ASGs.
-                # We don't need to check them all.
-                break  # The inner for loop
-
-    return relevant_clusters
-
-
-@retry()
+@retry(wait=RETRY_WAIT, giveup=giveup_on(*NON_RETRYABLE_EXCEPTIONS))
 def asgs_for_cluster(cluster):
     """
     Given a named cluster, get all ASGs in the cluster.
@@ -131,7 +480,7 @@ def asgs_for_cluster(cluster):
 
     LOG.debug("URL: {}".format(CLUSTER_INFO_URL.format(cluster)))
     url = CLUSTER_INFO_URL.format(cluster)
-    response = requests.get(url, params=ASGARD_API_TOKEN, timeout=REQUESTS_TIMEOUT)
+    response = get_client().get(url)
 
     LOG.debug("ASGs for Cluster: {}".format(response.text))
     asgs = _parse_json(url, response)
@@ -144,34 +493,240 @@ def asgs_for_cluster(cluster):
     return asgs
 
 
-def wait_for_task_completion(task_url, timeout):
+class _LatencyHistogram(object):
+    """
+    Counts how long Asgard tasks took to finish, in buckets of seconds, keyed by the kind of task.
+    """
+    BUCKETS = (1, 2, 5, 10, 30, 60, 120, 300, 600, 1200, 1800)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = defaultdict(lambda: [0] * (len(self.BUCKETS) + 1))
+        self._totals = defaultdict(float)
+
+    def record(self, label, seconds):
+        """
+        Record that a task of kind label took seconds to finish.
+        """
+        bucket = len([upper for upper in self.BUCKETS if seconds > upper])
+        with self._lock:
+            self._counts[label][bucket] += 1
+            self._totals[label] += seconds
+
+    def stats(self):
+        """
+        Returns:
+            dict: For each kind of task, the number of tasks, their mean latency and
+                  the number of tasks in each latency bucket.
+        """
+        bucket_names = ["<={}s".format(upper) for upper in self.BUCKETS] + [">{}s".format(self.BUCKETS[-1])]
+        with self._lock:
+            return {
+                label: {
+                    'count': sum(counts),
+                    'mean': self._totals[label] / sum(counts),
+                    'buckets': dict(zip(bucket_names, counts)),
+                }
+                for label, counts in six.iteritems(self._counts)
+            }
+
+
+_TASK_LATENCY = _LatencyHistogram()
+
+
+def task_latency_stats():
+    """
+    Returns:
+        dict: Histograms of how long the Asgard tasks waited on so far took to finish, keyed by the kind of task.
     """
+    return _TASK_LATENCY.stats()
+
+
+def _next_poll_delay(delay, running_tasks, use_task_log):
+    """
+    Work out how long to wait before polling running Asgard tasks again.
+
+    The delay grows geometrically up to WAIT_SLEEP_TIME. When use_task_log is set and every running task
+    reports that it is waiting for instances to launch, which takes minutes, the delay jumps to WAIT_SLEEP_TIME.
+    """
+    if use_task_log and running_tasks and all(
+            'Waiting for' in (task.get('operation') or '') for task in running_tasks
+    ):
+        return WAIT_SLEEP_TIME
+    return min(delay * ASGARD_TASK_POLL_BACKOFF, WAIT_SLEEP_TIME)
+
+
+class TaskWatcher(object):
+    """
+    Waits on many Asgard tasks from a single polling loop over the shared Asgard session.
+
+    Each submitted task URL gets a Future which resolves to the parsed json of the task once it
+    has 'completed' or 'failed'. Bulk operations can submit all their tasks up front and then
+    wait once, instead of paying the polling latency once per task.
+
+    Polls start ASGARD_TASK_POLL_INITIAL seconds apart and back off geometrically up to WAIT_SLEEP_TIME.
+    """
+
+    def __init__(self, timeout, label=None, use_task_log=True):
+        """
+        Arguments:
+            timeout(int): Default number of seconds to wait for each submitted task to finish.
+            label(str): The kind of task, used to record task latency.
+            use_task_log(bool): If True, poll at the slowest rate while every task reports it is waiting on instances.
+        """
+        self.timeout = timeout
+        self.label = label
+        self.use_task_log = use_task_log
+        self._lock = threading.Lock()
+        self._pending = OrderedDict()
+
+    def submit(self, task_url, callback=None, timeout=None):
+        """
+        Start watching an Asgard task.
+
+        Arguments:
+            task_url(str): The URL from which to retrieve task status.
+            callback(function): Called with the task's Future once the task has finished or failed to.
+            timeout(int): Seconds to wait for this task, if different from the watcher's timeout.
+
+        Returns:
+            concurrent.futures.Future: Resolves to the parsed json of the task completion or failure status.
+                Raises TimeoutException if the task does not finish in time, or the error
+                met while retrieving its status.
+        """
+        json_url = task_url if task_url.endswith('.json') else task_url + ".json"
+        future = Future()
+        if callback:
+            future.add_done_callback(callback)
+        submitted = time.time()
+        deadline = submitted + (self.timeout if timeout is None else timeout)
+        with self._lock:
+            self._pending[json_url] = (future, submitted, deadline)
+        LOG.debug("Watching task URL: {}".format(json_url))
+        return future
+
+    def _finish(self, json_url, result=None, error=None):
+        """
+        Stop watching a task and resolve its Future.
+        """
+        with self._lock:
+            future, submitted, __ = self._pending.pop(json_url)
+        if error is None:
+            _TASK_LATENCY.record(self.label, time.time() - submitted)
+            future.set_result(result)
+        else:
+            future.set_exception(error)
+        return future
+
+    def _poll(self):
+        """
+        Poll every pending task once.
+
+        Returns:
+            tuple(list(Future), list(dict)): The Futures of the tasks which finished,
+                and the parsed json of the tasks which are still running.
+        """
+        finished = []
+        running_tasks = []
+        with self._lock:
+            pending = [(json_url, deadline) for json_url, (__, __, deadline) in six.iteritems(self._pending)]
+        for json_url, deadline in pending:
+            if time.time() >= deadline:
+                error = TimeoutException("Timed out while waiting for task {}".format(json_url))
+                finished.append(self._finish(json_url, error=error))
+                continue
+            try:
+                json_response = _parse_json(json_url, get_client().get(json_url))
+            except (BackendError, requests.exceptions.RequestException) as error:
+                finished.append(self._finish(json_url, error=error))
+                continue
+            if json_response['status'] in ('completed', 'failed'):
+                finished.append(self._finish(json_url, result=json_response))
+            else:
+                running_tasks.append(json_response)
+        return finished, running_tasks
+
+    def as_completed(self):
+        """
+        Poll the submitted tasks until none are pending.
+
+        Yields:
+            concurrent.futures.Future: The Future of each task as it finishes or fails to.
+        """
+        delay = ASGARD_TASK_POLL_INITIAL
+        while True:
+            finished, running_tasks = self._poll()
+            for future in finished:
+                yield future
+            with self._lock:
+                if not self._pending:
+                    return
+                next_deadline = min(deadline for __, __, deadline in self._pending.values())
+            time.sleep(max(0, min(delay, next_deadline - time.time())))
+            delay = _next_poll_delay(delay, running_tasks, self.use_task_log)
+
+    def wait(self):
+        """
+        Poll the submitted tasks until none are pending, resolving each task's Future and running its callback.
+        """
+        for __ in self.as_completed():
+            pass
+
+
+def wait_for_tasks_completion(task_urls, timeout, label=None, use_task_log=True):
+    """
+    Wait for many Asgard tasks from a single polling loop.
+
     Arguments:
-        task_url(str): The URL from which to retrieve task status.
-        timeout(int): How many seconds to wait for task completion
+        task_urls(list(str)): The URLs from which to retrieve task status.
+        timeout(int): How many seconds to wait for all the tasks to complete
                       before throwing an error.
+        label(str): The kind of task, used to record task latency.
+        use_task_log(bool): If True, poll at the slowest rate while every task reports it is waiting on instances.
 
     Returns:
-        dict: Parsed json of the task completion or failure status.
+        dict: Parsed json of the task completion or failure status, keyed by task URL.
 
     Raises:
-        TimeoutException: When we timeout waiting for the task to finish.
+        TimeoutException: When we timeout waiting for the tasks to finish.
     """
+    watcher = TaskWatcher(timeout, label, use_task_log)
+    futures = OrderedDict((task_url, watcher.submit(task_url)) for task_url in task_urls)
+
+    timed_out = []
+    for future in watcher.as_completed():
+        error = future.exception()
+        if isinstance(error, TimeoutException):
+            timed_out.append(future)
+        elif error is not None:
+            raise error
+
+    if len(timed_out) > 1:
+        unfinished_urls = [
+            task_url if task_url.endswith('.json') else task_url + ".json"
+            for task_url, future in six.iteritems(futures) if future in timed_out
+        ]
+        raise TimeoutException("Timed out while waiting for tasks {}".format(unfinished_urls))
+    elif timed_out:
+        raise timed_out[0].exception()
+    return {task_url: future.result() for task_url, future in six.iteritems(futures)}
 
-    if not task_url.endswith('.json'):
-        task_url += ".json"
 
-    LOG.debug("Task URL: {}".format(task_url))
-    end_time = datetime.utcnow() + timedelta(seconds=timeout)
-    while end_time > datetime.utcnow():
-        response = requests.get(task_url, params=ASGARD_API_TOKEN, timeout=REQUESTS_TIMEOUT)
-        json_response = _parse_json(task_url, response)
-        if json_response['status'] in ('completed', 'failed'):
-            return json_response
+def wait_for_task_completion(task_url, timeout, label=None):
+    """
+    Arguments:
+        task_url(str): The URL from which to retrieve task status.
+        timeout(int): How many seconds to wait for task completion
+                      before throwing an error.
+        label(str): The kind of task, used to record task latency.
 
-        time.sleep(WAIT_SLEEP_TIME)
+    Returns:
+        dict: Parsed json of the task completion or failure status.
 
-    raise TimeoutException("Timed out while waiting for task {}".format(task_url))
+    Raises:
+        TimeoutException: When we timeout waiting for the task to finish.
+    """
+    return wait_for_tasks_completion([task_url], timeout, label)[task_url]
 
 
 def new_asg(cluster, ami_id):
@@ -197,10 +752,7 @@ def new_asg(cluster, ami_id):
         "imageId": ami_id,
     }
 
-    response = requests.post(
-        NEW_ASG_URL,
-        data=payload, params=ASGARD_API_TOKEN, timeout=REQUESTS_TIMEOUT
-    )
+    response = get_client().post(NEW_ASG_URL, data=payload)
     LOG.debug("Sent request to create new ASG in Cluster({}).".format(cluster))
 
     if response.status_code == 404:
@@ -213,7 +765,10 @@ def new_asg(cluster, ami_id):
         msg = "Error occured attempting to create new ASG for cluster {}.\nResponse: {}"
         raise BackendError(msg.format(cluster, response.text))
 
-    response = wait_for_task_completion(response.url, ASGARD_NEW_ASG_CREATION_TIMEOUT)
+    try:
+        response = wait_for_task_completion(response.url, ASGARD_NEW_ASG_CREATION_TIMEOUT, "creating")
+    finally:
+        _INFO_CACHE.invalidate(CLUSTER_INFO_URL.format(cluster), CLUSTER_LIST_URL)
     if response['status'] == 'failed':
         msg = "Failure during new ASG creation. Task Log: \n{}".format(response['log'])
         raise BackendError(msg)
@@ -232,7 +787,7 @@ def new_asg(cluster, ami_id):
     return newest_asg['autoScalingGroupName']
 
 
-@retry()
+@retry(wait=RETRY_WAIT, giveup=giveup_on(*NON_RETRYABLE_EXCEPTIONS))
 def _get_asgard_resource_info(url):
     """
     A generic function for querying Asgard for inforamtion about a specific resource,
@@ -240,7 +795,7 @@ def _get_asgard_resource_info(url):
     """
 
     LOG.debug("URL: {}".format(url))
-    response = requests.get(url, params=ASGARD_API_TOKEN, timeout=REQUESTS_TIMEOUT)
+    response = get_client().get(url)
 
     if response.status_code == 404:
         raise ResourceDoesNotExistException('Resource for url {} does not exist'.format(url))
@@ -271,7 +826,7 @@ def get_asg_info(asg):
     """
     url = ASG_INFO_URL.format(asg)
     try:
-        info = _get_asgard_resource_info(url)
+        info = _INFO_CACHE.get(url, _get_asgard_resource_info)
     except ResourceDoesNotExistException:
         raise ASGDoesNotExistException('Autoscale group {} does not exist'.format(asg))
 
@@ -295,7 +850,7 @@ def get_cluster_info(cluster):
     """
     url = CLUSTER_INFO_URL.format(cluster)
     try:
-        info = _get_asgard_resource_info(url)
+        info = _INFO_CACHE.get(url, _get_asgard_resource_info)
     except ResourceDoesNotExistException:
         raise ClusterDoesNotExistException('Cluster {} does not exist'.format(cluster))
 
@@ -369,7 +924,33 @@ def is_last_asg(asg):
     return False
 
 
-@retry()
+def _run_asg_task(url, asg, timeout, action):
+    """
+    Start an Asgard task which changes an ASG and wait for it to finish.
+
+    Any cached information about the ASG is dropped once the task has finished.
+
+    Arguments:
+        url(str): The Asgard URL which starts the task.
+        asg(str): The name of the ASG.
+        timeout(int): How many seconds to wait for the task to finish.
+        action(str): Description of the task used in error messages, e.g. "enabling".
+
+    Raises:
+        TimeoutException: If the task does not finish in time.
+        BackendError: If the task failed.
+    """
+    try:
+        response = get_client().post(url, data={"name": asg})
+        task_status = wait_for_task_completion(response.url, timeout, action)
+    finally:
+        _INFO_CACHE.invalidate_asg(asg)
+    if task_status['status'] == 'failed':
+        msg = "Failure while {} ASG. Task Log: \n{}".format(action, task_status['log'])
+        raise BackendError(msg)
+
+
+@retry(wait=RETRY_WAIT, giveup=giveup_on(*NON_RETRYABLE_EXCEPTIONS))
 def enable_asg(asg):
     """
     Enable an ASG in asgard.  This means it will have ELBs routing to it
@@ -384,19 +965,11 @@ def enable_asg(asg):
     Raises:
         TimeoutException: If the task to enable the ASG fails.
     """
-    payload = {"name": asg}
-    response = requests.post(
-        ASG_ACTIVATE_URL,
-        data=payload, params=ASGARD_API_TOKEN, timeout=REQUESTS_TIMEOUT
-    )
-    task_url = response.url
-    task_status = wait_for_task_completion(task_url, 301)
-    if task_status['status'] == 'failed':
-        msg = "Failure while enabling ASG. Task Log: \n{}".format(task_status['log'])
-        raise BackendError(msg)
+    _run_asg_task(ASG_ACTIVATE_URL, asg, 301, "enabling")
 
 
-@retry()
+@retry(wait=RETRY_WAIT, giveup=giveup_on(*NON_RETRYABLE_EXCEPTIONS))
+@_within_info_cache
 def disable_asg(asg):
     """
     Disable an ASG using asgard.
@@ -426,26 +999,20 @@ def disable_asg(asg):
         msg = "Not disabling ASG {}, it is the last ASG in this cluster."
         raise CannotDisableActiveASG(msg)
 
-    payload = {"name": asg}
-    response = requests.post(
-        ASG_DEACTIVATE_URL,
-        data=payload, params=ASGARD_API_TOKEN, timeout=REQUESTS_TIMEOUT
-    )
-    task_url = response.url
-    task_status = wait_for_task_completion(task_url, 300)
-    if task_status['status'] == 'failed':
-        msg = "Failure while disabling ASG. Task Log: \n{}".format(task_status['log'])
-        raise BackendError(msg)
+    _run_asg_task(ASG_DEACTIVATE_URL, asg, 300, "disabling")
 
 
-@retry()
-def delete_asg(asg, fail_if_active=True, fail_if_last=True):
+@retry(wait=RETRY_WAIT, giveup=giveup_on(*NON_RETRYABLE_EXCEPTIONS))
+@_within_info_cache
+def delete_asg(asg, fail_if_active=True, fail_if_last=True, check_pending_delete=True):
     """
     Delete an ASG using asgard.
     curl -d "name=helloworld-example-v004" http://asgardprod/us-east-1/cluster/delete
 
     Arguments:
         asg(str): The name of the asg to delete.
+        check_pending_delete(bool): If False, the caller has already checked that the ASG
+            is not pending deletion, so it is not looked up again.
 
     Returns:
         None: When the asg has been deleted.
@@ -455,7 +1022,7 @@ def delete_asg(asg, fail_if_active=True, fail_if_last=True):
         BackendError: If asgard was unable to delete the ASG
         ASGDoesNotExistException: When an ASG does not exist
     """
-    if is_asg_pending_delete(asg):
+    if check_pending_delete and is_asg_pending_delete(asg):
         LOG.info("Not deleting ASG {} due to its already pending deletion.".format(asg))
         return
     if fail_if_active and is_asg_enabled(asg):
@@ -468,17 +1035,71 @@ def delete_asg(asg, fail_if_active=True, fail_if_last=True):
         LOG.warning(msg)
         raise CannotDeleteLastASG(msg)
 
-    payload = {"name": asg}
-    response = requests.post(ASG_DELETE_URL,
-                             data=payload, params=ASGARD_API_TOKEN, timeout=REQUESTS_TIMEOUT)
-    task_url = response.url
-    task_status = wait_for_task_completion(task_url, 300)
-    if task_status['status'] == 'failed':
-        msg = "Failure while deleting ASG. Task Log: \n{}".format(task_status['log'])
-        raise BackendError(msg)
+    try:
+        _run_asg_task(ASG_DELETE_URL, asg, 300, "deleting")
+    finally:
+        # A deleted ASG drops out of the cluster list.
+        _INFO_CACHE.invalidate(CLUSTER_LIST_URL)
 
 
-@retry()
+def delete_asgs(asgs, max_workers=1, time_budget=None, on_result=None):
+    """
+    Delete many ASGs, several at a time, within an optional time budget.
+
+    ASGs are started in the order given. Once the time budget has been used up no more deletes are
+    started, although deletes already in progress are waited on.
+
+    Arguments:
+        asgs(list(str)): The names of the ASGs to delete.
+        max_workers(int): Maximum number of ASGs to delete at the same time.
+        time_budget(float): Seconds after which no more deletes are started. None means no limit.
+        on_result(function): Called with the outcome ('deleted', 'skipped' or 'failed') and the
+            summary entry of each ASG as soon as that ASG has been dealt with. An ASG for which
+            it raises is summarised as failed.
+
+    Returns:
+        dict: Summary of the run, with the keys:
+            'deleted' - Names of the ASGs which were deleted.
+            'skipped' - Dicts with the 'asg' name and the 'reason' it was not deleted.
+            'failed' - Dicts with the 'asg' name and the 'error' met while deleting it.
+    """
+    deadline = None if time_budget is None else time.time() + time_budget
+
+    def _delete(asg):
+        """
+        Delete a single ASG, returning the outcome and summary entry for it.
+        """
+        if deadline is not None and time.time() >= deadline:
+            outcome, entry = 'skipped', {'asg': asg, 'reason': "Time budget used up."}
+        else:
+            try:
+                with _INFO_CACHE.scope():
+                    if is_asg_pending_delete(asg):
+                        outcome, entry = 'skipped', {'asg': asg, 'reason': "Already pending deletion."}
+                    else:
+                        delete_asg(asg, check_pending_delete=False)
+                        outcome, entry = 'deleted', asg
+            except Exception as err:  # pylint: disable=broad-except
+                LOG.warning("Unable to delete ASG {}: {}".format(asg, err))
+                outcome, entry = 'failed', {'asg': asg, 'error': "{}".format(err)}
+        if on_result:
+            on_result(outcome, entry)
+        return outcome, entry
+
+    summary = {'deleted': [], 'skipped': [], 'failed': []}
+    for asg, result, error in run_concurrently(_delete, asgs, max_workers):
+        if error is not None:
+            LOG.warning("Unable to finish dealing with ASG {}: {}".format(asg, error))
+            result = 'failed', {'asg': asg, 'error': "{}".format(error)}
+        outcome, entry = result
+        summary[outcome].append(entry)
+    LOG.info("Deleted {} ASG(s), skipped {} and failed to delete {}.".format(
+        len(summary['deleted']), len(summary['skipped']), len(summary['failed'])
+    ))
+    return summary
+
+
+@retry(wait=RETRY_WAIT, giveup=giveup_on(*NON_RETRYABLE_EXCEPTIONS))
 def elbs_for_asg(asg):
     """
     Return the ELB(s) which are directing traffic to a particular ASG.
@@ -493,7 +1114,7 @@ def elbs_for_asg(asg):
         BackendError: If unexpected response from Asgard.
     """
     url = ASG_INFO_URL.format(asg)
-    response = requests.get(url, params=ASGARD_API_TOKEN, timeout=REQUESTS_TIMEOUT)
+    response = get_client().get(url)
     resp_json = _parse_json(url, response)
     try:
         elbs = resp_json['group']['loadBalancerNames']
@@ -504,6 +1125,7 @@ def elbs_for_asg(asg):
     return elbs
 
 
+@_within_info_cache
 def rollback(current_clustered_asgs, rollback_to_clustered_asgs, ami_id=None):
     """
     Rollback to a particular list of ASGs for one or more clusters.
@@ -528,13 +1150,11 @@ def rollback(current_clustered_asgs, rollback_to_clustered_asgs, ami_id=None):
     # First, ensure that the ASGs to which we'll rollback are not tagged for deletion.
     # Also, ensure that those same ASGs are not in the process of deletion.
     rollback_ready = True
-    asgs_tagged_for_deletion = [asg.name for asg in ec2.get_asgs_pending_delete()]
+    # Only the deletion tags are read, rather than loading the ASG inventory of the whole account.
+    asgs_tagged_for_deletion = set(ec2.PendingDeleteIndex.load().due())
     for asgs in rollback_to_clustered_asgs.values():
         for asg in asgs:
             try:
-                if asg in asgs_tagged_for_deletion:
-                    # ASG is tagged for deletion. Remove the deletion tag.
-                    ec2.remove_asg_deletion_tag(asg)
                 if is_asg_pending_delete(asg):
                     # Too late for rollback - this ASG is already pending delete.
                     LOG.info("Rollback ASG '{}' is pending delete. Aborting rollback to ASGs.".format(asg))
@@ -546,12 +1166,17 @@ def rollback(current_clustered_asgs, rollback_to_clustered_asgs, ami_id=None):
                 break
 
     if rollback_ready:
+        # The ASGs tagged for deletion have their deletion tags removed together.
+        ec2.remove_asg_deletion_tags([
+            asg for asgs in rollback_to_clustered_asgs.values() for asg in asgs if asg in asgs_tagged_for_deletion
+        ])
         # Perform the rollback.
         success, enabled_asgs, disabled_asgs = _red_black_deploy(rollback_to_clustered_asgs, current_clustered_asgs)
         if not success:
             LOG.info("Rollback failed for cluster(s) {}.".format(current_clustered_asgs.keys()))
         else:
             LOG.info("Woot! Rollback Done!")
+            _log_connection_stats()
             return {'ami_id': ami_id, 'current_asgs': enabled_asgs, 'disabled_asgs': disabled_asgs}
 
     # Rollback failed -or- wasn't attempted. Attempt a deploy.
@@ -563,12 +1188,14 @@ def rollback(current_clustered_asgs, rollback_to_clustered_asgs, ami_id=None):
         return {'ami_id': None, 'current_asgs': current_clustered_asgs, 'disabled_asgs': rollback_to_clustered_asgs}
 
 
-def deploy(ami_id):
+@_within_info_cache
+def deploy(ami_id, new_asg_concurrency=ASGARD_NEW_ASG_CONCURRENCY):
     """
     Deploys an AMI as an auto-scaling group (ASG) to AWS.
 
     Arguments:
         ami_id(str): AWS AMI ID
+        new_asg_concurrency(int): Maximum number of clusters in which to create new ASGs at the same time.
 
     Returns:
         dict(str, str, dict): Returns a dictionary with the keys:
@@ -593,17 +1220,28 @@ def deploy(ami_id):
     existing_clustered_asgs = clusters_for_asgs(existing_edp_asgs)
     LOG.info("Deploying to cluster(s) {}".format(existing_clustered_asgs.keys()))
 
-    # Create a new ASG in each cluster.
+    # Create a new ASG in each cluster, creating up to new_asg_concurrency of them at once.
+    # Once a creation fails, creations which have not started yet are skipped.
+    creation_results = run_concurrently(
+        lambda cluster: new_asg(cluster, ami_id),
+        existing_clustered_asgs,
+        new_asg_concurrency,
+        cancel_on_error=True
+    )
     new_clustered_asgs = defaultdict(list)
-    for cluster in existing_clustered_asgs:
-        try:
-            newest_asg = new_asg(cluster, ami_id)
+    failed_clusters = []
+    for cluster, newest_asg, error in creation_results:
+        if error is None:
             new_clustered_asgs[cluster].append(newest_asg)
-        except:
-            msg = "ASG creation failed for cluster '{}' but succeeded for cluster(s) {}."
-            msg = msg.format(cluster, new_clustered_asgs.keys())
-            LOG.exception(msg)
-            raise
+        else:
+            failed_clusters.append((cluster, error))
+
+    for cluster, error in failed_clusters:
+        msg = "ASG creation failed for cluster '{}' but succeeded for cluster(s) {}."
+        msg = msg.format(cluster, new_clustered_asgs.keys())
+        LOG.error(msg, exc_info=error)
+    if failed_clusters:
+        raise failed_clusters[0][1]
 
     new_asgs = [asgs[0] for asgs in new_clustered_asgs.values()]
     LOG.info("New ASGs created: {}".format(new_asgs))
@@ -617,12 +1255,58 @@ def deploy(ami_id):
                            "enabled_asgs: {} - disabled_asgs: {}".format(enabled_asgs, disabled_asgs))
 
     LOG.info("Woot! Deploy Done!")
+    _log_connection_stats()
     return {'ami_id': ami_id, 'current_asgs': enabled_asgs, 'disabled_asgs': disabled_asgs}
 
 
+def deploy_many(ami_ids, deploy_concurrency=ASGARD_DEPLOY_CONCURRENCY):
+    """
+    Deploys several AMIs, each to its own environment/deployment/play (EDP), at the same time.
+
+    Every deploy shares the pooled Asgard session and the Asgard information cache.
+
+    Arguments:
+        ami_ids(list(str)): AWS AMI IDs, each of which must be for a different EDP.
+        deploy_concurrency(int): Maximum number of AMIs to deploy at the same time.
+
+    Returns:
+        dict: The result of deploy() for each AMI, keyed by AMI ID.
+
+    Raises:
+        BackendError: When more than one AMI is for the same EDP.
+        Any error raised by deploy(), once every started deploy has finished.
+    """
+    ami_ids = list(ami_ids)
+    amis_by_edp = defaultdict(list)
+    for ami_id in ami_ids:
+        amis_by_edp[ec2.edp_for_ami(ami_id)].append(ami_id)
+    conflicts = [amis for amis in amis_by_edp.values() if len(amis) > 1]
+    if conflicts:
+        raise BackendError("Cannot deploy more than one AMI to the same EDP at once: {}".format(conflicts))
+
+    LOG.info("Deploying {} AMI(s), up to {} at once.".format(len(ami_ids), deploy_concurrency))
+    deploy_results = run_concurrently(deploy, ami_ids, deploy_concurrency)
+
+    deployed = {}
+    failed_amis = []
+    for ami_id, deploy_info, error in deploy_results:
+        if error is None:
+            deployed[ami_id] = deploy_info
+        else:
+            failed_amis.append((ami_id, error))
+
+    for ami_id, error in failed_amis:
+        msg = "Deploy failed for AMI '{}' but succeeded for AMI(s) {}."
+        LOG.error(msg.format(ami_id, list(deployed.keys())), exc_info=error)
+    if failed_amis:
+        raise failed_amis[0][1]
+    return deployed
+
+
 def _red_black_deploy(
         new_cluster_asgs, baseline_cluster_asgs,
-        secs_before_old_asgs_disabled=DISABLE_OLD_ASG_WAIT_TIME
+        secs_before_old_asgs_disabled=DISABLE_OLD_ASG_WAIT_TIME,
+        cutover_concurrency=ASGARD_CUTOVER_CONCURRENCY
 ):
     """
     Takes two dicts of autoscale groups, new and baseline.
@@ -644,9 +1328,13 @@ def _red_black_deploy(
         - ensure the new ASGs are not pending delete or disabled
         - tag and disable current asgs
 
+    The new ASGs are all enabled at the same time, as are the baseline ASGs all disabled,
+    with up to cutover_concurrency Asgard tasks in flight at once.
+
     Args:
         new_asgs (dict): List of new ASGs to be added to the ELB, keyed by cluster.
         baseline_asgs (dict): List of existing ASGs already added to the ELB, keyed by cluster.
+        cutover_concurrency (int): Maximum number of ASGs to enable or disable at the same time.
 
     Returns:
         success (bool): True if red/black operation succeeded, else False.
@@ -656,20 +1344,6 @@ def _red_black_deploy(
     asgs_enabled = copy.deepcopy(baseline_cluster_asgs)
     asgs_disabled = copy.deepcopy(new_cluster_asgs)
 
-    def _enable_cluster_asg(cluster, asg):
-        """
-        Shifts ASG from disabled to enabled.
-        """
-        enable_asg(asg)
-        _move_asg_from_disabled_to_enabled(cluster, asg)
-
-    def _disable_cluster_asg(cluster, asg):
-        """
-        Shifts ASG from enabled to disabled.
-        """
-        disable_asg(asg)
-        _move_asg_from_enabled_to_disabled(cluster, asg)
-
     def _move_asg_from_disabled_to_enabled(cluster, asg):
         """
         Shifts ASG from disabled to enabled.
@@ -684,35 +1358,80 @@ def _red_black_deploy(
         asgs_enabled[cluster].remove(asg)
         asgs_disabled[cluster].append(asg)
 
-    def _disable_clustered_asgs(clustered_asgs, failure_msg):
+    def _flatten(clustered_asgs):
         """
-        Disable all the ASGs in the lists, keyed by cluster.
+        Turn lists of ASGs keyed by cluster into a list of (cluster, asg) tuples.
+        """
+        return [(cluster, asg) for cluster, asgs in six.iteritems(clustered_asgs) for asg in asgs]
+
+    def _enable_new_asg(cluster_asg):
+        """
+        Enables a new ASG and returns the ELBs which direct traffic to it.
         """
-        for cluster, asgs in six.iteritems(clustered_asgs):
-            for asg in asgs:
+        __, asg = cluster_asg
+        enable_asg(asg)
+        return elbs_for_asg(asg)
+
+    def _disable_baseline_asg(cluster_asg):
+        """
+        Disables a baseline ASG, returning whether it ended up disabled.
+        """
+        cluster, asg = cluster_asg
+        disabled = None
+        try:
+            if is_asg_enabled(asg):
                 try:
-                    _disable_cluster_asg(cluster, asg)
+                    disable_asg(asg)
+                    disabled = True
                 except:  # pylint: disable=bare-except
-                    LOG.warning(failure_msg, asg, exc_info=True)
+                    LOG.warning("Unable to disable ASG '%s' after enabling new ASGs.", asg, exc_info=True)
+                    disabled = False
+        except ASGDoesNotExistException:
+            # This operation should not fail if one of the baseline ASGs was removed during the deployment process
+            LOG.info("ASG {asg} in cluster {cluster} no longer exists, removing it from the enabled cluster list"
+                     .format(asg=asg, cluster=cluster))
+            disabled = True
+        return disabled
+
+    def _disable_clustered_asgs(clustered_asgs, failure_msg):
+        """
+        Disable all the ASGs in the lists, keyed by cluster.
+        """
+        results = run_concurrently(lambda cluster_asg: disable_asg(cluster_asg[1]),
+                                   _flatten(clustered_asgs), cutover_concurrency)
+        for (cluster, asg), __, error in results:
+            if error is None:
+                _move_asg_from_enabled_to_disabled(cluster, asg)
+            else:
+                LOG.warning(failure_msg, asg, exc_info=error)
 
     elbs_to_monitor = []
     newly_enabled_asgs = defaultdict(list)
-    for cluster, asgs in six.iteritems(new_cluster_asgs):
-        for asg in asgs:
-            try:
-                _enable_cluster_asg(cluster, asg)
-                elbs_to_monitor.extend(elbs_for_asg(asg))
-                newly_enabled_asgs[cluster].append(asg)
-            except:  # pylint: disable=bare-except
-                LOG.error("Error enabling ASG '%s'. Disabling traffic to all new ASGs.", asg, exc_info=True)
-                # Disable the ASG which failed first.
-                _disable_cluster_asg(cluster, asg)
-                # Then disable any new other ASGs that have been newly enabled.
-                _disable_clustered_asgs(
-                    newly_enabled_asgs,
-                    "Unable to disable ASG '%s' after failure."
-                )
-                return (False, asgs_enabled, asgs_disabled)
+    failed_asgs = defaultdict(list)
+    for (cluster, asg), elbs, error in run_concurrently(
+            _enable_new_asg, _flatten(new_cluster_asgs), cutover_concurrency
+    ):
+        if error is None:
+            _move_asg_from_disabled_to_enabled(cluster, asg)
+            elbs_to_monitor.extend(elbs)
+            newly_enabled_asgs[cluster].append(asg)
+        else:
+            LOG.error("Error enabling ASG '%s'. Disabling traffic to all new ASGs.", asg, exc_info=error)
+            failed_asgs[cluster].append(asg)
+
+    if failed_asgs:
+        # Disable the ASGs which failed to be enabled, as they may have partially enabled.
+        results = run_concurrently(lambda cluster_asg: disable_asg(cluster_asg[1]),
+                                   _flatten(failed_asgs), cutover_concurrency)
+        for cluster_asg, __, error in results:
+            if error is not None:
+                LOG.warning("Unable to disable ASG '%s' after it failed to enable.", cluster_asg[1], exc_info=error)
+        # Then disable any new other ASGs that have been newly enabled.
+        _disable_clustered_asgs(
+            newly_enabled_asgs,
+            "Unable to disable ASG '%s' after failure."
+        )
+        return (False, asgs_enabled, asgs_disabled)
 
     LOG.info("New ASGs {} are active and will be available after passing the healthchecks.".format(
         dict(newly_enabled_asgs)
@@ -748,28 +1467,24 @@ def _red_black_deploy(
 
     LOG.info("New ASGs have passed the healthchecks. Now disabling old ASGs.")
 
-    for cluster, asgs in six.iteritems(baseline_cluster_asgs):
-        for asg in asgs:
-            try:
-                if is_asg_enabled(asg):
-                    try:
-                        _disable_cluster_asg(cluster, asg)
-                    except:  # pylint: disable=bare-except
-                        LOG.warning("Unable to disable ASG '%s' after enabling new ASGs.", asg, exc_info=True)
-                elif asg in asgs_enabled[cluster]:
-                    # If the asg is not enabled, but we have it in the enabled list remove it. This may occur by
-                    # pulling from 2 different sources of truth at different intervals. The asg could have been disabled
-                    # in the intervening time.
-                    _move_asg_from_enabled_to_disabled(cluster, asg)
-            except ASGDoesNotExistException:
-                # This operation should not fail if one of the baseline ASGs was removed during the deployment process
-                LOG.info("ASG {asg} in cluster {cluster} no longer exists, removing it from the enabled cluster list"
-                         .format(asg=asg, cluster=cluster))
-                _move_asg_from_enabled_to_disabled(cluster, asg)
-
-            try:
-                ec2.tag_asg_for_deletion(asg)
-            except ASGDoesNotExistException:
-                LOG.info("Unable to tag ASG '{}' as it no longer exists, skipping.".format(asg))
+    errors = []
+    asgs_to_tag = []
+    for (cluster, asg), disabled, error in run_concurrently(
+            _disable_baseline_asg, _flatten(baseline_cluster_asgs), cutover_concurrency
+    ):
+        if error is not None:
+            errors.append(error)
+            continue
+        asgs_to_tag.append(asg)
+        if disabled or (disabled is None and asg in asgs_enabled[cluster]):
+            # If the asg is not enabled, but we have it in the enabled list remove it. This may occur by
+            # pulling from 2 different sources of truth at different intervals. The asg could have been disabled
+            # in the intervening time.
+            _move_asg_from_enabled_to_disabled(cluster, asg)
+    # If the old ASGs could not be checked, none are tagged for deletion.
+    if errors:
+        raise errors[0]
+    # The old ASGs are tagged for deletion together. Those which no longer exist are skipped.
+    ec2.tag_asgs_for_deletion(asgs_to_tag)
 
     return (True, asgs_enabled, asgs_disabled)
@@ -8,8 +8,8 @@ import io
 import logging
 import requests
 from requests.auth import HTTPBasicAuth
-from tubular.utils.retry import retry
-from tubular.exception import BackendError
+from tubular.utils.retry import retry, giveup_on, exponential, DELAY_SECONDS
+from tubular.exception import BackendError, UnknownEnvironmentException
 
 
 ACQUIA_ENDPOINT = "https://cloudapi.acquia.com/v1"
@@ -31,6 +31,10 @@ BACKUP_DATABASE_URL = "{root}/sites/{realm}:{site}/envs/{{env}}/dbs/{database}/b
 CHECK_TASKS_URL = "{root}/sites/{realm}:{site}/tasks/{{id}}.json".format(
     root=ACQUIA_ENDPOINT, realm=REALM, site=SITE
 )
+# An unknown environment is not worth retrying.
+NON_RETRYABLE_EXCEPTIONS = (UnknownEnvironmentException,)
+# Waits between attempts start at a second and double up to RETRY_DELAY_SECONDS.
+RETRY_WAIT = exponential(base_seconds=1, max_seconds=float(DELAY_SECONDS))
 # Maps environments to domains.
 VALID_ENVIRONMENTS = {
     "test": [
@@ -90,7 +94,26 @@ def parse_response(response, error_message):
     return response.json()
 
 
-@retry()
+def domains_for_environment(env):
+    """
+    Looks up the domains of an environment.
+
+    Args:
+        env (str): The environment (e.g. test or prod)
+
+    Returns:
+        list(str): The domains of the environment.
+
+    Raises:
+        UnknownEnvironmentException: A KeyError raised if env value is invalid.
+    """
+    try:
+        return VALID_ENVIRONMENTS[env]
+    except KeyError:
+        raise UnknownEnvironmentException(env)
+
+
+@retry(wait=RETRY_WAIT, giveup=giveup_on(*NON_RETRYABLE_EXCEPTIONS))
 def fetch_deployed_tag(env, username, password, path_name):
     """
     Fetches the currently deployed tag in the given environment
@@ -107,7 +130,7 @@ def fetch_deployed_tag(env, username, password, path_name):
     Raises:
         KeyError: Raised if env value is invalid.
     """
-    __ = VALID_ENVIRONMENTS[env]
+    __ = domains_for_environment(env)
     api_client = get_api_client(username, password)
     response = api_client.get(FETCH_TAG_URL.format(env=env))
     response_json = parse_response(response, "Failed to fetch the deployed tag.")
@@ -117,7 +140,7 @@ def fetch_deployed_tag(env, username, password, path_name):
     return tag_name
 
 
-@retry()
+@retry(wait=RETRY_WAIT, giveup=giveup_on(*NON_RETRYABLE_EXCEPTIONS))
 def clear_varnish_cache(env, username, password):
     """
     Clears the Varnish cache from all domains in a Drupal environment.
@@ -135,7 +158,7 @@ def clear_varnish_cache(env, username, password):
         BackendError: Raised if the varnish cache fails to clear in any of the domains.
     """
     api_client = get_api_client(username, password)
-    domains = VALID_ENVIRONMENTS[env]
+    domains = domains_for_environment(env)
     failure = ""
     for domain in domains:
         response = api_client.delete(CLEAR_CACHE_URL.format(env=env, domain=domain))
@@ -151,7 +174,7 @@ def clear_varnish_cache(env, username, password):
     return True
 
 
-@retry()
+@retry(wait=RETRY_WAIT, giveup=giveup_on(*NON_RETRYABLE_EXCEPTIONS))
 def deploy(env, username, password, tag):
     """
     Deploys a given tag to the specified environment.
@@ -168,14 +191,14 @@ def deploy(env, username, password, tag):
     Raises:
         KeyError: Raised if env value is invalid.
     """
-    __ = VALID_ENVIRONMENTS[env]
+    __ = domains_for_environment(env)
     api_client = get_api_client(username, password)
     response = api_client.post(DEPLOY_URL.format(env=env, tag=tag))
     response_json = parse_response(response, "Failed to deploy code.")
     return check_state(response_json["id"], username, password)
 
 
-@retry()
+@retry(wait=RETRY_WAIT, giveup=giveup_on(*NON_RETRYABLE_EXCEPTIONS))
 def backup_database(env, username, password):
     """
     Creates a backup of the database in the specified environment.
@@ -191,7 +214,7 @@ def backup_database(env, username, password):
     Raises:
         KeyError: Raised if env value is invalid.
     """
-    __ = VALID_ENVIRONMENTS[env]
+    __ = domains_for_environment(env)
     api_client = get_api_client(username, password)
     response = api_client.post(BACKUP_DATABASE_URL.format(env=env))
     response_json = parse_response(response, "Failed to backup database.")
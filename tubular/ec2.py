@@ -6,14 +6,29 @@ from __future__ import absolute_import
 from __future__ import unicode_literals
 
 import os
+import bisect
+import functools
+import json
 import logging
 import time
+import threading
+from collections import defaultdict, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 import backoff
 import boto
+import boto.ec2
+import boto.ec2.autoscale
+import boto.ec2.elb
+import boto.sqs
+import boto.utils
+import six
 from boto.exception import EC2ResponseError, BotoServerError
 from boto.ec2.autoscale.tag import Tag
+from boto.sqs.message import RawMessage
 from tubular.utils import EDP, WAIT_SLEEP_TIME
+from tubular.utils.concurrency import CallResult, run_concurrently
 from tubular.exception import (
     ImageNotFoundException,
     MultipleImagesFoundException,
@@ -25,21 +40,289 @@ LOG = logging.getLogger(__name__)
 
 ISO_DATE_FORMAT = "%Y-%m-%dT%H:%M:%S.%f"
 ASG_DELETE_TAG_KEY = 'delete_on_ts'
+# Most ASG names DescribeAutoScalingGroups accepts, and most tags CreateOrUpdateTags and DeleteTags accept, per request.
+ASG_NAMES_PER_REQUEST = 50
+ASG_TAGS_PER_REQUEST = 50
+# Instances asked for per DescribeInstances page, and instance ids sent per TerminateInstances request.
+INSTANCES_PER_PAGE = 1000
+INSTANCES_PER_TERMINATE_REQUEST = int(os.environ.get('INSTANCES_PER_TERMINATE_REQUEST', 100))
+# Instance states from which an instance can still be terminated.
+TERMINABLE_INSTANCE_STATES = ['pending', 'running', 'stopping', 'stopped']
 MAX_ATTEMPTS = os.environ.get('RETRY_MAX_ATTEMPTS', 5)
 RETRY_FACTOR = os.environ.get('RETRY_FACTOR', 1.5)
+# Maximum number of ELBs whose health is checked at the same time.
+ELB_HEALTH_CONCURRENCY = int(os.environ.get('ELB_HEALTH_CONCURRENCY', 8))
+# The error codes EC2 uses for AMI ids which do not exist or are not valid.
+MISSING_AMI_ERROR_CODES = ('InvalidAMIID.NotFound', 'InvalidAMIID.Malformed')
+# Maximum number of AMIs whose tags are kept in memory.
+AMI_TAG_CACHE_SIZE = int(os.environ.get('AMI_TAG_CACHE_SIZE', 512))
+# Name of an SQS queue receiving ASG lifecycle notifications. If unset, ASGs are polled until they are in service.
+ASG_LIFECYCLE_QUEUE = os.environ.get('ASG_LIFECYCLE_QUEUE', None)
+# Longest time in seconds to wait for a lifecycle notification before polling the ASGs anyway.
+ASG_LIFECYCLE_FALLBACK_POLL = int(os.environ.get('ASG_LIFECYCLE_FALLBACK_POLL', 15))
+# Age in seconds after which no deploy can still be waiting on a lifecycle notification.
+ASG_LIFECYCLE_MESSAGE_MAX_AGE = int(os.environ.get('ASG_LIFECYCLE_MESSAGE_MAX_AGE', 3600))
+# Calls per second made to each AWS service by all threads together, and how many can be made at once after a lull.
+AWS_RATE_LIMIT_AUTOSCALE = float(os.environ.get('AWS_RATE_LIMIT_AUTOSCALE', 5))
+AWS_RATE_LIMIT_ELB = float(os.environ.get('AWS_RATE_LIMIT_ELB', 10))
+AWS_RATE_LIMIT_EC2 = float(os.environ.get('AWS_RATE_LIMIT_EC2', 20))
+AWS_RATE_LIMIT_BURST = int(os.environ.get('AWS_RATE_LIMIT_BURST', 20))
+
+
+# The error codes AWS uses when it refuses a request because too many requests are being made.
+THROTTLING_ERROR_CODES = ('Throttling', 'RequestLimitExceeded')
+
+
+def _is_throttling_error(status, body):
+    """
+    Arguments:
+        status (int or str): The HTTP status of an AWS response.
+        body (str or bytes): The body of the response.
+
+    Returns:
+        bool: True if AWS refused the request because too many requests are being made.
+    """
+    if str(status) != "400" or not body:
+        return False
+    if isinstance(body, six.binary_type):
+        body = body.decode('utf-8', 'replace')
+    return any('<Code>{}</Code>'.format(code) in body for code in THROTTLING_ERROR_CODES)
 
 
 def giveup_if_not_throttling(ex):
     """
-    Checks that a BotoServerError exceptions message contains the throttling string.
+    Checks that a BotoServerError exceptions message contains a throttling error code.
 
     Args:
         ex (boto.exception.BotoServerError):
 
     Returns:
-        False if the throttling string is not found.
+        False if a throttling error code is found.
+    """
+    return not _is_throttling_error(ex.status, ex.body)
+
+
+def _is_throttled_response(response):
+    """
+    Arguments:
+        response (boto.connection.HTTPResponse): The response to a request made by a boto connection.
+
+    Returns:
+        bool: True if AWS refused the request because too many requests are being made.
+    """
+    status = getattr(response, 'status', None)
+    if status != 400:
+        return False
+    # boto caches the body, so reading it here leaves it for the caller.
+    return _is_throttling_error(status, response.read())
+
+
+class _TokenBucket(object):
+    """
+    Limits the rate of calls to an AWS service made by all threads together.
+
+    Each call takes a token, and tokens are added at the current rate up to the burst size. When AWS
+    throttles a call, the rate is halved, and it climbs back to the configured rate as calls succeed.
+    """
+
+    def __init__(self, rate, burst=AWS_RATE_LIMIT_BURST, min_rate=None):
+        """
+        Arguments:
+            rate (float): Calls per second when AWS is not throttling.
+            burst (int): Number of calls which can be made at once after a lull.
+            min_rate (float): Lowest rate in calls per second to slow down to. Defaults to a sixteenth of rate.
+        """
+        self.max_rate = float(rate)
+        self.min_rate = float(min_rate) if min_rate else self.max_rate / 16
+        self.rate = self.max_rate
+        self.burst = max(1, int(burst))
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated_at = time.time()
+        self._calls = 0
+        self._throttled_calls = 0
+        self._wait_seconds = 0.0
+        self._call_seconds = 0.0
+
+    def _reserve(self):
+        """
+        Take a token, borrowing it from the future if none are left.
+
+        Returns:
+            float: Seconds to wait before the token is available.
+        """
+        with self._lock:
+            now = time.time()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+    def _slow_down(self):
+        """
+        Halve the rate after a throttled call.
+        """
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._throttled_calls += 1
+        LOG.info("AWS is throttling calls, slowing down to {:.2f} calls per second.".format(self.rate))
+
+    def _speed_up(self):
+        """
+        Raise the rate a step towards the configured rate after a successful call.
+        """
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 16)
+
+    def call(self, func, *args, **kwargs):
+        """
+        Wait for a token, then make a request.
+
+        Arguments:
+            func (function): Makes the request and returns the boto.connection.HTTPResponse.
+
+        Returns:
+            The response returned by func.
+        """
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+        start = time.time()
+        try:
+            response = func(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._calls += 1
+                self._wait_seconds += delay
+                self._call_seconds += time.time() - start
+        if _is_throttled_response(response):
+            self._slow_down()
+        else:
+            self._speed_up()
+        return response
+
+    def stats(self):
+        """
+        Returns:
+            dict: The number of calls made and throttled, the seconds spent waiting for tokens
+                and in calls, and the current rate in calls per second.
+        """
+        with self._lock:
+            return {
+                'calls': self._calls,
+                'throttled_calls': self._throttled_calls,
+                'wait_seconds': self._wait_seconds,
+                'call_seconds': self._call_seconds,
+                'rate': self.rate,
+            }
+
+
+# Shared by every connection to each service, in every thread.
+_RATE_LIMITERS = {
+    'autoscale': _TokenBucket(AWS_RATE_LIMIT_AUTOSCALE),
+    'elb': _TokenBucket(AWS_RATE_LIMIT_ELB),
+    'ec2': _TokenBucket(AWS_RATE_LIMIT_EC2),
+}
+
+
+def aws_rate_limit_stats():
+    """
+    Returns:
+        dict: The stats of the rate limiter of each AWS service, keyed by service.
+    """
+    return {service: limiter.stats() for service, limiter in six.iteritems(_RATE_LIMITERS)}
+
+
+class _ConnectionRegistry(object):
+    """
+    Caches boto connections by service and region so that their HTTP connections are reused.
+
+    boto connections are not safe to share between threads, so each thread gets its own.
+    Requests made by the connections to rate limited services wait for that service's limiter.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    @staticmethod
+    def _connect(service, region):
+        """
+        Make a new connection to a service, in the default region if region is None.
+        """
+        if service == 'autoscale':
+            return boto.connect_autoscale() if region is None else boto.ec2.autoscale.connect_to_region(region)
+        elif service == 'elb':
+            return boto.connect_elb() if region is None else boto.ec2.elb.connect_to_region(region)
+        elif service == 'ec2':
+            return boto.connect_ec2() if region is None else boto.ec2.connect_to_region(region)
+        elif service == 'sqs':
+            return boto.connect_sqs() if region is None else boto.sqs.connect_to_region(region)
+        raise ValueError("Unknown AWS service: {}".format(service))
+
+    def get(self, service, region=None):
+        """
+        Arguments:
+            service (str): One of 'autoscale', 'elb', 'ec2' or 'sqs'.
+            region (str): The AWS region to connect to. None means the default region.
+
+        Returns:
+            A boto connection to the service in the region, made by the calling thread.
+        """
+        connections = self._local.__dict__.setdefault('connections', {})
+        if (service, region) not in connections:
+            connection = self._connect(service, region)
+            if service in _RATE_LIMITERS:
+                connection.make_request = functools.partial(_RATE_LIMITERS[service].call, connection.make_request)
+            connections[(service, region)] = connection
+        return connections[(service, region)]
+
+    def reset(self):
+        """
+        Forget every cached connection, so that new ones are made when next needed.
+        """
+        self._local = threading.local()
+
+
+_CONNECTIONS = _ConnectionRegistry()
+
+
+def autoscale_connection(region=None):
+    """
+    Returns:
+        boto.ec2.autoscale.AutoScaleConnection: A cached connection to Auto Scaling in region.
+    """
+    return _CONNECTIONS.get('autoscale', region)
+
+
+def elb_connection(region=None):
+    """
+    Returns:
+        boto.ec2.elb.ELBConnection: A cached connection to Elastic Load Balancing in region.
+    """
+    return _CONNECTIONS.get('elb', region)
+
+
+def ec2_connection(region=None):
+    """
+    Returns:
+        boto.ec2.connection.EC2Connection: A cached connection to EC2 in region.
+    """
+    return _CONNECTIONS.get('ec2', region)
+
+
+def sqs_connection(region=None):
+    """
+    Returns:
+        boto.sqs.connection.SQSConnection: A cached connection to SQS in region.
+    """
+    return _CONNECTIONS.get('sqs', region)
+
+
+def reset_connections():
+    """
+    Forget every cached boto connection.
     """
-    return not (str(ex.status) == "400" and ex.body and '<Code>Throttling</Code>' in ex.body)
+    _CONNECTIONS.reset()
 
 
 @backoff.on_exception(backoff.expo,
@@ -56,7 +339,7 @@ def get_all_autoscale_groups(names=None):
     Returns:
         List of :class:`boto.ec2.autoscale.group.AutoScalingGroup` instances.
     """
-    autoscale_conn = boto.connect_autoscale()
+    autoscale_conn = autoscale_connection()
     fetched_asgs = autoscale_conn.get_all_groups(names=names)
     total_asgs = []
     while True:
@@ -83,7 +366,7 @@ def get_all_load_balancers(names=None):
     Returns:
         a list of :class:`boto.ec2.elb.loadbalancer.LoadBalancer`
     """
-    elb_conn = boto.connect_elb()
+    elb_conn = elb_connection()
     fetched_elbs = elb_conn.get_all_load_balancers(names)
     total_elbs = []
     while True:
@@ -95,23 +378,72 @@ def get_all_load_balancers(names=None):
     return total_elbs
 
 
-def _instance_elbs(instance_id, elbs):
+def _elbs_by_instance(elbs):
     """
-    Given an EC2 instance and ELBs, return the ELB(s) in which it is active.
+    Index ELBs by the EC2 instances registered with them.
 
     Arguments:
-        instance_id (:obj:`boto.ec2.instance.Reservation`): Instance used to find out which ELB it is active in.
-        elbs (:obj:`list` of :obj:`boto.ec2.elb.loadbalancer.LoadBalancer`): List of ELBs to us in checking.
+        elbs (:obj:`list` of :obj:`boto.ec2.elb.loadbalancer.LoadBalancer`): List of ELBs to index.
     Returns:
-        :obj:`list` of :obj:`boto.ec2.elb.loadbalancer.LoadBalancer`:
-                One or more ELBs used by the passed-in instance -or- None.
+        dict: Maps each instance id to the :obj:`list` of :obj:`boto.ec2.elb.loadbalancer.LoadBalancer`
+              in which the instance is registered.
     """
-    instance_elbs = []
+    instance_elbs = defaultdict(list)
     for elb in elbs:
-        elb_instance_ids = [inst.id for inst in elb.instances]
-        if instance_id in elb_instance_ids:
-            instance_elbs.append(elb)
-    return instance_elbs
+        for instance_id in set(inst.id for inst in elb.instances):
+            instance_elbs[instance_id].append(elb)
+    return dict(instance_elbs)
+
+
+def _elbs_for_edps(edps):
+    """
+    Fetch the ELBs attached to the ASGs tagged with each of several EDPs, in a single listing.
+    When an EDP's ASGs have no ELBs, every ELB is fetched for that EDP instead.
+
+    Arguments:
+        edps (list(EDP)): The EDP tags of the ASGs whose ELBs are wanted.
+    Returns:
+        dict: Maps each EDP to a list of :class:`boto.ec2.elb.loadbalancer.LoadBalancer`
+    """
+    elb_names_by_edp = {
+        edp: set(elb_name for asg in asgs for elb_name in asg.load_balancers)
+        for edp, asgs in six.iteritems(_asgs_for_edps(edps))
+    }
+    edps_without_elbs = [edp for edp, elb_names in six.iteritems(elb_names_by_edp) if not elb_names]
+    if edps_without_elbs:
+        LOG.info("No ELBs attached to the ASGs for EDP(s) {}, checking all load balancers.".format(edps_without_elbs))
+        all_elbs = get_all_load_balancers()
+    else:
+        # DescribeLoadBalancers accepts a limited number of names per request.
+        elb_names = sorted(set.union(*elb_names_by_edp.values())) if elb_names_by_edp else []
+        all_elbs = []
+        try:
+            for start in range(0, len(elb_names), 20):
+                all_elbs.extend(get_all_load_balancers(elb_names[start:start + 20]))
+        except BotoServerError as err:
+            # ASGs keep the names of ELBs which have since been deleted, and asking for one fails the request.
+            if err.error_code != 'LoadBalancerNotFound':
+                raise
+            LOG.info("An ELB attached to the ASGs no longer exists, checking all load balancers.")
+            all_elbs = get_all_load_balancers()
+
+    return {
+        edp: [elb for elb in all_elbs if elb.name in elb_names] if elb_names else all_elbs
+        for edp, elb_names in six.iteritems(elb_names_by_edp)
+    }
+
+
+def _elbs_for_edp(edp):
+    """
+    Fetch the ELBs attached to the ASGs tagged with an EDP. When those ASGs have no ELBs,
+    every ELB is fetched instead.
+
+    Arguments:
+        edp (EDP): The EDP tags of the ASGs whose ELBs are wanted.
+    Returns:
+        a list of :class:`boto.ec2.elb.loadbalancer.LoadBalancer`
+    """
+    return _elbs_for_edps([edp])[edp]
 
 
 @backoff.on_exception(backoff.expo,
@@ -119,51 +451,164 @@ def _instance_elbs(instance_id, elbs):
                       max_tries=MAX_ATTEMPTS,
                       giveup=giveup_if_not_throttling,
                       factor=RETRY_FACTOR)
-def active_ami_for_edp(env, dep, play):
+def active_amis_for_edps(edps):
     """
-    Given an environment, deployment, and play, find the base AMI id used for the active deployment.
+    Given several environment/deployment/play triples, find the base AMI id used for the active
+    deployment of each, sharing a single ELB listing and a single reservations scan between them.
+
+    Only the ELBs attached to an EDP's ASGs are checked for it, unless those ASGs have no ELBs.
 
     Arguments:
-        env (str): Environment to check (stage, prod, loadtest, etc.)
-        dep (str): Deployment to check (edx, edge, mckinsey, etc.)
-        play (str): Play to check (edxapp, discovery, ecommerce, etc.)
+        edps (list(EDP)): The EDPs to check.
     Returns:
-        str: Base AMI id of current active deployment for the EDP.
-    Raises:
-        MultipleImagesFoundException: If multiple AMI IDs are found within the EDP's ELB.
-        ImageNotFoundException: If no AMI IDs are found for the EDP.
+        list(CallResult): For each distinct EDP, in the order given, either the base AMI id of its
+            active deployment or the error met finding it: MultipleImagesFoundException if multiple
+            AMI IDs are found within the EDP's ELBs, or ImageNotFoundException if none are.
     """
-    LOG.info("Looking up AMI for {}-{}-{}...".format(env, dep, play))
-    ec2_conn = boto.connect_ec2()
-    all_elbs = get_all_load_balancers()
-    LOG.info("Found {} load balancers.".format(len(all_elbs)))
+    edps = list(OrderedDict.fromkeys(EDP(*edp) for edp in edps))
+    if not edps:
+        return []
+    LOG.info("Looking up AMIs for {}...".format(", ".join("-".join(edp) for edp in edps)))
+    ec2_conn = ec2_connection()
+    elbs_by_edp = _elbs_for_edps(edps)
+    LOG.info("Found {} load balancers.".format(len(set(elb.name for elbs in elbs_by_edp.values() for elb in elbs))))
+    elbs_by_instance_by_edp = {edp: _elbs_by_instance(elbs) for edp, elbs in six.iteritems(elbs_by_edp)}
 
     edp_filter = {
-        "tag:environment": env,
-        "tag:deployment": dep,
-        "tag:play": play,
+        "tag:{}".format(key): sorted(set(getattr(edp, key) for edp in edps)) for key in EDP._fields
     }
     reservations = ec2_conn.get_all_reservations(filters=edp_filter)
-    LOG.info("{} reservations found for EDP {}-{}-{}".format(len(reservations), env, dep, play))
-    amis = set()
+    LOG.info("{} reservations found for {} EDP(s)".format(len(reservations), len(edps)))
+    amis_by_edp = defaultdict(set)
     for reservation in reservations:
         for instance in reservation.instances:
-            elbs = _instance_elbs(instance.id, all_elbs)
+            instance_edp = EDP(*(instance.tags.get(key) for key in EDP._fields))
+            if instance_edp not in elbs_by_instance_by_edp:
+                continue
+            env, dep, play = instance_edp
+            elbs = elbs_by_instance_by_edp[instance_edp].get(instance.id, [])
             if instance.state == 'running' and len(elbs) > 0:
-                amis.add(instance.image_id)
+                amis_by_edp[instance_edp].add(instance.image_id)
                 LOG.info("AMI found for {}-{}-{}: {}".format(env, dep, play, instance.image_id))
             else:
                 LOG.info("Instance {} state: {} - elbs in: {}".format(instance.id, instance.state, len(elbs)))
 
-    if len(amis) > 1:
-        msg = "Multiple AMIs found for {}-{}-{}, should have only one.".format(env, dep, play)
-        raise MultipleImagesFoundException(msg)
+    results = []
+    for edp in edps:
+        env, dep, play = edp
+        amis = amis_by_edp[edp]
+        if len(amis) > 1:
+            msg = "Multiple AMIs found for {}-{}-{}, should have only one.".format(env, dep, play)
+            results.append(CallResult(edp, None, MultipleImagesFoundException(msg)))
+        elif len(amis) == 0:
+            msg = "No AMIs found for {}-{}-{}.".format(env, dep, play)
+            results.append(CallResult(edp, None, ImageNotFoundException(msg)))
+        else:
+            results.append(CallResult(edp, next(iter(amis)), None))
+    return results
+
+
+def active_ami_for_edp(env, dep, play):
+    """
+    Given an environment, deployment, and play, find the base AMI id used for the active deployment.
+
+    Only the ELBs attached to the EDP's ASGs are checked, unless those ASGs have no ELBs.
+
+    Arguments:
+        env (str): Environment to check (stage, prod, loadtest, etc.)
+        dep (str): Deployment to check (edx, edge, mckinsey, etc.)
+        play (str): Play to check (edxapp, discovery, ecommerce, etc.)
+    Returns:
+        str: Base AMI id of current active deployment for the EDP.
+    Raises:
+        MultipleImagesFoundException: If multiple AMI IDs are found within the EDP's ELB.
+        ImageNotFoundException: If no AMI IDs are found for the EDP.
+    """
+    __, ami_id, error = active_amis_for_edps([EDP(env, dep, play)])[0]
+    if error is not None:
+        raise error
+    return ami_id
+
+
+class _AmiTagCache(object):
+    """
+    A bounded, least recently used cache of AMI tags, keyed by AMI id.
+
+    AMI tags do not change once an AMI has been built, so entries never expire.
+    AMIs which could not be found are not cached.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._tags = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_many(self, ami_ids, load):
+        """
+        Get the tags for several AMIs, loading the ones not in the cache with a single call of load.
+
+        Arguments:
+            ami_ids (list(str)): AMI Ids.
+            load (function): Called with the list of AMI ids not in the cache, returning a dict
+                of the tags of each AMI it found, keyed by AMI id.
 
-    if len(amis) == 0:
-        msg = "No AMIs found for {}-{}-{}.".format(env, dep, play)
-        raise ImageNotFoundException(msg)
+        Returns:
+            dict: The tags for each AMI found, keyed by AMI Id.
+        """
+        tags_by_ami = {}
+        missing_ami_ids = []
+        with self._lock:
+            for ami_id in sorted(set(ami_ids)):
+                if ami_id in self._tags:
+                    # Re-insert the AMI to mark it as the most recently used.
+                    tags_by_ami[ami_id] = self._tags[ami_id] = self._tags.pop(ami_id)
+                    self.hits += 1
+                else:
+                    missing_ami_ids.append(ami_id)
+                    self.misses += 1
+
+        if missing_ami_ids:
+            loaded_tags = load(missing_ami_ids)
+            with self._lock:
+                for ami_id, tags in six.iteritems(loaded_tags):
+                    self._tags.pop(ami_id, None)
+                    self._tags[ami_id] = tags
+                while len(self._tags) > self.maxsize:
+                    self._tags.popitem(last=False)
+            tags_by_ami.update(loaded_tags)
+
+        return {ami_id: dict(tags) for ami_id, tags in six.iteritems(tags_by_ami)}
+
+    def clear(self):
+        """
+        Empty the cache and reset its counters.
+        """
+        with self._lock:
+            self._tags.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """
+        Returns:
+            dict: The number of AMI lookups answered from the cache, the number which were not,
+                  and the number of AMIs in the cache.
+        """
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self._tags)}
 
-    return amis.pop()
+
+_AMI_TAGS = _AmiTagCache(AMI_TAG_CACHE_SIZE)
+
+
+def ami_tag_cache_stats():
+    """
+    Returns:
+        dict: Hit and miss counts, and the size, of the cache of AMI tags.
+    """
+    return _AMI_TAGS.stats()
 
 
 @backoff.on_exception(backoff.expo,
@@ -171,6 +616,55 @@ def active_ami_for_edp(env, dep, play):
                       max_tries=MAX_ATTEMPTS,
                       giveup=giveup_if_not_throttling,
                       factor=RETRY_FACTOR)
+def _describe_image_tags(ami_ids):
+    """
+    Get the tags of several AMIs with a single DescribeImages request.
+
+    Arguments:
+        ami_ids (list(str)): AMI Ids.
+    Returns:
+        dict: The tags for each AMI found, keyed by AMI Id.
+    Raises:
+        EC2ResponseError: If any of the AMI ids is malformed or does not exist.
+    """
+    ec2 = ec2_connection()
+    return {ami.id: ami.tags for ami in ec2.get_all_images(ami_ids)}
+
+
+def _load_ami_tags(ami_ids):
+    """
+    Load the tags of several AMIs, together if possible.
+
+    Arguments:
+        ami_ids (list(str)): AMI Ids.
+    Returns:
+        dict: The tags for each AMI found, keyed by AMI Id.
+    Raises:
+        EC2ResponseError: If the AMIs cannot be looked up for any reason other than an AMI not existing.
+    """
+    LOG.debug("Looking up tags for {}".format(ami_ids))
+    try:
+        return _describe_image_tags(ami_ids)
+    except EC2ResponseError as error:
+        if error.error_code not in MISSING_AMI_ERROR_CODES:
+            raise
+        if len(ami_ids) == 1:
+            LOG.warning("Unable to look up AMI {}: {}".format(ami_ids[0], error))
+            return {}
+        # A single missing AMI fails the whole request, so look the AMIs up one at a time instead.
+        LOG.info("Unable to look up AMIs {} together, looking them up one at a time: {}".format(ami_ids, error))
+
+    tags_by_ami = {}
+    for ami_id in ami_ids:
+        try:
+            tags_by_ami.update(_describe_image_tags([ami_id]))
+        except EC2ResponseError as error:
+            if error.error_code not in MISSING_AMI_ERROR_CODES:
+                raise
+            LOG.warning("Unable to look up AMI {}: {}".format(ami_id, error))
+    return tags_by_ami
+
+
 def tags_for_ami(ami_id):
     """
     Look up the tags for an AMI.
@@ -182,18 +676,26 @@ def tags_for_ami(ami_id):
     Raises:
         ImageNotFoundException: No image found with this ami ID.
         MissingTagException: AMI is missing one or more of the expected tags.
+        EC2ResponseError: If the AMI cannot be looked up for any other reason.
     """
-    LOG.debug("Looking up edp for {}".format(ami_id))
-    ec2 = boto.connect_ec2()
-
-    try:
-        ami = ec2.get_all_images(ami_id)[0]
-    except IndexError:
+    tags_by_ami = _AMI_TAGS.get_many([ami_id], _load_ami_tags)
+    if ami_id not in tags_by_ami:
         raise ImageNotFoundException("ami: {} not found".format(ami_id))
-    except EC2ResponseError as error:
-        raise ImageNotFoundException(str(error))
+    return tags_by_ami[ami_id]
+
 
-    return ami.tags
+def tags_for_amis(ami_ids):
+    """
+    Look up the tags for several AMIs, with a single request for those not already cached.
+
+    Arguments:
+        ami_ids (list(str)): AMI Ids.
+    Returns:
+        dict: The tags for each AMI found, keyed by AMI Id.
+    Raises:
+        EC2ResponseError: If the AMIs cannot be looked up for any reason other than an AMI not existing.
+    """
+    return _AMI_TAGS.get_many(ami_ids, _load_ami_tags)
 
 
 def edp_for_ami(ami_id):
@@ -262,167 +764,891 @@ def is_stage_ami(ami_id):
     return ami_for_stage
 
 
-def asgs_for_edp(edp, filter_asgs_pending_delete=True):
+@backoff.on_exception(backoff.expo,
+                      BotoServerError,
+                      max_tries=MAX_ATTEMPTS,
+                      giveup=giveup_if_not_throttling,
+                      factor=RETRY_FACTOR)
+def describe_asg_tags(filters, region=None):
     """
-    All AutoScalingGroups that have the tags of this play.
-
-    A play is made up of many auto_scaling groups.
+    Get the ASG tags matching the given DescribeTags filters, letting AWS do the filtering.
 
     Arguments:
-        EDP Named Tuple: The edp tags for the ASGs you want.
+        filters (dict): Maps each filter name ('auto-scaling-group', 'key', 'value' or 'propagate-at-launch')
+            to a list of values. A tag must match every filter, and any one of the values of each filter.
+        region (str): The AWS region of the ASGs. None means the default region.
+
     Returns:
-        list: list of ASG names that match the EDP.
-    eg.
+        List of :class:`boto.ec2.autoscale.tag.Tag` instances.
+    """
+    # boto's get_all_tags() does not send filters, so the request is built here.
+    params = {}
+    for filter_index, (name, values) in enumerate(sorted(filters.items()), 1):
+        params['Filters.member.{}.Name'.format(filter_index)] = name
+        for value_index, value in enumerate(values, 1):
+            params['Filters.member.{}.Values.member.{}'.format(filter_index, value_index)] = value
+
+    autoscale_conn = autoscale_connection(region)
+    fetched_tags = autoscale_conn.get_list('DescribeTags', params, [('member', Tag)])
+    total_tags = []
+    while True:
+        total_tags.extend([tag for tag in fetched_tags])
+        if fetched_tags.next_token:
+            page_params = dict(params, NextToken=fetched_tags.next_token)
+            fetched_tags = autoscale_conn.get_list('DescribeTags', page_params, [('member', Tag)])
+        else:
+            break
+    return total_tags
 
-     [
-         u'edxapp-v018',
-         u'sandbox-edx-hacking-ASG',
-         u'sandbox-edx-insights-ASG',
-         u'test-edx-ecomapp',
-         u'test-edx-edxapp-v007',
-         u'test2-edx-certificates',
-     ]
 
+def _describe_asgs(asg_names):
     """
-    all_groups = get_all_autoscale_groups()
-    matching_groups = []
-    LOG.info("Found {} ASGs".format(len(all_groups)))
+    Describe the named ASGs, asking for as many names per request as AWS allows.
 
-    for group in all_groups:
-        LOG.debug("Checking group {}".format(group))
-        tags = {tag.key: tag.value for tag in group.tags}
-        LOG.debug("Tags for asg {}: {}".format(group.name, tags))
-        if filter_asgs_pending_delete and ASG_DELETE_TAG_KEY in tags.keys():
-            LOG.info("filtering ASG: {0} because it is tagged for deletion on: {1}"
-                     .format(group.name, tags[ASG_DELETE_TAG_KEY]))
-            continue
+    Arguments:
+        asg_names (list(str)): The names of the ASGs.
 
-        edp_keys = ['environment', 'deployment', 'play']
-        if all([tag in tags for tag in edp_keys]):
-            group_env = tags['environment']
-            group_deployment = tags['deployment']
-            group_play = tags['play']
+    Returns:
+        List of :class:`boto.ec2.autoscale.group.AutoScalingGroup` instances for the ASGs which exist.
+    """
+    # DescribeAutoScalingGroups accepts a limited number of names per request.
+    asg_names = list(asg_names)
+    asgs = []
+    for start in range(0, len(asg_names), ASG_NAMES_PER_REQUEST):
+        asgs.extend(get_all_autoscale_groups(asg_names[start:start + ASG_NAMES_PER_REQUEST]))
+    return asgs
 
-            group_edp = EDP(group_env, group_deployment, group_play)
 
-            if group_edp == edp:
-                matching_groups.append(group.name)
+def _asgs_for_edps(edps):
+    """
+    Find the ASGs tagged with each of several EDPs, without listing every ASG in the account.
 
-    LOG.info(
-        "Returning %s ASGs for EDP %s-%s-%s.",
-        len(matching_groups),
-        edp.environment,
-        edp.deployment,
-        edp.play
-    )
-    return matching_groups
+    AWS is first asked for the 'play' tags with the EDPs' plays, the most selective of the EDP
+    tags. Only the ASGs carrying one of those plays then have their environment and deployment
+    tags fetched, and only the ASGs which match an EDP are described.
 
+    Arguments:
+        edps (list(EDP)): The EDP tags of the ASGs wanted.
 
-def create_tag_for_asg_deletion(asg_name, seconds_until_delete_delta=None):
-    """
-    Create a tag that will be used to mark an ASG for deletion.
+    Returns:
+        dict: Maps each EDP to a list of :class:`boto.ec2.autoscale.group.AutoScalingGroup` instances.
     """
-    if seconds_until_delete_delta is None:
-        tag_value = None
-    else:
-        tag_value = (datetime.utcnow() + timedelta(seconds=seconds_until_delete_delta)).isoformat()
-    return Tag(key=ASG_DELETE_TAG_KEY,
-               value=tag_value,
-               propagate_at_launch=False,
-               resource_id=asg_name)
-
-
-@backoff.on_exception(backoff.expo,
-                      BotoServerError,
-                      max_tries=MAX_ATTEMPTS,
-                      giveup=giveup_if_not_throttling,
-                      factor=RETRY_FACTOR)
-def tag_asg_for_deletion(asg_name, seconds_until_delete_delta=1800):
+    edps = set(edps)
+    asg_tags = defaultdict(dict)
+    for tag in describe_asg_tags({'key': ['play'], 'value': sorted(set(edp.play for edp in edps))}):
+        asg_tags[tag.resource_id][tag.key] = tag.value
+
+    # The names of the ASGs are sent as filter values, a batch at a time.
+    asg_names = sorted(asg_tags)
+    for start in range(0, len(asg_names), ASG_NAMES_PER_REQUEST):
+        batch_filters = {
+            'auto-scaling-group': asg_names[start:start + ASG_NAMES_PER_REQUEST],
+            'key': ['deployment', 'environment'],
+        }
+        for tag in describe_asg_tags(batch_filters):
+            asg_tags[tag.resource_id][tag.key] = tag.value
+
+    edps_by_asg_name = {}
+    for asg_name, tags in six.iteritems(asg_tags):
+        if all(key in tags for key in EDP._fields):
+            asg_edp = EDP(tags['environment'], tags['deployment'], tags['play'])
+            if asg_edp in edps:
+                edps_by_asg_name[asg_name] = asg_edp
+
+    asgs_by_edp = {edp: [] for edp in edps}
+    for asg in _describe_asgs(sorted(edps_by_asg_name)):
+        asgs_by_edp[edps_by_asg_name[asg.name]].append(asg)
+    return asgs_by_edp
+
+
+def _asgs_with_edp_tags(edp):
     """
-    Tag an asg with a tag named ASG_DELETE_TAG_KEY with a value of the MS since epoch UTC + ms_until_delete_delta
-    that an ASG may be deleted.
+    Find the ASGs tagged with an EDP, letting AWS filter on the EDP's tags.
 
     Arguments:
-        asg_name (str): the name of the autoscale group to tag
+        edp (EDP): The EDP tags of the ASGs wanted.
 
     Returns:
-        None
+        List of :class:`boto.ec2.autoscale.group.AutoScalingGroup` instances.
     """
-    tag = create_tag_for_asg_deletion(asg_name, seconds_until_delete_delta)
-    autoscale = boto.connect_autoscale()
-    if len(get_all_autoscale_groups([asg_name])) < 1:
-        LOG.info("ASG {} no longer exists, will not tag".format(asg_name))
-    else:
-        autoscale.create_or_update_tags([tag])
+    return _asgs_for_edps([edp])[edp]
 
 
-@backoff.on_exception(backoff.expo,
-                      BotoServerError,
-                      max_tries=MAX_ATTEMPTS,
-                      giveup=giveup_if_not_throttling,
-                      factor=RETRY_FACTOR)
-def remove_asg_deletion_tag(asg_name):
+class PendingDeleteIndex(object):
     """
-    Remove deletion tag from an asg.
+    The times at which ASGs may be deleted, read from their ASG_DELETE_TAG_KEY tags and kept
+    sorted, so that finding the ASGs due for deletion by any time does not scan every tag.
 
-    Arguments:
-        asg_name (str): the name of the autoscale group from which to remove the deletion tag
+    Tags whose values cannot be parsed are kept aside, so that the ASGs with valid tags are
+    still found.
+    """
 
+    def __init__(self):
+        self._entries = []
+        self._delete_on = {}
+        self._tags = {}
+        self.malformed = {}
+
+    @classmethod
+    def load(cls, region=None):
+        """
+        Build an index of every ASG with a deletion tag, asking AWS for only the deletion tags.
+
+        Arguments:
+            region (str): The AWS region of the ASGs. None means the default region.
+
+        Returns:
+            PendingDeleteIndex: The index.
+        """
+        index = cls()
+        for tag in describe_asg_tags({'key': [ASG_DELETE_TAG_KEY]}, region=region):
+            index.add(tag.resource_id, tag.value)
+        index.warn_malformed()
+        return index
+
+    def add(self, asg_name, value):
+        """
+        Record the value of the deletion tag of an ASG, replacing any earlier value.
+
+        Arguments:
+            asg_name (str): The name of the ASG.
+            value (str): The value of its deletion tag.
+
+        Returns:
+            bool: False if the value could not be parsed.
+        """
+        self.remove(asg_name)
+        self._tags[asg_name] = value
+        try:
+            delete_on = datetime.strptime(value, ISO_DATE_FORMAT)
+        except (TypeError, ValueError):
+            self.malformed[asg_name] = value
+            return False
+        self._delete_on[asg_name] = delete_on
+        bisect.insort(self._entries, (delete_on, asg_name))
+        return True
+
+    def remove(self, asg_name):
+        """
+        Forget the deletion tag of an ASG.
+        """
+        self._tags.pop(asg_name, None)
+        self.malformed.pop(asg_name, None)
+        delete_on = self._delete_on.pop(asg_name, None)
+        if delete_on is not None:
+            del self._entries[bisect.bisect_left(self._entries, (delete_on, asg_name))]
+
+    def clear(self):
+        """
+        Forget every deletion tag.
+        """
+        self._entries = []
+        self._delete_on.clear()
+        self._tags.clear()
+        self.malformed.clear()
+
+    def __contains__(self, asg_name):
+        return asg_name in self._tags
+
+    def __len__(self):
+        return len(self._tags)
+
+    def due(self, as_of=None):
+        """
+        Arguments:
+            as_of (datetime): The UTC time at which to check. Defaults to now.
+
+        Returns:
+            list(str): The names of the ASGs which may be deleted at as_of, ordered so that
+                the ASGs which have been due for deletion the longest come first.
+        """
+        as_of = as_of or datetime.utcnow()
+        return [asg_name for __, asg_name in self._entries[:bisect.bisect_left(self._entries, (as_of,))]]
+
+    def due_within(self, minutes):
+        """
+        Returns:
+            list(str): The names of the ASGs which may be deleted within the given number of minutes from now,
+                ordered so that the ASGs which are due for deletion the soonest come first.
+        """
+        return self.due(datetime.utcnow() + timedelta(minutes=minutes))
+
+    def warn_malformed(self):
+        """
+        Log a single warning naming every ASG whose deletion tag could not be parsed.
+        """
+        if self.malformed:
+            LOG.warning(
+                "{0} ASG(s) have an improperly formatted datetime string for the key {1} and are skipped: {2} . "
+                "Format must match {3}".format(
+                    len(self.malformed), ASG_DELETE_TAG_KEY, sorted(six.iteritems(self.malformed)), ISO_DATE_FORMAT
+                )
+            )
+
+
+class AsgInventory(object):
+    """
+    A snapshot of every ASG in the account, paged through once and indexed by name,
+    by EDP tags and by the time at which the ASG may be deleted.
+
+    The snapshot is loaded on first use and kept until refresh() or invalidate() is called.
+    Changes made to deletion tags through this module are applied to the snapshot as they are made.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._by_name = OrderedDict()
+        self._by_edp = defaultdict(list)
+        self._pending_delete = PendingDeleteIndex()
+
+    def refresh(self):
+        """
+        Page through every ASG in the account and rebuild the indexes.
+        """
+        asgs = get_all_autoscale_groups()
+        LOG.info("Found {} ASGs".format(len(asgs)))
+        with self._lock:
+            self._clear()
+            for asg in asgs:
+                self._add(asg)
+            self._loaded = True
+            self._pending_delete.warn_malformed()
+
+    def invalidate(self):
+        """
+        Drop the snapshot, so that it is loaded again the next time it is used.
+        """
+        with self._lock:
+            self._clear()
+            self._loaded = False
+
+    def _clear(self):
+        """
+        Empty the indexes.
+        """
+        self._by_name.clear()
+        self._by_edp.clear()
+        self._pending_delete.clear()
+
+    def _add(self, asg):
+        """
+        Add an ASG to the indexes.
+        """
+        self._by_name[asg.name] = asg
+        tags = {tag.key: tag.value for tag in asg.tags}
+        LOG.debug("Tags for asg {}: {}".format(asg.name, tags))
+        if all(key in tags for key in ('environment', 'deployment', 'play')):
+            self._by_edp[EDP(tags['environment'], tags['deployment'], tags['play'])].append(asg.name)
+        if ASG_DELETE_TAG_KEY in tags:
+            self._pending_delete.add(asg.name, tags[ASG_DELETE_TAG_KEY])
+
+    def _ensure_loaded(self):
+        """
+        Load the snapshot if it has not been loaded since it was created or invalidated.
+        """
+        with self._lock:
+            if not self._loaded:
+                self.refresh()
+
+    def asgs(self):
+        """
+        Returns:
+            list(boto.ec2.autoscale.group.AutoScalingGroup): Every ASG in the snapshot.
+        """
+        self._ensure_loaded()
+        with self._lock:
+            return list(self._by_name.values())
+
+    def get(self, asg_name):
+        """
+        Look up an ASG by name. ASGs not yet in the snapshot, such as those created after it
+        was taken, are looked up directly and added to it.
+
+        Arguments:
+            asg_name (str): The name of the ASG.
+
+        Returns:
+            boto.ec2.autoscale.group.AutoScalingGroup: The ASG, or None if it does not exist.
+        """
+        with self._lock:
+            if asg_name in self._by_name:
+                return self._by_name[asg_name]
+        self.remember(get_all_autoscale_groups([asg_name]))
+        with self._lock:
+            return self._by_name.get(asg_name)
+
+    def get_many(self, asg_names):
+        """
+        Look up several ASGs by name. ASGs not yet in the snapshot are looked up together
+        and added to it.
+
+        Arguments:
+            asg_names (list(str)): The names of the ASGs.
+
+        Returns:
+            list(boto.ec2.autoscale.group.AutoScalingGroup): The ASGs which exist, in the order named.
+        """
+        with self._lock:
+            missing = [asg_name for asg_name in asg_names if asg_name not in self._by_name]
+        if missing:
+            self.remember(_describe_asgs(missing))
+        with self._lock:
+            return [self._by_name[asg_name] for asg_name in asg_names if asg_name in self._by_name]
+
+    def remember(self, asgs):
+        """
+        Add ASGs fetched outside of the snapshot to it, without loading the rest of the account.
+
+        Arguments:
+            asgs (list(boto.ec2.autoscale.group.AutoScalingGroup)): The ASGs to add.
+        """
+        with self._lock:
+            for asg in asgs:
+                if asg.name not in self._by_name:
+                    self._add(asg)
+
+    def forget(self, asg_names):
+        """
+        Drop ASGs which have been found to no longer exist from the snapshot.
+
+        Arguments:
+            asg_names (list(str)): The names of the ASGs to drop.
+        """
+        with self._lock:
+            for asg_name in asg_names:
+                if self._by_name.pop(asg_name, None) is None:
+                    continue
+                self._pending_delete.remove(asg_name)
+                for edp_asg_names in self._by_edp.values():
+                    if asg_name in edp_asg_names:
+                        edp_asg_names.remove(asg_name)
+
+    @property
+    def loaded(self):
+        """
+        True if every ASG in the account has been loaded into the snapshot.
+        """
+        return self._loaded
+
+    def for_edp(self, edp, include_pending_delete=True):
+        """
+        Arguments:
+            edp (EDP): The EDP tags of the ASGs wanted.
+            include_pending_delete (bool): If False, ASGs tagged for deletion are left out.
+
+        Returns:
+            list(str): The names of the ASGs tagged with the EDP.
+        """
+        self._ensure_loaded()
+        with self._lock:
+            return [
+                asg_name for asg_name in self._by_edp.get(edp, [])
+                if include_pending_delete or asg_name not in self._pending_delete
+            ]
+
+    def is_tagged_for_deletion(self, asg_name):
+        """
+        Returns:
+            bool: True if the ASG has a deletion tag.
+        """
+        self._ensure_loaded()
+        with self._lock:
+            return asg_name in self._pending_delete
+
+    def pending_delete(self, as_of=None):
+        """
+        Arguments:
+            as_of (datetime): The UTC time at which to check. Defaults to now.
+
+        Returns:
+            list(boto.ec2.autoscale.group.AutoScalingGroup): The ASGs which may be deleted at as_of,
+                ordered so that the ASGs which have been due for deletion the longest come first.
+        """
+        as_of = as_of or datetime.utcnow()
+        self._ensure_loaded()
+        with self._lock:
+            return [self._by_name[asg_name] for asg_name in self._pending_delete.due(as_of)]
+
+    def tag_for_deletion(self, asg_name, value):
+        """
+        Record that an ASG has been tagged for deletion.
+        """
+        with self._lock:
+            self._pending_delete.add(asg_name, value)
+
+    def untag_for_deletion(self, asg_name):
+        """
+        Record that the deletion tag of an ASG has been removed.
+        """
+        with self._lock:
+            self._pending_delete.remove(asg_name)
+            asg = self._by_name.get(asg_name)
+            if asg is not None:
+                asg.tags = [tag for tag in asg.tags if tag.key != ASG_DELETE_TAG_KEY]
+
+
+_INVENTORY_LOCK = threading.Lock()
+_INVENTORY = None
+_INVENTORY_DEPTH = 0
+
+
+@contextmanager
+def asg_inventory():
+    """
+    Share a single ASG inventory snapshot between the ec2 helpers called within the with block.
+
+    Blocks may be nested, and may be entered from several threads; the snapshot is dropped
+    once the outermost block exits.
+
+    Yields:
+        AsgInventory: The shared snapshot.
+    """
+    global _INVENTORY, _INVENTORY_DEPTH  # pylint: disable=global-statement
+    with _INVENTORY_LOCK:
+        if _INVENTORY is None:
+            _INVENTORY = AsgInventory()
+        _INVENTORY_DEPTH += 1
+        inventory = _INVENTORY
+    try:
+        yield inventory
+    finally:
+        with _INVENTORY_LOCK:
+            _INVENTORY_DEPTH -= 1
+            if _INVENTORY_DEPTH == 0:
+                _INVENTORY = None
+
+
+def _inventory(inventory=None):
+    """
     Returns:
-        None
+        AsgInventory: The given snapshot, else the shared snapshot if one is in use, else None.
     """
-    asgs = get_all_autoscale_groups([asg_name])
-    if len(asgs) < 1:
-        LOG.info("ASG {} no longer exists, will not remove deletion tag.".format(asg_name))
+    if inventory is not None:
+        return inventory
+    with _INVENTORY_LOCK:
+        return _INVENTORY
+
+
+def asgs_for_edp(edp, filter_asgs_pending_delete=True, inventory=None):
+    """
+    All AutoScalingGroups that have the tags of this play.
+
+    A play is made up of many auto_scaling groups. Unless an inventory which has
+    loaded every ASG is available, AWS is asked for only the ASGs with the EDP's tags.
+
+    Arguments:
+        EDP Named Tuple: The edp tags for the ASGs you want.
+        filter_asgs_pending_delete (bool): If True, leave out ASGs tagged for deletion.
+        inventory (AsgInventory): The ASG snapshot to answer from. Defaults to the shared
+            snapshot if one is in use.
+    Returns:
+        list: list of ASG names that match the EDP.
+    eg.
+
+     [
+         u'edxapp-v018',
+         u'sandbox-edx-hacking-ASG',
+         u'sandbox-edx-insights-ASG',
+         u'test-edx-ecomapp',
+         u'test-edx-edxapp-v007',
+         u'test2-edx-certificates',
+     ]
+
+    """
+    inventory = _inventory(inventory)
+    if inventory is not None and inventory.loaded:
+        matching_groups = inventory.for_edp(edp, include_pending_delete=not filter_asgs_pending_delete)
     else:
-        for asg in asgs:
-            for tag in asg.tags:
-                if tag.key == ASG_DELETE_TAG_KEY:
-                    tag.delete()
+        edp_asgs = _asgs_with_edp_tags(edp)
+        if inventory is not None:
+            inventory.remember(edp_asgs)
+        matching_groups = []
+        for group in edp_asgs:
+            if filter_asgs_pending_delete and any(tag.key == ASG_DELETE_TAG_KEY for tag in group.tags):
+                LOG.info("filtering ASG: {0} because it is tagged for deletion.".format(group.name))
+                continue
+            matching_groups.append(group.name)
+
+    LOG.info(
+        "Returning %s ASGs for EDP %s-%s-%s.",
+        len(matching_groups),
+        edp.environment,
+        edp.deployment,
+        edp.play
+    )
+    return matching_groups
 
 
-def get_asgs_pending_delete():
+def create_tag_for_asg_deletion(asg_name, seconds_until_delete_delta=None):
     """
-    Get a list of all the autoscale groups marked with the ASG_DELETE_TAG_KEY.
-    Return only those groups who's ASG_DELETE_TAG_KEY as past the current time.
+    Create a tag that will be used to mark an ASG for deletion.
+    """
+    if seconds_until_delete_delta is None:
+        tag_value = None
+    else:
+        tag_value = (datetime.utcnow() + timedelta(seconds=seconds_until_delete_delta)).isoformat()
+    return Tag(key=ASG_DELETE_TAG_KEY,
+               value=tag_value,
+               propagate_at_launch=False,
+               resource_id=asg_name)
+
+
+def _existing_asgs(asg_names, inventory=None):
+    """
+    Find which of the named ASGs exist, describing them together.
+
+    With a snapshot, only the ASGs missing from it are described. An ASG deleted after the
+    snapshot was taken is still returned, and is caught when AWS refuses to change its tags.
 
-    It's intended for this method to be robust and to return as many ASGs that
-    are pending delete as possible even if an error occurs during the process.
+    Arguments:
+        asg_names (list(str)): The names of the ASGs wanted.
+        inventory (AsgInventory): The ASG snapshot to answer from, if any.
 
     Returns:
-        List(<boto.ec2.autoscale.group.AutoScalingGroup>)
+        list(boto.ec2.autoscale.group.AutoScalingGroup): The named ASGs which exist, in the order named.
     """
-    current_datetime = datetime.utcnow()
+    asg_names = list(OrderedDict.fromkeys(asg_names))
+    if inventory is not None:
+        return inventory.get_many(asg_names)
+    asgs_by_name = {asg.name: asg for asg in _describe_asgs(asg_names)}
+    return [asgs_by_name[asg_name] for asg_name in asg_names if asg_name in asgs_by_name]
 
-    asgs_pending_delete = []
-    asgs = get_all_autoscale_groups()
-    LOG.debug("Found {0} autoscale groups".format(len(asgs)))
-    for asg in asgs:
-        LOG.debug("Checking for {0} on asg: {1}".format(ASG_DELETE_TAG_KEY, asg.name))
-        for tag in asg.tags:
-            try:
-                if tag.key == ASG_DELETE_TAG_KEY:
-                    LOG.debug("Found {0} tag, deletion time: {1}".format(ASG_DELETE_TAG_KEY, tag.value))
-                    if datetime.strptime(tag.value, ISO_DATE_FORMAT) - current_datetime < timedelta(0, 0, 0):
-                        LOG.debug("Adding ASG: {0} to the list of ASGs to delete.".format(asg.name))
-                        asgs_pending_delete.append(asg)
-                        break
-            except ValueError:
-                LOG.warning(
-                    "ASG {0} has an improperly formatted datetime string for the key {1}. Value: {2} . "
-                    "Format must match {3}".format(
-                        asg.name, tag.key, tag.value, ISO_DATE_FORMAT
-                    )
-                )
-                continue
-            except Exception as err:  # pylint: disable=broad-except
-                LOG.warning("Error occured while building a list of ASGs to delete, continuing: {0}".format(err))
-                continue
 
+@backoff.on_exception(backoff.expo,
+                      BotoServerError,
+                      max_tries=MAX_ATTEMPTS,
+                      giveup=giveup_if_not_throttling,
+                      factor=RETRY_FACTOR)
+def _send_tag_batch(send, tags):
+    """
+    Send a single batch of tag changes, retrying it alone if AWS throttles it.
+    """
+    send(tags)
+
+
+def _send_tags_in_batches(send, tags):
+    """
+    Send tag changes in as few requests as AWS allows.
+
+    AWS refuses a whole batch with a ValidationError if any of its ASGs has been deleted, so when
+    that happens the ASGs of the batch are checked again and the tags of those which still exist
+    are sent once more. Other batches are not affected.
+
+    Arguments:
+        send (function): Sends a list of tags in one request, such as create_or_update_tags or delete_tags.
+        tags (list(boto.ec2.autoscale.tag.Tag)): The tags to send.
+
+    Returns:
+        list(boto.ec2.autoscale.tag.Tag): The tags which were sent.
+    """
+    sent = []
+    for start in range(0, len(tags), ASG_TAGS_PER_REQUEST):
+        batch = tags[start:start + ASG_TAGS_PER_REQUEST]
+        try:
+            _send_tag_batch(send, batch)
+        except BotoServerError as err:
+            if err.error_code != 'ValidationError':
+                raise
+            existing_names = set(asg.name for asg in _describe_asgs([tag.resource_id for tag in batch]))
+            existing_tags = [tag for tag in batch if tag.resource_id in existing_names]
+            if len(existing_tags) == len(batch):
+                raise
+            LOG.info("ASG(s) {} no longer exist, sending the tags of the other ASGs again.".format(
+                sorted(tag.resource_id for tag in batch if tag.resource_id not in existing_names)
+            ))
+            batch = existing_tags
+            if batch:
+                _send_tag_batch(send, batch)
+        sent.extend(batch)
+    return sent
+
+
+def tag_asgs_for_deletion(asg_names, seconds_until_delete_delta=1800, inventory=None):
+    """
+    Tag several asgs with a tag named ASG_DELETE_TAG_KEY with a value of the time in UTC
+    after which each ASG may be deleted.
+
+    Which ASGs exist is checked with a single paged lookup, or against the snapshot if one is in
+    use, and the tags are then sent in as few CreateOrUpdateTags requests as AWS allows. The ASGs
+    of a batch which AWS refuses are checked again, and ASGs found to be deleted are skipped.
+
+    Arguments:
+        asg_names (list(str)): the names of the autoscale groups to tag
+        seconds_until_delete_delta (int): seconds from now after which the ASGs may be deleted
+        inventory (AsgInventory): The ASG snapshot to answer from and keep up to date. Defaults
+            to the shared snapshot if one is in use.
+
+    Returns:
+        list(str): The names of the ASGs which were tagged. ASGs which no longer exist are skipped.
+    """
+    asg_names = list(OrderedDict.fromkeys(asg_names))
+    inventory = _inventory(inventory)
+    tagged_names = [asg.name for asg in _existing_asgs(asg_names, inventory)]
+    for asg_name in asg_names:
+        if asg_name not in tagged_names:
+            LOG.info("ASG {} no longer exists, will not tag".format(asg_name))
+    if tagged_names:
+        tags = [create_tag_for_asg_deletion(asg_name, seconds_until_delete_delta) for asg_name in tagged_names]
+        sent_tags = _send_tags_in_batches(autoscale_connection().create_or_update_tags, tags)
+        tagged_names = [tag.resource_id for tag in sent_tags]
+        if inventory is not None:
+            inventory.forget(set(tag.resource_id for tag in tags) - set(tagged_names))
+            for tag in sent_tags:
+                inventory.tag_for_deletion(tag.resource_id, tag.value)
+    return tagged_names
+
+
+def tag_asg_for_deletion(asg_name, seconds_until_delete_delta=1800, inventory=None):
+    """
+    Tag an asg with a tag named ASG_DELETE_TAG_KEY with a value of the MS since epoch UTC + ms_until_delete_delta
+    that an ASG may be deleted.
+
+    Arguments:
+        asg_name (str): the name of the autoscale group to tag
+        inventory (AsgInventory): The ASG snapshot to answer from and keep up to date. Defaults
+            to the shared snapshot if one is in use.
+
+    Returns:
+        None
+    """
+    tag_asgs_for_deletion([asg_name], seconds_until_delete_delta, inventory=inventory)
+
+
+def remove_asg_deletion_tags(asg_names, inventory=None):
+    """
+    Remove the deletion tag from several asgs.
+
+    Which ASGs exist is checked with a single paged lookup, or against the snapshot if one is in
+    use, and the tags are then deleted in as few DeleteTags requests as AWS allows. The ASGs of a
+    batch which AWS refuses are checked again, and ASGs found to be deleted are skipped.
+
+    Arguments:
+        asg_names (list(str)): the names of the autoscale groups from which to remove the deletion tag
+        inventory (AsgInventory): The ASG snapshot to answer from and keep up to date. Defaults
+            to the shared snapshot if one is in use.
+
+    Returns:
+        list(str): The names of the ASGs which exist. ASGs which no longer exist are skipped.
+    """
+    asg_names = list(OrderedDict.fromkeys(asg_names))
+    inventory = _inventory(inventory)
+    asgs = _existing_asgs(asg_names, inventory)
+    existing_names = [asg.name for asg in asgs]
+    for asg_name in asg_names:
+        if asg_name not in existing_names:
+            LOG.info("ASG {} no longer exists, will not remove deletion tag.".format(asg_name))
+    tags = [tag for asg in asgs for tag in asg.tags if tag.key == ASG_DELETE_TAG_KEY]
+    if tags:
+        sent_tags = _send_tags_in_batches(autoscale_connection().delete_tags, tags)
+        deleted_names = set(tag.resource_id for tag in tags) - set(tag.resource_id for tag in sent_tags)
+        existing_names = [asg_name for asg_name in existing_names if asg_name not in deleted_names]
+        if inventory is not None:
+            inventory.forget(deleted_names)
+    if inventory is not None:
+        for asg_name in existing_names:
+            inventory.untag_for_deletion(asg_name)
+    return existing_names
+
+
+def remove_asg_deletion_tag(asg_name, inventory=None):
+    """
+    Remove deletion tag from an asg.
+
+    Arguments:
+        asg_name (str): the name of the autoscale group from which to remove the deletion tag
+        inventory (AsgInventory): The ASG snapshot to answer from and keep up to date. Defaults
+            to the shared snapshot if one is in use.
+
+    Returns:
+        None
+    """
+    remove_asg_deletion_tags([asg_name], inventory=inventory)
+
+
+def get_asg_names_pending_delete(within_minutes=0, inventory=None, region=None):
+    """
+    Get the names of the autoscale groups whose ASG_DELETE_TAG_KEY is past the current time,
+    or will be within the given number of minutes, ordered so that the groups which have been
+    due for deletion the longest come first.
+
+    Unless an ASG snapshot is in use, only the deletion tags are fetched from AWS, so groups
+    without one are never described. ASGs whose ASG_DELETE_TAG_KEY cannot be parsed are logged
+    and left out.
+
+    Arguments:
+        within_minutes (int): Also include the groups which will be due within this many minutes.
+        inventory (AsgInventory): The ASG snapshot to answer from. Defaults to the shared
+            snapshot if one is in use. Snapshots only cover the default region.
+        region (str): The AWS region of the ASGs. None means the default region.
+
+    Returns:
+        list(str): The names of the ASGs.
+    """
+    as_of = datetime.utcnow() + timedelta(minutes=within_minutes)
+    inventory = _inventory(inventory) if region is None else inventory
+    if inventory is not None:
+        return [asg.name for asg in inventory.pending_delete(as_of)]
+    return PendingDeleteIndex.load(region).due(as_of)
+
+
+def get_asgs_pending_delete(within_minutes=0, inventory=None):
+    """
+    Get a list of all the autoscale groups marked with the ASG_DELETE_TAG_KEY.
+    Return only those groups who's ASG_DELETE_TAG_KEY as past the current time,
+    ordered so that the groups which have been due for deletion the longest come first.
+
+    ASGs whose ASG_DELETE_TAG_KEY cannot be parsed are logged and left out.
+
+    Arguments:
+        within_minutes (int): Also include the groups which will be due within this many minutes.
+        inventory (AsgInventory): The ASG snapshot to answer from. Defaults to the shared
+            snapshot if one is in use, else only the groups which are due are described.
+
+    Returns:
+        List(<boto.ec2.autoscale.group.AutoScalingGroup>)
+    """
+    inventory = _inventory(inventory)
+    asg_names = get_asg_names_pending_delete(within_minutes, inventory=inventory)
+    if inventory is not None:
+        asgs_pending_delete = inventory.get_many(asg_names)
+    else:
+        asgs_by_name = {asg.name: asg for asg in _describe_asgs(asg_names)}
+        asgs_pending_delete = [asgs_by_name[asg_name] for asg_name in asg_names if asg_name in asgs_by_name]
     LOG.info("Number of ASGs pending delete: {0}".format(len(asgs_pending_delete)))
     return asgs_pending_delete
 
 
+@backoff.on_exception(backoff.expo,
+                      BotoServerError,
+                      max_tries=MAX_ATTEMPTS,
+                      giveup=giveup_if_not_throttling,
+                      factor=RETRY_FACTOR)
+def _describe_instances_page(conn, filters, next_token=None):
+    """
+    Fetch a single page of reservations matching the filters.
+    """
+    return conn.get_all_reservations(filters=filters, max_results=INSTANCES_PER_PAGE, next_token=next_token)
+
+
+def _reapable_instances(conn, tags, max_run_hours, skip_if_tag):
+    """
+    Page through the instances which match the tags and can still be terminated, yielding those
+    which have run longer than max_run_hours and are not tagged with skip_if_tag.
+
+    AWS filters on the tags and the instance state. EC2 filters cannot leave out instances
+    carrying a tag, so skip_if_tag is checked here.
+    """
+    filters = dict(tags, **{'instance-state-name': TERMINABLE_INSTANCE_STATES})
+    launched_before = datetime.utcnow() - timedelta(hours=max_run_hours)
+    next_token = None
+    while True:
+        reservations = _describe_instances_page(conn, filters, next_token)
+        for reservation in reservations:
+            for instance in reservation.instances:
+                if skip_if_tag in instance.tags:
+                    continue
+                if boto.utils.parse_ts(instance.launch_time) < launched_before:
+                    yield instance
+        next_token = reservations.next_token
+        if not next_token:
+            break
+
+
+@backoff.on_exception(backoff.expo,
+                      BotoServerError,
+                      max_tries=MAX_ATTEMPTS,
+                      giveup=giveup_if_not_throttling,
+                      factor=RETRY_FACTOR)
+def _terminate_instance_batch(conn, instance_ids):
+    """
+    Terminate a batch of instances with a single request.
+    """
+    conn.terminate_instances(instance_ids=instance_ids)
+
+
+def reap_instances(region, tags, max_run_hours, skip_if_tag, dry_run=False,
+                   batch_size=INSTANCES_PER_TERMINATE_REQUEST):
+    """
+    Terminates instances based on tag and the number of hours an instance has been running,
+    paging through the matching instances and terminating them in batches as they are found.
+
+    Args:
+        region (str): the ec2 region to search for instances.
+        tags (dict): tag names/values to search for instances (e.g. {'tag:Name':'*string*'} ).
+        max_run_hours (int): number of hours the instance should be left running before termination.
+        skip_if_tag (str): Instance will not be terminated if it is tagged with this value.
+        dry_run (bool): If True, find the instances but do not terminate them.
+        batch_size (int): Most instance ids to send in a single TerminateInstances request.
+
+    Returns:
+        dict: A report of the run, with the keys:
+            'region' - The region searched.
+            'dry_run' - True if no instances were terminated.
+            'instances' - For each instance found, a dict of its 'id', 'name' and 'launch_time'.
+            'terminated' - The ids of the instances terminated.
+            'batches' - The number of TerminateInstances requests made.
+            'seconds' - How long the run took.
+            'instances_per_second' - The number of instances found per second.
+    """
+    start = time.time()
+    batch_size = max(1, int(batch_size))
+    conn = ec2_connection(region)
+    report = {'region': region, 'dry_run': dry_run, 'instances': [], 'terminated': [], 'batches': 0}
+    batch = []
+
+    def _terminate_batch():
+        """
+        Terminate the instances found since the last batch.
+        """
+        if batch and not dry_run:
+            _terminate_instance_batch(conn, batch)
+            report['terminated'].extend(batch)
+            report['batches'] += 1
+            LOG.info("Terminated {} instances in {}.".format(len(batch), region))
+        del batch[:]
+
+    for instance in _reapable_instances(conn, tags, max_run_hours, skip_if_tag):
+        report['instances'].append({
+            'id': instance.id,
+            'name': instance.tags.get('Name'),
+            'launch_time': instance.launch_time,
+        })
+        batch.append(instance.id)
+        if len(batch) >= batch_size:
+            _terminate_batch()
+    _terminate_batch()
+
+    report['seconds'] = time.time() - start
+    report['instances_per_second'] = len(report['instances']) / report['seconds'] if report['seconds'] else 0.0
+    LOG.info("{} {} instances in {} in {:.1f} seconds ({:.1f} per second).".format(
+        "Found" if dry_run else "Terminated", len(report['instances']), region,
+        report['seconds'], report['instances_per_second']
+    ))
+    return report
+
+
+def reap_instances_in_regions(regions, tags, max_run_hours, skip_if_tag, dry_run=False,
+                              batch_size=INSTANCES_PER_TERMINATE_REQUEST, max_workers=None):
+    """
+    Run reap_instances in several regions at the same time.
+
+    Arguments:
+        regions (list(str)): The ec2 regions to search for instances.
+        max_workers (int): Most regions to work on at once. Defaults to all of them.
+        The other arguments are passed to reap_instances.
+
+    Returns:
+        list(CallResult): For each region, in the order given, either the report returned by
+            reap_instances or the error which stopped the region.
+    """
+    return run_concurrently(
+        lambda region: reap_instances(region, tags, max_run_hours, skip_if_tag, dry_run, batch_size),
+        regions,
+        max_workers or len(regions)
+    )
+
+
 def terminate_instances(region, tags, max_run_hours, skip_if_tag):
     """
     Terminates instances based on tag and the number of hours an instance has been running.
@@ -436,34 +1662,230 @@ def terminate_instances(region, tags, max_run_hours, skip_if_tag):
     Returns:
         list: of the instance IDs terminated.
     """
-    conn = boto.ec2.connect_to_region(region)
-    instances_to_terminate = []
+    return reap_instances(region, tags, max_run_hours, skip_if_tag)['terminated']
 
-    reservations = conn.get_all_instances(filters=tags)
-    for reservation in reservations:
-        for instance in reservation.instances:
-            total_run_time = datetime.utcnow() - datetime.strptime(instance.launch_time[:-1], ISO_DATE_FORMAT)
-            if total_run_time > timedelta(hours=max_run_hours) and skip_if_tag not in instance.tags:
-                instances_to_terminate.append(instance.id)
-    if len(instances_to_terminate) > 0:
-        conn.terminate_instances(instance_ids=instances_to_terminate)
-    return instances_to_terminate
 
+class _InstanceHealthTracker(object):
+    """
+    Remembers the state of each instance in a set of ASGs across polls, and how long each
+    instance spent in each state.
+    """
+    REMOVED = "Removed"
+
+    def __init__(self):
+        self._history = OrderedDict()
+
+    @staticmethod
+    def _is_healthy(instance):
+        """
+        Returns:
+            bool: True if AWS reports the ASG instance as healthy and in service.
+        """
+        return instance.health_status.lower() == 'healthy' and instance.lifecycle_state.lower() == 'inservice'
+
+    def _record(self, key, state, now):
+        """
+        Record the state of an instance, if it has changed since the last poll.
+        """
+        history = self._history.setdefault(key, [])
+        if not history or history[-1][0] != state:
+            history.append((state, now))
+
+    def update(self, asg):
+        """
+        Record the state of every instance in a freshly described ASG.
+
+        Arguments:
+            asg (boto.ec2.autoscale.group.AutoScalingGroup): The ASG.
+
+        Returns:
+            bool: True if every instance in the ASG is healthy.
+        """
+        now = time.time()
+        seen_instance_ids = set()
+        all_healthy = True
+        for instance in asg.instances:
+            seen_instance_ids.add(instance.instance_id)
+            self._record(
+                (asg.name, instance.instance_id), "{}/{}".format(instance.lifecycle_state, instance.health_status), now
+            )
+            if not self._is_healthy(instance):
+                all_healthy = False
+        for asg_name, instance_id in list(self._history.keys()):
+            if asg_name == asg.name and instance_id not in seen_instance_ids:
+                self._record((asg_name, instance_id), self.REMOVED, now)
+        return all_healthy
+
+    def pending_instances(self, asg_names):
+        """
+        Returns:
+            int: The number of instances in the ASGs last seen in a state other than healthy and in service.
+        """
+        return len([
+            key for key, history in six.iteritems(self._history)
+            if key[0] in asg_names and history[-1][0].lower() not in ('inservice/healthy', self.REMOVED.lower())
+        ])
+
+    def report(self, asg_names):
+        """
+        Describe how long each instance in the ASGs spent in each state.
+
+        Returns:
+            list(str): One line per instance.
+        """
+        now = time.time()
+        lines = []
+        for (asg_name, instance_id), history in six.iteritems(self._history):
+            if asg_name not in asg_names:
+                continue
+            ends = [since for __, since in history[1:]] + [now]
+            durations = ", ".join(
+                "{} for {:.0f}s".format(state, end - since) for (state, since), end in zip(history, ends)
+            )
+            lines.append("{} {}: {}".format(asg_name, instance_id, durations))
+        return lines
+
+
+def _in_service_poll_delay(pending_instances):
+    """
+    How long to wait before checking ASG health again: one second, plus a second for every
+    ten instances still pending, up to WAIT_SLEEP_TIME.
+    """
+    return min(WAIT_SLEEP_TIME, 1 + pending_instances // 10)
+
+
+class _LifecycleEventQueue(object):
+    """
+    Reads ASG lifecycle notifications from an SQS queue subscribed to the SNS topic of the ASGs'
+    notifications, with or without raw message delivery.
+
+    The queue is only for notifications. Nothing here sends CompleteLifecycleAction, so a
+    lifecycle hook sending to the queue would hold new instances in Pending:Wait until the
+    hook timed out.
+    """
+    # The longest wait SQS allows for a single receive.
+    MAX_RECEIVE_WAIT = 20
+
+    def __init__(self, queue):
+        """
+        Arguments:
+            queue (boto.sqs.queue.Queue): The queue receiving the notifications.
+        """
+        self.queue = queue
+        self.queue.set_message_class(RawMessage)
+
+    @classmethod
+    def connect(cls, queue_name):
+        """
+        Arguments:
+            queue_name (str): Name of the SQS queue, or None.
+
+        Returns:
+            _LifecycleEventQueue: The queue, or None if no queue is named or it does not exist.
+        """
+        if not queue_name:
+            return None
+        try:
+            queue = sqs_connection().get_queue(queue_name)
+        except BotoServerError as exc:
+            LOG.warning("Unable to find lifecycle queue '{}', polling ASGs instead: {}".format(queue_name, exc))
+            return None
+        if queue is None:
+            LOG.warning("Lifecycle queue '{}' does not exist, polling ASGs instead.".format(queue_name))
+            return None
+        return cls(queue)
+
+    @staticmethod
+    def asg_name(body):
+        """
+        Arguments:
+            body (str): The body of a queued message.
+
+        Returns:
+            str: The name of the ASG the notification is about, or None if the message is not an ASG notification.
+        """
+        try:
+            notification = json.loads(body)
+            if notification.get('Type') == 'Notification':
+                # Delivered through SNS, which wraps the original notification.
+                notification = json.loads(notification['Message'])
+            return notification.get('AutoScalingGroupName')
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return None
+
+    @staticmethod
+    def age(message):
+        """
+        Arguments:
+            message (boto.sqs.message.RawMessage): A message received with its SentTimestamp attribute.
+
+        Returns:
+            float: Seconds since the message was sent, or 0 if that is not known.
+        """
+        try:
+            return time.time() - int(message.attributes['SentTimestamp']) / 1000.0
+        except (KeyError, TypeError, ValueError):
+            return 0
+
+    def wait(self, asg_names, timeout):
+        """
+        Wait for notifications about any of the ASGs, with a single receive from the queue.
+
+        The notifications about the ASGs are deleted from the queue, as are messages which are not
+        ASG notifications or are older than ASG_LIFECYCLE_MESSAGE_MAX_AGE. Notifications about other
+        ASGs stay hidden for the queue's visibility timeout, so that they are not received again at
+        once, and are then left for whoever is waiting on them.
 
-def wait_for_in_service(all_asgs, timeout):
+        Arguments:
+            asg_names (list<str>): Names of the ASGs to wait for.
+            timeout (float): Longest time in seconds to wait, up to MAX_RECEIVE_WAIT.
+
+        Returns:
+            set(str): The names of the ASGs which had notifications. Empty if none came before the timeout.
+        """
+        wait_time = min(int(timeout), self.MAX_RECEIVE_WAIT)
+        if wait_time <= 0:
+            return set()
+        messages = self.queue.get_messages(
+            num_messages=10, wait_time_seconds=wait_time, attributes='SentTimestamp'
+        )
+        notified = set()
+        finished = []
+        for message in messages:
+            asg_name = self.asg_name(message.get_body())
+            if asg_name in asg_names:
+                notified.add(asg_name)
+                finished.append(message)
+            elif asg_name is None or self.age(message) > ASG_LIFECYCLE_MESSAGE_MAX_AGE:
+                finished.append(message)
+        if finished:
+            self.queue.delete_message_batch(finished)
+        return notified
+
+
+def wait_for_in_service(all_asgs, timeout, lifecycle_queue=ASG_LIFECYCLE_QUEUE):
     """
     Wait for the ASG and all instances in them to be healthy
     according to AWS metrics.
 
+    Only the ASGs which still have instances that are not healthy are described again on each poll,
+    and polls are further apart while many instances are pending.
+
+    If a lifecycle queue is given, ASGs are described again only when a notification about them
+    arrives, or when none has for ASG_LIFECYCLE_FALLBACK_POLL seconds. Without a queue, or if
+    reading it fails, the ASGs are polled.
+
     Arguments:
         all_asgs(list<str>): A list of ASGs we want to be healthy.
         timeout: The amount of time in seconds to wait for healthy state.
+        lifecycle_queue(str): Name of an SQS queue receiving the ASGs' lifecycle notifications.
     [
         u'test-edx-edxapp-v008',
         u'test-edx-worker-v005',
     ]
 
     Returns: Nothing if healthy, raises a timeout exception if un-healthy.
+        The exception lists how long each instance of the unhealthy ASGs spent in each state.
     """
     if len(all_asgs) == 0:
         LOG.info("No ASGs to monitor - skipping health check.")
@@ -472,18 +1894,14 @@ def wait_for_in_service(all_asgs, timeout):
     asgs_left_to_check = list(all_asgs)
     LOG.info("Waiting for ASGs to be healthy: {}".format(asgs_left_to_check))
 
+    events = _LifecycleEventQueue.connect(lifecycle_queue)
+    tracker = _InstanceHealthTracker()
+    asgs_to_describe = list(asgs_left_to_check)
     end_time = datetime.utcnow() + timedelta(seconds=timeout)
     while end_time > datetime.utcnow():
-        asgs = get_all_autoscale_groups(asgs_left_to_check)
+        asgs = get_all_autoscale_groups(asgs_to_describe)
         for asg in asgs:
-            all_healthy = True
-            for instance in asg.instances:
-                if instance.health_status.lower() != 'healthy' or instance.lifecycle_state.lower() != 'inservice':
-                    # Instance is not ready.
-                    all_healthy = False
-                    break
-
-            if all_healthy:
+            if tracker.update(asg):
                 # Then all are healthy we can stop checking this.
                 LOG.debug("All instances healthy in ASG: {}".format(asg.name))
                 LOG.debug(asgs_left_to_check)
@@ -492,9 +1910,27 @@ def wait_for_in_service(all_asgs, timeout):
         if len(asgs_left_to_check) == 0:
             return
 
-        time.sleep(1)
+        pending_instances = tracker.pending_instances(asgs_left_to_check)
+        LOG.debug("{} instances not yet healthy in ASGs: {}".format(pending_instances, asgs_left_to_check))
+        remaining = (end_time - datetime.utcnow()).total_seconds()
+        asgs_to_describe = list(asgs_left_to_check)
+        if events is not None:
+            try:
+                notified = events.wait(asgs_left_to_check, min(remaining, ASG_LIFECYCLE_FALLBACK_POLL))
+            except BotoServerError as exc:
+                LOG.warning("Unable to read lifecycle queue, polling ASGs instead: {}".format(exc))
+                events = None
+            else:
+                # With no notifications, all the ASGs are polled in case one was missed.
+                asgs_to_describe = [asg for asg in asgs_left_to_check if asg in notified] or asgs_to_describe
+                continue
+        time.sleep(max(0, min(_in_service_poll_delay(pending_instances), remaining)))
 
-    raise TimeoutException("Some instances in the following ASGs never became healthy: {}".format(asgs_left_to_check))
+    report = tracker.report(asgs_left_to_check)
+    LOG.error("Instance states while waiting for ASGs to be healthy:\n{}".format("\n".join(report)))
+    raise TimeoutException("Some instances in the following ASGs never became healthy: {}\n{}".format(
+        asgs_left_to_check, "\n".join(report)
+    ))
 
 
 def wait_for_healthy_elbs(elbs_to_monitor, timeout):
@@ -502,6 +1938,10 @@ def wait_for_healthy_elbs(elbs_to_monitor, timeout):
     Wait for all instances in all ELBs listed to be healthy. Raise a
     timeout exception if they don't become healthy.
 
+    The health of every remaining ELB is checked concurrently on each round, using up to
+    ELB_HEALTH_CONCURRENCY threads. Their calls share the ELB rate limiter, which slows all of
+    them down when AWS throttles any one.
+
     Arguments:
         elbs_to_monitor(list<str>): Names of ELBs that we are monitoring.
         timeout: Timeout in seconds of how long to wait.
@@ -512,51 +1952,53 @@ def wait_for_healthy_elbs(elbs_to_monitor, timeout):
     Raises:
         TimeoutException: We we have run out of time.
     """
+    if len(elbs_to_monitor) == 0:
+        LOG.info("No ELBs to monitor - skipping health check.")
+        return
 
     @backoff.on_exception(backoff.expo,
                           BotoServerError,
                           max_tries=MAX_ATTEMPTS,
                           giveup=giveup_if_not_throttling,
                           factor=RETRY_FACTOR)
-    def _get_elb_health(selected_elb):
+    def _get_elb_health(elb_name):
         """
         Get the health of an ELB
 
         Args:
-            selected_elb (boto.ec2.elb.loadbalancer.LoadBalancer):
+            elb_name (str): The name of the ELB.
 
         Returns:
             list of InstanceState <boto.ec2.elb.instancestate.InstanceState>
 
         """
-        return selected_elb.get_instance_health()
-
-    if len(elbs_to_monitor) == 0:
-        LOG.info("No ELBs to monitor - skipping health check.")
-        return
+        return elb_connection().describe_instance_health(elb_name)
 
     elbs_left = set(elbs_to_monitor)
     end_time = datetime.utcnow() + timedelta(seconds=timeout)
-    while end_time > datetime.utcnow():
-        elbs = get_all_load_balancers(elbs_left)
-        for elb in elbs:
-            LOG.info("Checking health for ELB: {}".format(elb.name))
-            all_healthy = True
-            for instance in _get_elb_health(elb):
-                if instance.state != 'InService':
-                    all_healthy = False
-                    break
-
-            if all_healthy:
-                LOG.info("All instances are healthy, remove {} from list of load balancers {}.".format(
-                    elb.name, elbs_left
-                ))
-                elbs_left.remove(elb.name)
-
-        LOG.info("Number of load balancers remaining with unhealthy instances: {}".format(len(elbs_left)))
-        if len(elbs_left) == 0:
-            LOG.info("All instances in all ELBs are healthy, returning.")
-            return
-        time.sleep(WAIT_SLEEP_TIME)
+    # The same threads, and so the same connections, are used for every round of checks.
+    executor = ThreadPoolExecutor(max_workers=max(1, min(ELB_HEALTH_CONCURRENCY, len(elbs_left))))
+    try:
+        while end_time > datetime.utcnow():
+            LOG.info("Checking health for ELBs: {}".format(sorted(elbs_left)))
+            health_results = run_concurrently(
+                _get_elb_health, sorted(elbs_left), ELB_HEALTH_CONCURRENCY, executor=executor
+            )
+            for elb_name, instance_states, error in health_results:
+                if error is not None:
+                    raise error
+                if all(instance.state == 'InService' for instance in instance_states):
+                    LOG.info("All instances are healthy, remove {} from list of load balancers {}.".format(
+                        elb_name, elbs_left
+                    ))
+                    elbs_left.remove(elb_name)
+
+            LOG.info("Number of load balancers remaining with unhealthy instances: {}".format(len(elbs_left)))
+            if len(elbs_left) == 0:
+                LOG.info("All instances in all ELBs are healthy, returning.")
+                return
+            time.sleep(WAIT_SLEEP_TIME)
+    finally:
+        executor.shutdown(wait=True)
 
     raise TimeoutException("The following ELBs never became healthy: {}".format(elbs_left))
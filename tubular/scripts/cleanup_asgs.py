@@ -8,8 +8,15 @@ from __future__ import absolute_import
 from __future__ import unicode_literals
 
 from os import path
+import io
+import json
+import os
+import subprocess
 import sys
 import logging
+import tempfile
+import threading
+import time
 import traceback
 import click
 
@@ -17,25 +24,174 @@ import click
 sys.path.append(path.dirname(path.dirname(path.abspath(__file__))))
 
 from tubular import asgard  # pylint: disable=wrong-import-position
-from tubular.ec2 import get_asgs_pending_delete  # pylint: disable=wrong-import-position
+from tubular.ec2 import get_asg_names_pending_delete  # pylint: disable=wrong-import-position
+from tubular.utils.concurrency import run_concurrently  # pylint: disable=wrong-import-position
 
 logging.basicConfig(stream=sys.stdout, level=logging.INFO)
 
 
+def _write_summary(summary_file, summary):
+    """
+    Write the summary of a cleanup run as JSON.
+    """
+    with io.open(summary_file, 'w') as stream:
+        stream.write(json.dumps(summary, indent=2, sort_keys=True))
+
+
+def _read_summary(summary_file):
+    """
+    Read the summary of a cleanup run, or None if there is none.
+    """
+    if not path.exists(summary_file):
+        return None
+    with io.open(summary_file, 'r') as stream:
+        return json.load(stream)
+
+
+def _cleanup_region(region, asgard_endpoint, parallelism, time_budget, summary_file, resume):
+    """
+    Run the cleanup of a single region in a separate process, so that it uses its own Asgard endpoint
+    and cannot disturb the cleanup of other regions.
+
+    Returns:
+        dict: The region's summary, along with the 'exit_code' and 'seconds' taken by its process.
+    """
+    args = [sys.executable, path.abspath(__file__), '--region', region, '--parallelism', str(parallelism)]
+    if time_budget is not None:
+        args.extend(['--time-budget', str(time_budget)])
+    if summary_file:
+        region_summary_file = "{}.{}".format(summary_file, region)
+    else:
+        handle, region_summary_file = tempfile.mkstemp(suffix='.json', prefix='cleanup_asgs_{}_'.format(region))
+        os.close(handle)
+        os.remove(region_summary_file)
+    args.extend(['--summary-file', region_summary_file])
+    if resume:
+        args.append('--resume')
+
+    env = dict(os.environ, ASGARD_API_ENDPOINTS=asgard_endpoint)
+    start = time.time()
+    exit_code = subprocess.call(args, env=env)
+    seconds = time.time() - start
+
+    summary = _read_summary(region_summary_file) or {'deleted': [], 'skipped': [], 'failed': []}
+    if not summary_file and path.exists(region_summary_file):
+        os.remove(region_summary_file)
+    summary.update({'asgard_endpoint': asgard_endpoint, 'exit_code': exit_code, 'seconds': seconds})
+    click.echo("Region {}: deleted {}, skipped {}, failed {} ASG(s) in {:.1f} seconds (exit code {}).".format(
+        region, len(summary['deleted']), len(summary['skipped']), len(summary['failed']), seconds, exit_code
+    ))
+    return summary
+
+
+def _cleanup_regions(regions, asgard_endpoints, parallelism, time_budget, summary_file, resume):
+    """
+    Clean up every region at the same time, each against its own Asgard endpoint.
+
+    Returns:
+        bool: True if the cleanup of any region failed.
+    """
+    results = run_concurrently(
+        lambda region_endpoint: _cleanup_region(
+            region_endpoint[0], region_endpoint[1], parallelism, time_budget, summary_file, resume
+        ),
+        list(zip(regions, asgard_endpoints)),
+        len(regions)
+    )
+    report = {'regions': {}}
+    error = False
+    for (region, __), summary, err in results:
+        if err is not None:
+            click.secho("Unable to clean up ASGs in {0} - {1}".format(region, err), fg='red')
+            summary = {'error': "{}".format(err)}
+        error = error or err is not None or summary['exit_code'] != 0
+        report['regions'][region] = summary
+    if summary_file:
+        _write_summary(summary_file, report)
+    return error
+
+
 @click.command()
-def delete_asg():
+@click.option(
+    '--region',
+    'regions',
+    multiple=True,
+    help='AWS region whose ASGs are deleted. May be given several times to clean up regions at the same time.'
+)
+@click.option(
+    '--asgard-endpoint',
+    'asgard_endpoints',
+    multiple=True,
+    help='Asgard API endpoint of each --region, in the same order. Defaults to ASGARD_API_ENDPOINTS.'
+)
+@click.option(
+    '--parallelism',
+    type=int,
+    default=1,
+    help='Number of ASGs to delete at the same time.'
+)
+@click.option(
+    '--time-budget',
+    type=float,
+    default=None,
+    help='Seconds after which no more ASG deletes are started.'
+)
+@click.option(
+    '--summary-file',
+    default=None,
+    help='File to which a JSON summary of the deleted, skipped and failed ASGs is written as the run goes.'
+)
+@click.option(
+    '--resume',
+    is_flag=True,
+    default=False,
+    help='Do not delete again the ASGs which the summary file of an earlier run records as deleted.'
+)
+def delete_asg(regions, asgard_endpoints, parallelism, time_budget, summary_file, resume):
     """
     Method to delete AWS Auto-Scaling Groups via Asgard that are tagged for deletion.
+
+    The ASGs which have been due for deletion the longest are deleted first. When several regions,
+    or a region with its own Asgard endpoint, are given, each region is cleaned up in its own process
+    at the same time, and the summary file records the outcome and timing of each region.
     """
+    if resume and not summary_file:
+        click.secho("--resume needs the --summary-file of the run to resume.", fg='red')
+        sys.exit(1)
+    if (asgard_endpoints or len(regions) > 1) and len(asgard_endpoints) != len(regions):
+        click.secho("Give one --asgard-endpoint for each --region.", fg='red')
+        sys.exit(1)
+
+    if asgard_endpoints:
+        error = _cleanup_regions(regions, asgard_endpoints, parallelism, time_budget, summary_file, resume)
+        sys.exit(1 if error else 0)
+
     error = False
     try:
-        asgs = get_asgs_pending_delete()
-        for asg in asgs:
-            try:
-                asgard.delete_asg(asg.name)
-            except Exception as e:  # pylint: disable=broad-except
-                click.secho("Unable to delete ASG: {0} - {1}".format(asg, e), fg='red')
-                error = True
+        already_deleted = []
+        if resume:
+            already_deleted = (_read_summary(summary_file) or {}).get('deleted', [])
+
+        region = regions[0] if regions else None
+        asgs = [
+            asg_name for asg_name in get_asg_names_pending_delete(region=region) if asg_name not in already_deleted
+        ]
+        summary = {'deleted': list(already_deleted), 'skipped': [], 'failed': []}
+        summary_lock = threading.Lock()
+
+        def _record(outcome, entry):
+            """
+            Record the outcome for an ASG, and write the summary so far so that an interrupted run can be resumed.
+            """
+            if outcome == 'failed':
+                click.secho("Unable to delete ASG: {0} - {1}".format(entry['asg'], entry['error']), fg='red')
+            with summary_lock:
+                summary[outcome].append(entry)
+                if summary_file:
+                    _write_summary(summary_file, summary)
+
+        asgard.delete_asgs(asgs, parallelism, time_budget, on_result=_record)
+        error = bool(summary['failed'])
     except Exception as e:  # pylint: disable=broad-except
         traceback.print_exc()
         click.secho("An error occured while cleaning up ASGs: {0}".format(e), fg='red')
@@ -47,4 +203,4 @@ def delete_asg():
         sys.exit(0)
 
 if __name__ == "__main__":
-    delete_asg()
+    delete_asg()  # pylint: disable=no-value-for-parameter
@@ -6,8 +6,11 @@ Command-line script used to delete AWS EC2 instances that have been leftover fro
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
+import io
+import json
 import sys
 import logging
+import time
 import traceback
 import click
 
@@ -20,8 +23,10 @@ LOG = logging.getLogger(__name__)
 @click.command()
 @click.option(
     '--region',
-    help='aws region',
-    default='us-east-1',
+    'regions',
+    help='aws region. May be given several times to clean up regions at the same time',
+    default=['us-east-1'],
+    multiple=True,
     type=str
 )
 @click.option(
@@ -42,26 +47,75 @@ LOG = logging.getLogger(__name__)
     help='String used to filter the name of instances to terminate',
     type=str,
 )
-def terminate_instances(region,
+@click.option(
+    '--batch_size',
+    default=ec2.INSTANCES_PER_TERMINATE_REQUEST,
+    help='Number of instances to terminate with each request',
+    type=int,
+)
+@click.option(
+    '--dry_run',
+    is_flag=True,
+    default=False,
+    help='Find the instances which would be terminated, but do not terminate them',
+)
+@click.option(
+    '--manifest_file',
+    default=None,
+    help='File to which a JSON list of the instances found, and those terminated, is written',
+    type=str,
+)
+def terminate_instances(regions,
                         max_run_hours,
                         skip_if_tag,
-                        name_filter):
+                        name_filter,
+                        batch_size,
+                        dry_run,
+                        manifest_file):
     """
     Delete AWS EC2 instances that have been leftover from incomplete gocd runs
 
     Args:
-        region (str):
+        regions (list(str)):
         max_run_hours (int):
         skip_if_tag (str):
         name_filter (str):
+        batch_size (int):
+        dry_run (bool):
+        manifest_file (str):
 
     """
+    error = False
+    start = time.time()
     try:
-        terminated_instances = ec2.terminate_instances(region, {'tag:Name': name_filter}, max_run_hours, skip_if_tag)
-        logging.info("terminated instances: {}".format(terminated_instances))
+        results = ec2.reap_instances_in_regions(
+            regions, {'tag:Name': name_filter}, max_run_hours, skip_if_tag, dry_run=dry_run, batch_size=batch_size
+        )
+        manifest = {'regions': {}}
+        for region, report, region_error in results:
+            if region_error is not None:
+                # A failure in one region does not stop the others.
+                click.secho('Error terminating instances in {}.\nMessage: {}'.format(region, region_error), fg='red')
+                manifest['regions'][region] = {'error': '{}'.format(region_error)}
+                error = True
+                continue
+            manifest['regions'][region] = report
+            if dry_run:
+                logging.info("instances which would be terminated in {}: {}".format(
+                    region, [inst['id'] for inst in report['instances']]
+                ))
+            else:
+                logging.info("terminated instances in {}: {}".format(region, report['terminated']))
+        manifest['seconds'] = time.time() - start
+        if manifest_file:
+            with io.open(manifest_file, 'w') as stream:
+                stream.write(json.dumps(manifest, indent=2, sort_keys=True))
     except Exception as err:  # pylint: disable=broad-except
         traceback.print_exc()
-        click.secho('Error finding base AMI ID.\nMessage: {}'.format(err), fg='red')
+        click.secho('Error terminating instances.\nMessage: {}'.format(err), fg='red')
+        sys.exit(1)
+
+    if error:
         sys.exit(1)
 
 
@@ -24,6 +24,52 @@ from tubular import ec2  # pylint: disable=wrong-import-position
 logging.basicConfig(level=logging.INFO)
 
 
+def _ami_info(ami_id, ami_tags):
+    """
+    Build the AMI information yaml document for an AMI.
+    """
+    ami_info = {
+        # This is passed directly to an ansible script that expects a base_ami_id variable
+        'base_ami_id': ami_id,
+        # This matches the key produced by the create_ami.yml ansible play to make
+        # generating release pages easier.
+        'ami_id': ami_id,
+    }
+    ami_info.update(ami_tags)
+    return ami_info
+
+
+def _retrieve_base_amis(edps, out_file):
+    """
+    Retrieve the last base AMI ID used for each of several environment/deployment/plays,
+    writing one AMI information yaml document per EDP.
+
+    Returns:
+        bool: True if a base AMI was found for every EDP.
+    """
+    results = ec2.active_amis_for_edps(edps)
+    tags_by_ami = ec2.tags_for_amis([ami_id for __, ami_id, error in results if error is None])
+
+    found_all = True
+    ami_infos = []
+    for edp, ami_id, error in results:
+        if error is None and ami_id not in tags_by_ami:
+            error = "AMI {} not found.".format(ami_id)
+        if error is not None:
+            click.secho('Error finding base AMI ID for {}.\nMessage: {}'.format("-".join(edp), error), fg='red')
+            found_all = False
+            continue
+        logging.info("Found active AMI ID for {}: {}".format("-".join(edp), ami_id))
+        ami_infos.append(_ami_info(ami_id, tags_by_ami[ami_id]))
+
+    if out_file:
+        with io.open(out_file, 'w') as stream:
+            yaml.safe_dump_all(ami_infos, stream, default_flow_style=False, explicit_start=True)
+    else:
+        print(yaml.safe_dump_all(ami_infos, default_flow_style=False, explicit_start=True))
+    return found_all
+
+
 @click.command()
 @click.option(
     '--environment', '-e',
@@ -37,6 +83,14 @@ logging.basicConfig(level=logging.INFO)
     '--play', '-p',
     help='Play for AMI, e.g. edxapp, insights, discovery',
 )
+@click.option(
+    '--edp', 'edps',
+    nargs=3,
+    multiple=True,
+    metavar='ENVIRONMENT DEPLOYMENT PLAY',
+    help='An environment, deployment and play for which to retrieve the base AMI. '
+         'May be given many times, in which case one yaml document is written per EDP.',
+)
 @click.option(
     '--override',
     help='Override AMI id to use',
@@ -46,12 +100,24 @@ logging.basicConfig(level=logging.INFO)
     help='Output file for the AMI information yaml.',
     default=None
 )
-def retrieve_base_ami(environment, deployment, play, override, out_file):
+def retrieve_base_ami(environment, deployment, play, edps, override, out_file):
     """
     Method used to retrieve the last base AMI ID used for an environment/deployment/play.
     """
 
     has_edp = environment is not None or deployment is not None or play is not None
+    if edps:
+        if has_edp or override is not None:
+            logging.error("--edp is mutually exclusive with --environment, --deployment, --play and --override.")
+            sys.exit(1)
+        try:
+            found_all = _retrieve_base_amis(edps, out_file)
+        except Exception as err:  # pylint: disable=broad-except
+            traceback.print_exc()
+            click.secho('Error finding base AMI IDs.\nMessage: {}'.format(err), fg='red')
+            sys.exit(1)
+        sys.exit(0 if found_all else 1)
+
     if has_edp and override is not None:
         logging.error("--environment, --deployment and --play are mutually exclusive with --override.")
         sys.exit(1)
@@ -66,14 +132,7 @@ def retrieve_base_ami(environment, deployment, play, override, out_file):
         else:
             ami_id = ec2.active_ami_for_edp(environment, deployment, play)
 
-        ami_info = {
-            # This is passed directly to an ansible script that expects a base_ami_id variable
-            'base_ami_id': ami_id,
-            # This matches the key produced by the create_ami.yml ansible play to make
-            # generating release pages easier.
-            'ami_id': ami_id,
-        }
-        ami_info.update(ec2.tags_for_ami(ami_id))
+        ami_info = _ami_info(ami_id, ec2.tags_for_ami(ami_id))
         logging.info("Found active AMI ID for {env}-{dep}-{play}: {ami_id}".format(
             env=environment, dep=deployment, play=play, ami_id=ami_id
         ))
@@ -5,10 +5,12 @@ from __future__ import absolute_import
 from __future__ import unicode_literals
 
 import os
+import threading
 import unittest
 import itertools
 import boto
 import mock
+import requests
 import requests_mock
 
 from ddt import ddt, data, unpack
@@ -23,8 +25,9 @@ from tubular.exception import (
     CannotDeleteLastASG,
     ASGDoesNotExistException
 )
-from tubular.tests.test_utils import create_asg_with_tags, create_elb
+from tubular.tests.test_utils import create_asg_with_tags, create_elb, describe_asg_tags_with_moto
 from tubular.ec2 import tag_asg_for_deletion
+from tubular.utils import EDP
 
 # Disable the retry decorator and reload the asgard module. This will ensure that tests do not fail because of the retry
 # decorator recalling a method when using httpretty with side effect iterators
@@ -343,6 +346,13 @@ class TestAsgard(unittest.TestCase):
     """
     _multiprocess_can_split_ = True
 
+    def setUp(self):
+        super(TestAsgard, self).setUp()
+        describe_tags_patcher = mock.patch('tubular.ec2.describe_asg_tags', side_effect=describe_asg_tags_with_moto)
+        describe_tags_patcher.start()
+        self.addCleanup(describe_tags_patcher.stop)
+        asgard.ec2.reset_connections()
+
     def test_bad_clusters_endpoint(self, _req_mock):
         relevant_asgs = []
         self.assertRaises(requests_mock.NoMockAddress, asgard.clusters_for_asgs, relevant_asgs)
@@ -373,6 +383,24 @@ class TestAsgard(unittest.TestCase):
             cluster_names['loadtest-edx-edxapp']
         )
 
+    def test_cluster_index(self, req_mock):
+        cluster_list_mock = req_mock.get(
+            asgard.CLUSTER_LIST_URL,
+            json=SAMPLE_CLUSTER_LIST)
+
+        with asgard._INFO_CACHE.scope():  # pylint: disable=protected-access
+            index = asgard.cluster_index()
+            self.assertIs(index, asgard.cluster_index())
+            self.assertEqual(
+                ["loadtest-edx-edxapp", "loadtest-edx-worker"],
+                sorted(asgard.clusters_for_asgs(
+                    ["loadtest-edx-worker-v034", "loadtest-edx-edxapp-v059", "loadtest-edx-edxapp-v058", "unknown"]
+                ))
+            )
+        self.assertEqual(1, cluster_list_mock.call_count)
+        self.assertEqual(["loadtest-edx-insights"], index.clusters_by_asg["loadtest-edx-insights-v002"])
+        self.assertEqual({}, index.clusters_for_asgs(["unknown"]))
+
     def test_clusters_for_asgs_bad_response(self, req_mock):
         req_mock.get(
             asgard.CLUSTER_LIST_URL,
@@ -428,6 +456,20 @@ class TestAsgard(unittest.TestCase):
 
         self.assertRaises(BackendError, asgard.asgs_for_cluster, cluster)
 
+    def test_client_attaches_token(self, req_mock):
+        req_mock.get(
+            asgard.CLUSTER_LIST_URL,
+            json=SAMPLE_CLUSTER_LIST)
+
+        client = asgard.AsgardClient(api_token='other-token', pool_maxsize=2)
+        asgard.set_client(client)
+        try:
+            asgard.clusters_for_asgs(["loadtest-edx-worker-v034"])
+        finally:
+            asgard.set_client(None)
+
+        self.assertEqual({'asgardapitoken': ['other-token']}, req_mock.last_request.qs)
+
     def test_elbs_for_asg(self, req_mock):
         asg_info_url = asgard.ASG_INFO_URL.format("test_asg")
         req_mock.get(
@@ -507,6 +549,73 @@ class TestAsgard(unittest.TestCase):
 
         self.assertRaises(TimeoutException, asgard.wait_for_task_completion, task_url, 1)
 
+    def test_tasks_completion(self, req_mock):
+        completed_url = "http://some.host/task/1234"
+        failed_url = "http://some.host/task/5678"
+        req_mock.get(completed_url + ".json", json=COMPLETED_SAMPLE_TASK)
+        req_mock.get(
+            failed_url + ".json",
+            [
+                dict(json=RUNNING_SAMPLE_TASK),
+                dict(json=FAILED_SAMPLE_TASK),
+            ])
+
+        with mock.patch('tubular.asgard.ASGARD_TASK_POLL_INITIAL', 0.01):
+            actual_output = asgard.wait_for_tasks_completion([completed_url, failed_url], 2, label="testing")
+
+        self.assertEqual({completed_url: COMPLETED_SAMPLE_TASK, failed_url: FAILED_SAMPLE_TASK}, actual_output)
+        # The completed task is not polled again while waiting for the other task.
+        self.assertEqual(1, len([req for req in req_mock.request_history if req.url.startswith(completed_url)]))
+        self.assertEqual(2, asgard.task_latency_stats()["testing"]["count"])
+
+    def test_tasks_timeout(self, req_mock):
+        req_mock.get("http://some.host/task/1234.json", json=COMPLETED_SAMPLE_TASK)
+        req_mock.get("http://some.host/task/5678.json", json=RUNNING_SAMPLE_TASK)
+
+        with self.assertRaisesRegexp(TimeoutException, "5678") as context:
+            asgard.wait_for_tasks_completion(["http://some.host/task/1234", "http://some.host/task/5678"], 1)
+        self.assertNotIn("1234", str(context.exception))
+
+    def test_task_watcher(self, req_mock):
+        req_mock.get("http://some.host/task/1.json", [dict(json=RUNNING_SAMPLE_TASK), dict(json=COMPLETED_SAMPLE_TASK)])
+        req_mock.get("http://some.host/task/2.json", json=FAILED_SAMPLE_TASK)
+        req_mock.get("http://some.host/task/3.json", text=HTML_RESPONSE_BODY)
+        req_mock.get("http://some.host/task/4.json", json=RUNNING_SAMPLE_TASK)
+
+        finished = []
+        with mock.patch('tubular.asgard.ASGARD_TASK_POLL_INITIAL', 0.01):
+            watcher = asgard.TaskWatcher(60)
+            futures = [
+                watcher.submit("http://some.host/task/{}".format(task_id), callback=finished.append)
+                for task_id in range(1, 4)
+            ]
+            futures.append(watcher.submit("http://some.host/task/4", timeout=0.1))
+            completed = list(watcher.as_completed())
+
+        # Tasks are reported as soon as they finish, rather than in the order they were submitted.
+        self.assertEqual([futures[1], futures[2], futures[0], futures[3]], completed)
+        self.assertEqual(futures[:3], sorted(finished, key=futures.index))
+        self.assertEqual(COMPLETED_SAMPLE_TASK, futures[0].result())
+        self.assertEqual(FAILED_SAMPLE_TASK, futures[1].result())
+        self.assertIsInstance(futures[2].exception(), BackendError)
+        self.assertIsInstance(futures[3].exception(), TimeoutException)
+
+    @data(
+        ([RUNNING_SAMPLE_TASK], True, 60),
+        ([RUNNING_SAMPLE_TASK], False, 1.5),
+        ([RUNNING_SAMPLE_TASK, COMPLETED_SAMPLE_TASK], True, 1.5),
+        ([], True, 1.5),
+    )
+    @unpack
+    def test_next_poll_delay(self, running_tasks, use_task_log, expected_delay, _req_mock):
+        with mock.patch('tubular.asgard.WAIT_SLEEP_TIME', 60):
+            delay = asgard._next_poll_delay(1, running_tasks, use_task_log)  # pylint: disable=protected-access
+            self.assertEqual(expected_delay, delay)
+
+    def test_next_poll_delay_capped(self, _req_mock):
+        with mock.patch('tubular.asgard.WAIT_SLEEP_TIME', 5):
+            self.assertEqual(5, asgard._next_poll_delay(4, [], False))  # pylint: disable=protected-access
+
     def test_new_asg(self, req_mock):
         task_url = "http://some.host/task/1234.json"
         cluster = "loadtest-edx-edxapp"
@@ -751,6 +860,69 @@ class TestAsgard(unittest.TestCase):
         else:
             self.assertRaises(BackendError, asgard.delete_asg, asg, False)
 
+    def test_delete_asgs(self, _req_mock):
+        pending_delete = {"asg-pending"}
+        deleted = []
+
+        def _delete_asg(asg):
+            """
+            Fail to delete the active ASG only.
+            """
+            if asg == "asg-active":
+                raise CannotDeleteActiveASG("Not deleting ASG {} as it is currently active.".format(asg))
+            deleted.append(asg)
+
+        results = []
+        with mock.patch('tubular.asgard.is_asg_pending_delete', side_effect=pending_delete.__contains__):
+            with mock.patch('tubular.asgard.delete_asg', side_effect=_delete_asg):
+                summary = asgard.delete_asgs(
+                    ["asg-old", "asg-pending", "asg-active", "asg-new"],
+                    max_workers=2,
+                    on_result=lambda outcome, entry: results.append(outcome),
+                )
+
+        self.assertEqual(["asg-old", "asg-new"], summary['deleted'])
+        self.assertEqual([{'asg': "asg-pending", 'reason': "Already pending deletion."}], summary['skipped'])
+        self.assertEqual(["asg-active"], [failure['asg'] for failure in summary['failed']])
+        self.assertIn("currently active", summary['failed'][0]['error'])
+        self.assertEqual(4, len(results))
+
+    def test_delete_asgs_checks_pending_delete_once(self, req_mock):
+        asg = "loadtest-edx-edxapp-v060"
+        self._mock_asgard_not_pending_delete(req_mock, [asg], json_builder=disabled_asg)
+
+        with mock.patch('tubular.asgard.is_asg_pending_delete', return_value=False) as mock_pending_delete, \
+                mock.patch('tubular.asgard.is_last_asg', return_value=False), \
+                mock.patch('tubular.asgard._run_asg_task'):
+            summary = asgard.delete_asgs([asg])
+
+        self.assertEqual([asg], summary['deleted'])
+        mock_pending_delete.assert_called_once_with(asg)
+
+    def test_delete_asgs_on_result_error(self, _req_mock):
+        def _on_result(_outcome, entry):
+            """
+            Fail to record the first ASG only.
+            """
+            if entry == "asg-1":
+                raise IOError("Unable to write summary.")
+
+        with mock.patch('tubular.asgard.is_asg_pending_delete', return_value=False):
+            with mock.patch('tubular.asgard.delete_asg'):
+                summary = asgard.delete_asgs(["asg-1", "asg-2"], on_result=_on_result)
+
+        self.assertEqual(["asg-2"], summary['deleted'])
+        self.assertEqual([{'asg': "asg-1", 'error': "Unable to write summary."}], summary['failed'])
+
+    def test_delete_asgs_time_budget(self, _req_mock):
+        with mock.patch('tubular.asgard.is_asg_pending_delete', return_value=False):
+            with mock.patch('tubular.asgard.delete_asg') as mock_delete_asg:
+                summary = asgard.delete_asgs(["asg-1", "asg-2"], time_budget=0)
+
+        mock_delete_asg.assert_not_called()
+        self.assertEqual([], summary['deleted'])
+        self.assertEqual(["asg-1", "asg-2"], [skipped['asg'] for skipped in summary['skipped']])
+
     def test_delete_asg_active(self, req_mock):
         asg = "loadtest-edx-edxapp-v060"
         self._mock_asgard_not_pending_delete(req_mock, [asg], json_builder=enabled_asg)
@@ -1044,6 +1216,71 @@ class TestAsgard(unittest.TestCase):
         )
         self.assertRaises(Exception, asgard.deploy, ami_id)
 
+    @mock_autoscaling
+    @mock_ec2
+    @mock_elb
+    def test_deploy_asg_failed_reports_created_clusters(self, req_mock):
+        ami_id = self._setup_for_deploy(req_mock)
+
+        def _new_asg(cluster, __):
+            """
+            Fail to create an ASG in the worker cluster only.
+            """
+            if cluster == "loadtest-edx-worker":
+                raise BackendError("Failure during new ASG creation.")
+            return "{}-v099".format(cluster)
+
+        with mock.patch('tubular.asgard.new_asg', side_effect=_new_asg):
+            with mock.patch('tubular.asgard.LOG') as mock_log:
+                self.assertRaises(BackendError, asgard.deploy, ami_id, new_asg_concurrency=2)
+
+        self.assertEqual(1, mock_log.error.call_count)
+        error_msg = mock_log.error.call_args[0][0]
+        self.assertIn("failed for cluster 'loadtest-edx-worker'", error_msg)
+        self.assertIn("loadtest-edx-edxapp", error_msg)
+
+    def test_deploy_many(self, _req_mock):
+        edps = {
+            "ami-1": EDP("loadtest", "edx", "edxapp"),
+            "ami-2": EDP("loadtest", "edx", "worker"),
+            "ami-3": EDP("prod", "edx", "edxapp"),
+        }
+        started = threading.Barrier(len(edps), timeout=5)
+
+        def _deploy(ami_id):
+            """
+            Succeed only once every deploy has started, proving that they run at the same time.
+            """
+            started.wait()
+            if ami_id == "ami-3":
+                raise BackendError("Failure during deploy.")
+            return {'ami_id': ami_id}
+
+        with mock.patch('tubular.asgard.ec2.edp_for_ami', side_effect=edps.get):
+            with mock.patch('tubular.asgard.deploy', side_effect=_deploy):
+                with mock.patch('tubular.asgard.LOG') as mock_log:
+                    self.assertRaises(BackendError, asgard.deploy_many, sorted(edps), deploy_concurrency=3)
+
+        self.assertEqual(1, mock_log.error.call_count)
+        error_msg = mock_log.error.call_args[0][0]
+        self.assertIn("failed for AMI 'ami-3'", error_msg)
+        self.assertIn("ami-2", error_msg)
+
+    def test_deploy_many_results(self, _req_mock):
+        with mock.patch('tubular.asgard.ec2.edp_for_ami', side_effect=lambda ami_id: EDP(ami_id, "edx", "edxapp")):
+            with mock.patch('tubular.asgard.deploy', side_effect=lambda ami_id: {'ami_id': ami_id}):
+                self.assertEqual(
+                    {"ami-1": {'ami_id': "ami-1"}, "ami-2": {'ami_id': "ami-2"}},
+                    asgard.deploy_many(["ami-1", "ami-2"])
+                )
+
+    def test_deploy_many_same_edp(self, _req_mock):
+        edp = EDP("loadtest", "edx", "edxapp")
+        with mock.patch('tubular.asgard.ec2.edp_for_ami', return_value=edp):
+            with mock.patch('tubular.asgard.deploy') as mock_deploy:
+                self.assertRaises(BackendError, asgard.deploy_many, ["ami-1", "ami-2"])
+        mock_deploy.assert_not_called()
+
     @mock_autoscaling
     @mock_ec2
     @mock_elb
@@ -1083,8 +1320,7 @@ class TestAsgard(unittest.TestCase):
             req_mock.get(
                 url,
                 [
-                    dict(json=deleted_asg_not_in_progress(asg),
-                         status_code=200),
+                    # The pending delete and enabled checks share a single lookup of the ASG.
                     dict(json=deleted_asg_not_in_progress(asg),
                          status_code=200),
                     dict(json=enabled_asg(asg),
@@ -1242,8 +1478,7 @@ class TestAsgard(unittest.TestCase):
                 url,
                 [
                     # Start disabled and end enabled.
-                    dict(json=disabled_asg(asg),
-                         status_code=200),
+                    # The pending delete and enabled checks share a single lookup of the ASG.
                     dict(json=disabled_asg(asg),
                          status_code=200),
                     dict(json=enabled_asg(asg),
@@ -1282,8 +1517,7 @@ class TestAsgard(unittest.TestCase):
                 url,
                 [
                     # Start disabled and end enabled.
-                    dict(json=disabled_asg(asg),
-                         status_code=200),
+                    # The pending delete and enabled checks share a single lookup of the ASG.
                     dict(json=disabled_asg(asg),
                          status_code=200),
                     dict(json=enabled_asg(asg),
@@ -1441,10 +1675,14 @@ class TestAsgard(unittest.TestCase):
         }
 
         # Rollback and check output.
-        self.assertEqual(
-            asgard.rollback(rollback_input['current_asgs'], rollback_input['rollback_to_asgs'], self.test_ami_id),
-            expected_output
-        )
+        load_index = asgard.ec2.PendingDeleteIndex.load
+        with mock.patch('tubular.ec2.PendingDeleteIndex.load', wraps=load_index) as mock_load_index:
+            self.assertEqual(
+                asgard.rollback(rollback_input['current_asgs'], rollback_input['rollback_to_asgs'], self.test_ami_id),
+                expected_output
+            )
+        # The ASGs tagged for deletion are found from the deletion tags alone.
+        mock_load_index.assert_called_once_with()
 
     @mock_autoscaling
     @mock_ec2
@@ -1503,6 +1741,119 @@ class TestAsgard(unittest.TestCase):
             expected_output
         )
 
+    def test_red_black_deploy_concurrent(self, _req_mock):
+        new_asgs = {'cluster-a': ['cluster-a-v002'], 'cluster-b': ['cluster-b-v002']}
+        baseline_asgs = {'cluster-a': ['cluster-a-v001'], 'cluster-b': ['cluster-b-v001']}
+        # Each phase only completes if both of its ASGs are being processed at the same time.
+        enable_barrier = threading.Barrier(2, timeout=5)
+        disable_barrier = threading.Barrier(2, timeout=5)
+
+        with mock.patch('tubular.asgard.enable_asg', side_effect=lambda asg: enable_barrier.wait()), \
+                mock.patch('tubular.asgard.disable_asg', side_effect=lambda asg: disable_barrier.wait()), \
+                mock.patch('tubular.asgard.elbs_for_asg', return_value=[]), \
+                mock.patch('tubular.asgard.is_asg_pending_delete', return_value=False), \
+                mock.patch('tubular.asgard.is_asg_enabled', return_value=True), \
+                mock.patch('tubular.ec2.wait_for_healthy_elbs'), \
+                mock.patch('tubular.ec2.tag_asgs_for_deletion') as mock_tag:
+            success, enabled, disabled = asgard._red_black_deploy(  # pylint: disable=protected-access
+                new_asgs, baseline_asgs, 0, cutover_concurrency=2
+            )
+
+        self.assertTrue(success)
+        self.assertEqual(new_asgs, enabled)
+        self.assertEqual(baseline_asgs, disabled)
+        # The old ASGs are tagged for deletion with a single call.
+        mock_tag.assert_called_once_with(mock.ANY)
+        self.assertEqual(sorted(['cluster-a-v001', 'cluster-b-v001']), sorted(mock_tag.call_args[0][0]))
+
+    def test_red_black_deploy_disable_error(self, _req_mock):
+        new_asgs = {'cluster-a': ['cluster-a-v002']}
+        baseline_asgs = {'cluster-a': ['cluster-a-v001']}
+
+        def _is_asg_enabled(asg):
+            """
+            Fail to look up the old ASG.
+            """
+            if asg == 'cluster-a-v001':
+                raise BackendError("Failure while looking up ASG.")
+            return True
+
+        with mock.patch('tubular.asgard.enable_asg'), \
+                mock.patch('tubular.asgard.disable_asg'), \
+                mock.patch('tubular.asgard.elbs_for_asg', return_value=[]), \
+                mock.patch('tubular.asgard.is_asg_pending_delete', return_value=False), \
+                mock.patch('tubular.asgard.is_asg_enabled', side_effect=_is_asg_enabled), \
+                mock.patch('tubular.ec2.wait_for_healthy_elbs'), \
+                mock.patch('tubular.ec2.tag_asgs_for_deletion') as mock_tag:
+            with self.assertRaises(BackendError):
+                asgard._red_black_deploy(new_asgs, baseline_asgs, 0)  # pylint: disable=protected-access
+
+        # The old ASGs are not tagged for deletion when disabling them failed.
+        mock_tag.assert_not_called()
+
+    def test_red_black_deploy_enable_failure(self, _req_mock):
+        new_asgs = {'cluster-a': ['cluster-a-v002'], 'cluster-b': ['cluster-b-v002']}
+        baseline_asgs = {'cluster-a': ['cluster-a-v001'], 'cluster-b': ['cluster-b-v001']}
+
+        def _enable_asg(asg):
+            """
+            Fail to enable a single new ASG.
+            """
+            if asg == 'cluster-b-v002':
+                raise BackendError("Failure while enabling ASG.")
+
+        with mock.patch('tubular.asgard.enable_asg', side_effect=_enable_asg), \
+                mock.patch('tubular.asgard.disable_asg') as mock_disable, \
+                mock.patch('tubular.asgard.elbs_for_asg', return_value=[]):
+            success, enabled, disabled = asgard._red_black_deploy(  # pylint: disable=protected-access
+                new_asgs, baseline_asgs, 0, cutover_concurrency=2
+            )
+
+        # Both the ASG which failed and the ASG which was newly enabled are disabled again.
+        self.assertFalse(success)
+        self.assertEqual(baseline_asgs, enabled)
+        self.assertEqual(new_asgs, disabled)
+        self.assertEqual(
+            sorted(['cluster-a-v002', 'cluster-b-v002']),
+            sorted(call[0][0] for call in mock_disable.call_args_list)
+        )
+
+    def test_info_cache(self, req_mock):
+        asg = "loadtest-edx-edxapp-v060"
+        cluster = "app_cluster"
+        asg_info_mock = req_mock.get(asgard.ASG_INFO_URL.format(asg), json=enabled_asg(asg))
+        cluster_info_mock = req_mock.get(asgard.CLUSTER_INFO_URL.format(cluster), json=VALID_CLUSTER_JSON_INFO)
+
+        # Without a scope, every lookup goes to Asgard.
+        asgard.get_asg_info(asg)
+        asgard.get_asg_info(asg)
+        self.assertEqual(2, asg_info_mock.call_count)
+
+        with asgard._INFO_CACHE.scope():  # pylint: disable=protected-access
+            self.assertTrue(asgard.is_asg_enabled(asg))
+            self.assertFalse(asgard.is_asg_pending_delete(asg))
+            self.assertFalse(asgard.is_last_asg(asg))
+            self.assertFalse(asgard.is_last_asg(asg))
+        self.assertEqual(3, asg_info_mock.call_count)
+        self.assertEqual(1, cluster_info_mock.call_count)
+
+    def test_info_cache_invalidated_by_task(self, req_mock):
+        asg = "loadtest-edx-edxapp-v060"
+        task_url = "http://some.host/task/1234.json"
+        asg_info_mock = req_mock.get(
+            asgard.ASG_INFO_URL.format(asg),
+            [dict(json=disabled_asg(asg)), dict(json=enabled_asg(asg))]
+        )
+        req_mock.post(asgard.ASG_ACTIVATE_URL, status_code=302, headers={"Location": task_url})
+        req_mock.get(task_url, json=COMPLETED_SAMPLE_TASK)
+
+        with asgard._INFO_CACHE.scope():  # pylint: disable=protected-access
+            self.assertFalse(asgard.is_asg_enabled(asg))
+            self.assertFalse(asgard.is_asg_enabled(asg))
+            asgard.enable_asg(asg)
+            self.assertTrue(asgard.is_asg_enabled(asg))
+        self.assertEqual(2, asg_info_mock.call_count)
+
     def test_is_asg_pending_delete(self, req_mock):
         asg = "loadtest-edx-edxapp-v060"
         self._mock_asgard_pending_delete(req_mock, [asg])
@@ -1560,3 +1911,47 @@ class TestAsgard(unittest.TestCase):
             asgard.get_asg_info(asg)
         error_message = "Call to asgard failed with status code: {}".format(403)
         self.assertTrue(str(context_manager.exception).startswith(error_message))
+
+
+class TestAsgardClientConnectionStats(unittest.TestCase):
+    """
+    Tests of the connection counts kept by the Asgard client's HTTP adapter.
+    requests_mock replaces the adapter, so these use the adapter's pools directly.
+    """
+
+    def test_connections_opened(self):
+        adapter = asgard._CountingHTTPAdapter(pool_connections=1, pool_maxsize=2)  # pylint: disable=protected-access
+        pool = adapter.poolmanager.connection_from_url('http://asgard-a.example')
+        connection = pool._get_conn()  # pylint: disable=protected-access
+        self.assertEqual(1, adapter.connections_opened())
+
+        # A connection returned to its pool is reused.
+        pool._put_conn(connection)  # pylint: disable=protected-access
+        pool._get_conn()  # pylint: disable=protected-access
+        self.assertEqual(1, adapter.connections_opened())
+
+        # Connections stay counted once their pool has been evicted.
+        other_pool = adapter.poolmanager.connection_from_url('https://asgard-b.example')
+        other_pool._get_conn()  # pylint: disable=protected-access
+        self.assertEqual(1, len(adapter.poolmanager.pools))
+        self.assertEqual(2, adapter.connections_opened())
+
+    def test_connection_stats(self):
+        def _send(*args, **kwargs):  # pylint: disable=unused-argument
+            """
+            Answer every request without opening a connection.
+            """
+            response = requests.Response()
+            response.status_code = 200
+            return response
+
+        client = asgard.AsgardClient(pool_connections=1, pool_maxsize=2)
+        with mock.patch('requests.adapters.HTTPAdapter.send', side_effect=_send) as mock_send:
+            for __ in range(3):
+                client.get('http://asgard-a.example/cluster/list.json')
+        self.assertEqual(3, mock_send.call_count)
+        pool = client.session.get_adapter('http://asgard-a.example').poolmanager.connection_from_url(
+            'http://asgard-a.example'
+        )
+        pool._get_conn()  # pylint: disable=protected-access
+        self.assertEqual({'requests': 3, 'connections': 1, 'reused': 2}, client.connection_stats())
@@ -0,0 +1,85 @@
+"""
+Tests of the code which runs calls concurrently.
+"""
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from tubular.utils.concurrency import run_concurrently, CallResult
+
+
+class UniqueTestException(Exception):
+    """
+    Mock exception to use in tests below.
+    """
+    pass
+
+
+class TestRunConcurrently(unittest.TestCase):
+    """
+    Tests for run_concurrently.
+    """
+    def test_no_items(self):
+        self.assertEqual([], run_concurrently(lambda item: item, [], 4))
+
+    def test_results_in_item_order(self):
+        results = run_concurrently(lambda item: item * 2, [3, 1, 2], 2)
+        self.assertEqual([CallResult(3, 6, None), CallResult(1, 2, None), CallResult(2, 4, None)], results)
+
+    def test_errors_are_collected(self):
+        error = UniqueTestException()
+
+        def _func(item):
+            """
+            Fail for a single item.
+            """
+            if item == 2:
+                raise error
+            return item
+
+        results = run_concurrently(_func, [1, 2, 3], 3)
+        self.assertEqual([CallResult(1, 1, None), CallResult(2, None, error), CallResult(3, 3, None)], results)
+
+    def test_calls_run_at_the_same_time(self):
+        barrier = threading.Barrier(3, timeout=5)
+        results = run_concurrently(lambda item: barrier.wait() is not None, [1, 2, 3], 3)
+        self.assertTrue(all(result.error is None for result in results))
+
+    def test_cancel_on_error(self):
+        called = []
+
+        def _func(item):
+            """
+            Fail on the first item.
+            """
+            called.append(item)
+            if item == 1:
+                raise UniqueTestException()
+            return item
+
+        results = run_concurrently(_func, [1, 2, 3], 1, cancel_on_error=True)
+        self.assertEqual([1], called)
+        self.assertEqual(1, len(results))
+        self.assertIsInstance(results[0].error, UniqueTestException)
+
+    def test_shared_executor(self):
+        executor = ThreadPoolExecutor(max_workers=1)
+        self.addCleanup(executor.shutdown)
+        thread_names = set()
+
+        def _record_thread(item):
+            """
+            Record the thread each call is made on.
+            """
+            thread_names.add(threading.current_thread().name)
+            return item
+
+        for __ in range(3):
+            results = run_concurrently(_record_thread, [1, 2], 4, executor=executor)
+            self.assertEqual([CallResult(1, 1, None), CallResult(2, 2, None)], results)
+
+        # The executor is left running, so every round used its single thread.
+        self.assertEqual(1, len(thread_names))
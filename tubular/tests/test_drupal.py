@@ -10,7 +10,8 @@ import unittest
 import requests_mock
 from six.moves import reload_module
 import tubular.drupal as drupal
-from tubular.exception import BackendError
+from tubular.exception import BackendError, UnknownEnvironmentException
+from tubular.utils import retry
 
 os.environ["TUBULAR_RETRY_ENABLED"] = "false"
 reload_module(drupal)  # pylint: disable=too-many-function-args
@@ -305,3 +306,10 @@ class TestDrupal(unittest.TestCase):
         """
         with self.assertRaises(KeyError):
             drupal.deploy(env="failure", username=TEST_USERNAME, password=TEST_PASSWORD, tag=TEST_TAG)
+
+    def test_retry_gives_up_on_invalid_environment_only(self, _mock):
+        """
+        Tests an invalid environment is not retried, while a KeyError from a malformed response is.
+        """
+        self.assertTrue(retry.giveup_on(*drupal.NON_RETRYABLE_EXCEPTIONS)(UnknownEnvironmentException("failure")))
+        self.assertFalse(retry.giveup_on(*drupal.NON_RETRYABLE_EXCEPTIONS)(KeyError("id")))
@@ -6,15 +6,23 @@ from __future__ import unicode_literals
 
 import unittest
 import datetime
+import json
+import threading
 
 import ddt
 import mock
-from moto import mock_ec2, mock_autoscaling, mock_elb
+from moto import mock_ec2, mock_autoscaling, mock_elb, mock_sqs
 from moto.ec2.utils import random_ami_id
 import boto
-from boto.exception import BotoServerError
+from boto.exception import BotoServerError, EC2ResponseError
+from boto.ec2.autoscale.tag import Tag
+from boto.resultset import ResultSet
+from boto.sqs.message import RawMessage
 import tubular.ec2 as ec2
-from tubular.tests.test_utils import create_asg_with_tags, create_elb, clone_elb_instances_with_state
+from tubular.ec2 import describe_asg_tags
+from tubular.tests.test_utils import (
+    create_asg_with_tags, create_elb, clone_elb_instances_with_state, describe_asg_tags_with_moto
+)
 from tubular.exception import (
     ImageNotFoundException,
     TimeoutException,
@@ -32,6 +40,14 @@ class TestEC2(unittest.TestCase):
     """
     _multiprocess_can_split_ = True
 
+    def setUp(self):
+        super(TestEC2, self).setUp()
+        describe_tags_patcher = mock.patch('tubular.ec2.describe_asg_tags', side_effect=describe_asg_tags_with_moto)
+        describe_tags_patcher.start()
+        self.addCleanup(describe_tags_patcher.stop)
+        ec2.reset_connections()
+        ec2._AMI_TAGS.clear()  # pylint: disable=protected-access
+
     def _make_fake_ami(self, environment='foo', deployment='bar', play='baz'):
         """
         Method to make a fake AMI.
@@ -81,6 +97,7 @@ class TestEC2(unittest.TestCase):
         self.assertEqual(False, ec2.is_stage_ami(self._make_fake_ami(environment='prod')))
         self.assertEqual(False, ec2.is_stage_ami(self._make_fake_ami(deployment='stage', play='stage')))
 
+    @mock_autoscaling
     @mock_elb
     @mock_ec2
     def test_ami_for_edp_missing_edp(self):
@@ -109,6 +126,183 @@ class TestEC2(unittest.TestCase):
         )
         self.assertEqual(ec2.active_ami_for_edp('foo', 'bar', 'baz'), fake_ami_id)
 
+    def test_elbs_by_instance(self):
+        def _fake_elb(name, instance_ids):
+            """
+            Make a stand-in for an ELB with the given instances registered in it.
+            """
+            return mock.Mock(instances=[mock.Mock(id=instance_id) for instance_id in instance_ids], name=name)
+
+        elb_1 = _fake_elb("elb-1", ["i-1", "i-2"])
+        elb_2 = _fake_elb("elb-2", ["i-2", "i-3", "i-3"])
+        elbs = [elb_1, elb_2, _fake_elb("elb-3", [])]
+        elbs_by_instance = ec2._elbs_by_instance(elbs)  # pylint: disable=protected-access
+
+        self.assertEqual({"i-1": [elb_1], "i-2": [elb_1, elb_2], "i-3": [elb_2]}, elbs_by_instance)
+
+    @mock_autoscaling
+    @mock_elb
+    @mock_ec2
+    def test_elbs_for_edp(self):
+        create_elb("edp-lb")
+        create_elb("other-lb")
+        edp_tags = {"environment": "foo", "deployment": "bar", "play": "baz"}
+        create_asg_with_tags("fully_tagged_asg", edp_tags, elbs=["edp-lb"])
+        create_asg_with_tags("other_asg", {"environment": "foo", "deployment": "bar", "play": "qux"}, elbs=["other-lb"])
+
+        with mock.patch('tubular.ec2.get_all_load_balancers', wraps=ec2.get_all_load_balancers) as mock_get_elbs:
+            elbs = ec2._elbs_for_edp(EDP("foo", "bar", "baz"))  # pylint: disable=protected-access
+        self.assertEqual(["edp-lb"], [elb.name for elb in elbs])
+        mock_get_elbs.assert_called_once_with(["edp-lb"])
+
+        # When the EDP's ASGs have no ELBs, every ELB is checked.
+        create_asg_with_tags("no_elb_asg", {"environment": "foo", "deployment": "bar", "play": "quux"})
+        elbs = ec2._elbs_for_edp(EDP("foo", "bar", "quux"))  # pylint: disable=protected-access
+        self.assertEqual({"edp-lb", "other-lb"}, set(elb.name for elb in elbs))
+
+    @mock_autoscaling
+    @mock_elb
+    @mock_ec2
+    def test_elbs_for_edp_deleted_elb(self):
+        create_elb("edp-lb")
+        create_elb("deleted-lb")
+        edp_tags = {"environment": "foo", "deployment": "bar", "play": "baz"}
+        create_asg_with_tags("fully_tagged_asg", edp_tags, elbs=["edp-lb", "deleted-lb"])
+        boto.connect_elb().delete_load_balancer("deleted-lb")
+        not_found_error = BotoServerError(
+            400, "Bad Request",
+            '<ErrorResponse><Error><Type>Sender</Type><Code>LoadBalancerNotFound</Code>'
+            '<Message>There is no ACTIVE Load Balancer named \'deleted-lb\'</Message></Error></ErrorResponse>'
+        )
+        get_all_load_balancers = ec2.get_all_load_balancers
+
+        def _get_all_load_balancers(names=None):
+            """
+            Fail as AWS does when asked for an ELB which has been deleted.
+            """
+            if names and "deleted-lb" in names:
+                raise not_found_error
+            return get_all_load_balancers(names)
+
+        with mock.patch('tubular.ec2.get_all_load_balancers', side_effect=_get_all_load_balancers) as mock_get_elbs:
+            elbs = ec2._elbs_for_edp(EDP("foo", "bar", "baz"))  # pylint: disable=protected-access
+        self.assertEqual(["edp-lb"], [elb.name for elb in elbs])
+        # The ELBs are listed in full once asking for them by name fails.
+        self.assertEqual([mock.call(["deleted-lb", "edp-lb"]), mock.call()], mock_get_elbs.call_args_list)
+
+    def test_active_amis_for_edps(self):
+        edxapp, worker, insights, ecommerce = (
+            EDP("prod", "edx", "edxapp"), EDP("prod", "edx", "worker"),
+            EDP("prod", "edx", "insights"), EDP("stage", "edx", "ecommerce")
+        )
+
+        def _fake_instance(instance_id, edp, image_id, state='running'):
+            """
+            Make a stand-in for an EC2 instance tagged with an EDP.
+            """
+            return mock.Mock(id=instance_id, state=state, image_id=image_id, tags=dict(zip(EDP._fields, edp)))
+
+        elb = mock.Mock(instances=[mock.Mock(id=instance_id) for instance_id in ("i-1", "i-2", "i-3", "i-4")])
+        instances = [
+            _fake_instance("i-1", edxapp, "ami-1"),
+            _fake_instance("i-2", worker, "ami-2"),
+            _fake_instance("i-3", worker, "ami-3"),
+            _fake_instance("i-4", ecommerce, "ami-4"),
+            _fake_instance("i-5", edxapp, "ami-5"),
+            _fake_instance("i-6", insights, "ami-6", state='stopped'),
+        ]
+        elbs_by_edp = {edxapp: [elb], worker: [elb], insights: [elb], ecommerce: []}
+
+        with mock.patch('tubular.ec2._elbs_for_edps', return_value=elbs_by_edp):
+            with mock.patch('boto.connect_ec2') as mock_connect:
+                mock_get_reservations = mock_connect.return_value.get_all_reservations
+                mock_get_reservations.return_value = [mock.Mock(instances=instances)]
+                results = ec2.active_amis_for_edps([edxapp, worker, insights, ecommerce, edxapp])
+
+        # A single scan of the reservations covers every EDP.
+        mock_get_reservations.assert_called_once_with(filters={
+            "tag:environment": ["prod", "stage"],
+            "tag:deployment": ["edx"],
+            "tag:play": ["ecommerce", "edxapp", "insights", "worker"],
+        })
+        self.assertEqual([edxapp, worker, insights, ecommerce], [result.item for result in results])
+        self.assertEqual("ami-1", results[0].result)
+        self.assertIsNone(results[0].error)
+        self.assertIsInstance(results[1].error, MultipleImagesFoundException)
+        self.assertIsInstance(results[2].error, ImageNotFoundException)
+        # The instance is in an ELB, but not in one attached to its EDP's ASGs.
+        self.assertIsInstance(results[3].error, ImageNotFoundException)
+
+    @mock_ec2
+    def test_tags_for_amis(self):
+        ami_ids = [self._make_fake_ami(play=play) for play in ("edxapp", "worker")]
+
+        with mock.patch('tubular.ec2._describe_image_tags', wraps=ec2._describe_image_tags) as mock_describe:
+            tags_by_ami = ec2.tags_for_amis(ami_ids + ami_ids)
+            self.assertEqual(["edxapp", "worker"], [tags_by_ami[ami_id]['play'] for ami_id in ami_ids])
+            mock_describe.assert_called_once_with(sorted(ami_ids))
+
+            # Cached AMIs are not requested again, and an AMI which cannot be found is left out.
+            tags_by_ami = ec2.tags_for_amis(ami_ids + ["ami-fakeid"])
+            self.assertEqual(sorted(ami_ids), sorted(tags_by_ami))
+            mock_describe.assert_called_with(["ami-fakeid"])
+            self.assertEqual(2, mock_describe.call_count)
+
+            self.assertEqual("worker", ec2.tags_for_ami(ami_ids[1])['play'])
+            self.assertEqual(2, mock_describe.call_count)
+
+        self.assertEqual({'hits': 3, 'misses': 3, 'size': 2}, ec2.ami_tag_cache_stats())
+
+    def test_tags_for_amis_error(self):
+        auth_error = EC2ResponseError(
+            401, "Unauthorized", "<Response><Errors><Error><Code>AuthFailure</Code></Error></Errors></Response>"
+        )
+        with mock.patch('tubular.ec2._describe_image_tags', side_effect=auth_error):
+            # Errors other than a missing AMI are raised, not taken to mean the AMI does not exist.
+            self.assertRaises(EC2ResponseError, ec2.tags_for_amis, ["ami-1", "ami-2"])
+            self.assertRaises(EC2ResponseError, ec2.tags_for_ami, "ami-1")
+
+    def test_ami_tag_cache_lru(self):
+        cache = ec2._AmiTagCache(2)  # pylint: disable=protected-access
+        load = mock.Mock(side_effect=lambda ami_ids: {ami_id: {'play': ami_id} for ami_id in ami_ids})
+
+        cache.get_many(["ami-1", "ami-2"], load)
+        cache.get_many(["ami-1"], load)
+        cache.get_many(["ami-3"], load)
+        # ami-2 was the least recently used, so it was dropped to make room for ami-3.
+        self.assertEqual(
+            {"ami-1": {'play': "ami-1"}, "ami-2": {'play': "ami-2"}},
+            cache.get_many(["ami-1", "ami-2"], load)
+        )
+        self.assertEqual(
+            [mock.call(["ami-1", "ami-2"]), mock.call(["ami-3"]), mock.call(["ami-2"])],
+            load.call_args_list
+        )
+        self.assertEqual({'hits': 2, 'misses': 4, 'size': 2}, cache.stats())
+
+    @mock_autoscaling
+    @mock_elb
+    @mock_ec2
+    def test_connection_registry(self):
+        connection = ec2.autoscale_connection()
+        self.assertIs(connection, ec2.autoscale_connection())
+        self.assertIsNot(connection, ec2.elb_connection())
+
+        west_connection = ec2.ec2_connection('us-west-2')
+        self.assertEqual('us-west-2', west_connection.region.name)
+        self.assertIs(west_connection, ec2.ec2_connection('us-west-2'))
+        self.assertIsNot(west_connection, ec2.ec2_connection())
+
+        # Each thread gets its own connections.
+        other_thread_connections = []
+        thread = threading.Thread(target=lambda: other_thread_connections.append(ec2.autoscale_connection()))
+        thread.start()
+        thread.join()
+        self.assertIsNot(connection, other_thread_connections[0])
+
+        ec2.reset_connections()
+        self.assertIsNot(connection, ec2.autoscale_connection())
+
     @unittest.skip("Test always fails due to not successfuly creating two different AMI IDs in single ELB.")
     @mock_autoscaling
     @mock_elb
@@ -180,6 +374,51 @@ class TestEC2(unittest.TestCase):
         self.assertEqual(len(asgs), expected_returned_count)
         self.assertTrue(all(asg_name in asgs for asg_name in expected_asg_names_list))
 
+        # Asking AWS for the tagged ASGs finds exactly what scanning every ASG finds.
+        self.assertEqual(ec2.AsgInventory().for_edp(edp, include_pending_delete=False), asgs)
+
+    @mock_autoscaling
+    @mock_ec2
+    def test_asgs_for_edp_tag_queries(self):
+        create_asg_with_tags("asg-match", {"environment": "foo", "deployment": "bar", "play": "baz"})
+        create_asg_with_tags("asg-other-env", {"environment": "prod", "deployment": "bar", "play": "baz"})
+        create_asg_with_tags("asg-other-play", {"environment": "foo", "deployment": "bar", "play": "other"})
+
+        with mock.patch('tubular.ec2.describe_asg_tags', side_effect=describe_asg_tags_with_moto) as mock_describe:
+            self.assertEqual(["asg-match"], ec2.asgs_for_edp(EDP("foo", "bar", "baz")))
+
+        # Only the ASGs with the play have their other EDP tags fetched.
+        self.assertEqual(
+            [
+                mock.call({'key': ['play'], 'value': ['baz']}),
+                mock.call({'auto-scaling-group': ['asg-match', 'asg-other-env'], 'key': ['deployment', 'environment']}),
+            ],
+            mock_describe.call_args_list
+        )
+
+    def test_describe_asg_tags(self):
+        first_page = boto.resultset.ResultSet()
+        first_page.extend([Tag(key='play', value='edxapp', resource_id='asg-1')])
+        first_page.next_token = 'page-2'
+        second_page = boto.resultset.ResultSet()
+        second_page.extend([Tag(key='play', value='edxapp', resource_id='asg-2')])
+
+        with mock.patch('boto.connect_autoscale') as mock_connect:
+            mock_get_list = mock_connect.return_value.get_list
+            mock_get_list.side_effect = [first_page, second_page]
+            tags = describe_asg_tags({'key': ['play'], 'value': ['edxapp', 'worker']})
+
+        self.assertEqual(['asg-1', 'asg-2'], [tag.resource_id for tag in tags])
+        expected_params = {
+            'Filters.member.1.Name': 'key',
+            'Filters.member.1.Values.member.1': 'play',
+            'Filters.member.2.Name': 'value',
+            'Filters.member.2.Values.member.1': 'edxapp',
+            'Filters.member.2.Values.member.2': 'worker',
+        }
+        self.assertEqual(('DescribeTags', expected_params, [('member', Tag)]), mock_get_list.call_args_list[0][0][:3])
+        self.assertEqual('page-2', mock_get_list.call_args_list[1][0][1]['NextToken'])
+
     @ddt.data(
         (103, 103, None),
         (103, 103, []),
@@ -232,7 +471,123 @@ class TestEC2(unittest.TestCase):
         asg = asgs[0]
         asg.instances[0].health_status = "Unhealthy"
         with mock.patch("boto.ec2.autoscale.AutoScaleConnection.get_all_groups", return_value=asgs):
-            self.assertRaises(TimeoutException, ec2.wait_for_in_service, [asg_name], 2)
+            with self.assertRaises(TimeoutException) as context:
+                ec2.wait_for_in_service([asg_name], 2)
+        # The timeout reports the state of each instance.
+        self.assertIn(
+            "{} {}: InService/Unhealthy for".format(asg_name, asg.instances[0].instance_id), str(context.exception)
+        )
+
+    @staticmethod
+    def _lifecycle_queue(*asg_names):
+        """
+        Create the SQS queue "lifecycle", holding a launch notification for each ASG, delivered through SNS.
+        """
+        queue = boto.connect_sqs().create_queue("lifecycle")
+        for asg_name in asg_names:
+            notification = {"Event": "autoscaling:EC2_INSTANCE_LAUNCH", "AutoScalingGroupName": asg_name}
+            queue.write(RawMessage(body=json.dumps({"Type": "Notification", "Message": json.dumps(notification)})))
+        return queue
+
+    @mock_sqs
+    def test_lifecycle_event_queue(self):
+        queue = self._lifecycle_queue("asg-1", "other-asg")
+        # Delivered by an SNS subscription with raw message delivery.
+        queue.write(RawMessage(body=json.dumps({
+            "Event": "autoscaling:EC2_INSTANCE_LAUNCH", "AutoScalingGroupName": "asg-2"
+        })))
+        queue.write(RawMessage(body="not a notification"))
+
+        events = ec2._LifecycleEventQueue.connect("lifecycle")  # pylint: disable=protected-access
+        self.assertEqual({"asg-1", "asg-2"}, events.wait(["asg-1", "asg-2"], 2))
+        # The notification about another ASG stays hidden; the rest of the messages are deleted.
+        attributes = queue.get_attributes()
+        self.assertEqual('0', attributes['ApproximateNumberOfMessages'])
+        self.assertEqual('1', attributes['ApproximateNumberOfMessagesNotVisible'])
+
+        # Notifications too old for any deploy to be waiting on are deleted too.
+        self._lifecycle_queue("stale-asg")
+        with mock.patch('tubular.ec2.ASG_LIFECYCLE_MESSAGE_MAX_AGE', -1):
+            self.assertEqual(set(), events.wait(["asg-1"], 2))
+        attributes = queue.get_attributes()
+        self.assertEqual('0', attributes['ApproximateNumberOfMessages'])
+        self.assertEqual('1', attributes['ApproximateNumberOfMessagesNotVisible'])
+
+        self.assertIsNone(ec2._LifecycleEventQueue.connect("missing"))  # pylint: disable=protected-access
+        self.assertIsNone(ec2._LifecycleEventQueue.connect(None))  # pylint: disable=protected-access
+
+    @mock_autoscaling
+    @mock_ec2
+    @mock_sqs
+    def test_wait_for_in_service_lifecycle_queue(self):
+        create_asg_with_tags("asg-1", {"foo": "bar"})
+        create_asg_with_tags("asg-2", {"foo": "bar"})
+        asgs = boto.connect_autoscale().get_all_groups(["asg-1", "asg-2"])
+        asgs[0].instances[0].lifecycle_state = "Pending"
+        self._lifecycle_queue("asg-1")
+
+        def _get_all_groups(names, **__):
+            """
+            Describe the ASGs, with the instance of asg-1 in service after the first time.
+            """
+            if get_all_groups.call_count > 1:
+                asgs[0].instances[0].lifecycle_state = "InService"
+            described = ResultSet()
+            described.extend(asg for asg in asgs if asg.name in names)
+            return described
+
+        with mock.patch(
+            "boto.ec2.autoscale.AutoScaleConnection.get_all_groups", side_effect=_get_all_groups
+        ) as get_all_groups:
+            with mock.patch("tubular.ec2.time.sleep") as sleep:
+                ec2.wait_for_in_service(["asg-1", "asg-2"], 10, lifecycle_queue="lifecycle")
+        # The notification caused asg-1 alone to be described again, without polling.
+        self.assertEqual(
+            [mock.call(names=["asg-1", "asg-2"]), mock.call(names=["asg-1"])], get_all_groups.call_args_list
+        )
+        sleep.assert_not_called()
+
+    @mock_autoscaling
+    @mock_ec2
+    @mock_sqs
+    def test_wait_for_in_service_missing_lifecycle_queue(self):
+        create_asg_with_tags("healthy_asg", {"foo": "bar"})
+        self.assertEqual(None, ec2.wait_for_in_service(["healthy_asg"], 2, lifecycle_queue="missing"))
+
+    def test_instance_health_tracker(self):
+        def _fake_asg(*instance_states):
+            """
+            Make a stand-in for the ASG "asg" with instances in the given (id, lifecycle, health) states.
+            """
+            instances = [
+                mock.Mock(instance_id=instance_id, lifecycle_state=lifecycle_state, health_status=health_status)
+                for instance_id, lifecycle_state, health_status in instance_states
+            ]
+            asg = mock.Mock(instances=instances)
+            # "name" is an argument of the Mock constructor, so it has to be set afterwards.
+            asg.name = "asg"
+            return asg
+
+        tracker = ec2._InstanceHealthTracker()  # pylint: disable=protected-access
+        self.assertFalse(tracker.update(_fake_asg(("i-1", "Pending", "Healthy"), ("i-2", "InService", "Healthy"))))
+        self.assertEqual(1, tracker.pending_instances(["asg"]))
+        self.assertFalse(tracker.update(_fake_asg(("i-1", "Pending", "Healthy"), ("i-2", "InService", "Healthy"))))
+        # i-2 was replaced by i-3.
+        self.assertTrue(tracker.update(_fake_asg(("i-1", "InService", "Healthy"), ("i-3", "InService", "Healthy"))))
+        self.assertEqual(0, tracker.pending_instances(["asg"]))
+
+        report = tracker.report(["asg"])
+        self.assertEqual(3, len(report))
+        self.assertRegexpMatches(report[0], r"^asg i-1: Pending/Healthy for \d+s, InService/Healthy for \d+s$")
+        self.assertRegexpMatches(report[1], r"^asg i-2: InService/Healthy for \d+s, Removed for \d+s$")
+        self.assertEqual([], tracker.report(["other-asg"]))
+
+    @ddt.data((0, 1), (9, 1), (25, 3), (1000, 5))
+    @ddt.unpack
+    def test_in_service_poll_delay(self, pending_instances, expected_delay):
+        with mock.patch('tubular.ec2.WAIT_SLEEP_TIME', 5):
+            poll_delay = ec2._in_service_poll_delay(pending_instances)  # pylint: disable=protected-access
+            self.assertEqual(expected_delay, poll_delay)
 
     @mock_elb
     @mock_ec2
@@ -241,28 +596,36 @@ class TestEC2(unittest.TestCase):
         second_elb_name = "healthy-lb-2"
         first_elb = create_elb(first_elb_name)
         second_elb = create_elb(second_elb_name)
-        mock_function = "boto.ec2.elb.loadbalancer.LoadBalancer.get_instance_health"
+        mock_function = "boto.ec2.elb.ELBConnection.describe_instance_health"
 
         # Setup a side effect to simulate how a instances may come online in the load balancer.
-        # 2 load balancers * 2 instances per * 3 iterations (They way these instances come online in to the load
-        # balancer will ensure that the ELB will be removed from the list on the second iteration, then the second ELB
+        # The first ELB is removed from the list on the second iteration, then the second ELB
         # is removed on the 3rd iteation.
         first_elb_instances = first_elb.get_instance_health()
         second_elb_instances = second_elb.get_instance_health()
 
-        return_vals = [
-            clone_elb_instances_with_state(first_elb_instances, "OutOfService"),
-            clone_elb_instances_with_state(second_elb_instances, "OutOfService")
-        ]
-        return_vals += [
-            clone_elb_instances_with_state(first_elb_instances, "InService"),
-            clone_elb_instances_with_state(second_elb_instances, "OutOfService")
-        ]
-        return_vals += [clone_elb_instances_with_state(second_elb_instances, "InService")]
+        return_vals = {
+            first_elb_name: [
+                clone_elb_instances_with_state(first_elb_instances, "OutOfService"),
+                clone_elb_instances_with_state(first_elb_instances, "InService"),
+            ],
+            second_elb_name: [
+                clone_elb_instances_with_state(second_elb_instances, "OutOfService"),
+                clone_elb_instances_with_state(second_elb_instances, "OutOfService"),
+                clone_elb_instances_with_state(second_elb_instances, "InService"),
+            ],
+        }
 
-        with mock.patch(mock_function, side_effect=return_vals):
+        def _describe_instance_health(_connection, elb_name):
+            """
+            Return the next instance states of an ELB. ELBs are checked concurrently, so in no particular order.
+            """
+            return return_vals[elb_name].pop(0)
+
+        with mock.patch(mock_function, autospec=True, side_effect=_describe_instance_health):
             with mock.patch('tubular.ec2.WAIT_SLEEP_TIME', 1):
                 self.assertEqual(None, ec2.wait_for_healthy_elbs([first_elb_name, second_elb_name], 3))
+        self.assertEqual({first_elb_name: [], second_elb_name: []}, return_vals)
 
     @mock_elb
     @mock_ec2
@@ -272,10 +635,70 @@ class TestEC2(unittest.TestCase):
         # Make one of the instances un-healthy.
         instances = load_balancer.get_instance_health()
         instances[0].state = "OutOfService"
-        mock_function = "boto.ec2.elb.loadbalancer.LoadBalancer.get_instance_health"
+        mock_function = "boto.ec2.elb.ELBConnection.describe_instance_health"
         with mock.patch(mock_function, return_value=instances):
             self.assertRaises(TimeoutException, ec2.wait_for_healthy_elbs, [elb_name], 2)
 
+    @mock_elb
+    @mock_ec2
+    def test_wait_for_healthy_elbs_throttled(self):
+        elb_name = "throttled-lb"
+        load_balancer = create_elb(elb_name)
+        instances = load_balancer.get_instance_health()
+        throttling_error = BotoServerError(400, "Bad Request", "<Code>RequestLimitExceeded</Code>")
+        mock_function = "boto.ec2.elb.ELBConnection.describe_instance_health"
+        with mock.patch(mock_function, side_effect=[throttling_error, instances]) as describe_instance_health:
+            with mock.patch("time.sleep"):
+                self.assertEqual(None, ec2.wait_for_healthy_elbs([elb_name], 3))
+        self.assertEqual(2, describe_instance_health.call_count)
+
+        # Errors other than throttling are not retried.
+        other_error = BotoServerError(400, "Bad Request", "<Code>ValidationError</Code>")
+        with mock.patch(mock_function, side_effect=other_error) as describe_instance_health:
+            self.assertRaises(BotoServerError, ec2.wait_for_healthy_elbs, [elb_name], 3)
+        self.assertEqual(1, describe_instance_health.call_count)
+
+    def test_token_bucket(self):
+        clock = [1000.0]
+
+        def _sleep(seconds):
+            """
+            Pass time on the fake clock instead of sleeping.
+            """
+            clock[0] += seconds
+
+        ok_response = mock.Mock(status=200)
+        throttled_response = mock.Mock(status=400, **{'read.return_value': b"<Code>Throttling</Code>"})
+        with mock.patch('tubular.ec2.time.time', side_effect=lambda: clock[0]):
+            with mock.patch('tubular.ec2.time.sleep', side_effect=_sleep):
+                limiter = ec2._TokenBucket(rate=2, burst=2)  # pylint: disable=protected-access
+                request = mock.Mock(return_value=ok_response)
+                for __ in range(4):
+                    self.assertEqual(ok_response, limiter.call(request, "/", verb="GET"))
+                request.assert_called_with("/", verb="GET")
+                # The first two calls use the burst, the next two wait half a second each for a token.
+                self.assertEqual(1001.0, clock[0])
+
+                limiter.call(mock.Mock(return_value=throttled_response))
+                self.assertEqual(1.0, limiter.rate)
+                limiter.call(request)
+                self.assertEqual(1.125, limiter.rate)
+
+        stats = limiter.stats()
+        self.assertEqual(6, stats['calls'])
+        self.assertEqual(1, stats['throttled_calls'])
+        # Half a second for each of the third to fifth calls, and a second for the sixth at the halved rate.
+        self.assertEqual(3.0, stats['wait_seconds'])
+        self.assertEqual(0.0, stats['call_seconds'])
+
+    @mock_autoscaling
+    @mock_ec2
+    def test_connections_rate_limited(self):
+        create_asg_with_tags("rate_limited_asg", {"foo": "bar"})
+        calls = ec2.aws_rate_limit_stats()['autoscale']['calls']
+        ec2.get_all_autoscale_groups(["rate_limited_asg"])
+        self.assertEqual(calls + 1, ec2.aws_rate_limit_stats()['autoscale']['calls'])
+
     @mock_autoscaling
     @mock_elb
     @mock_ec2
@@ -355,6 +778,193 @@ class TestEC2(unittest.TestCase):
         self.assertEqual(asg.tags[0].key, ec2.ASG_DELETE_TAG_KEY)
         self.assertEqual(asg.tags[0].value, deletion_dttm_str)
 
+    @mock_autoscaling
+    @mock_ec2
+    @mock_elb
+    def test_get_asgs_pending_delete_oldest_first(self):
+        now = datetime.datetime.utcnow()
+        for asg_name, minutes_ago in (("test-asg-newest", 1), ("test-asg-oldest", 60), ("test-asg-middle", 10)):
+            deletion_dttm_str = (now - datetime.timedelta(minutes=minutes_ago)).isoformat()
+            create_asg_with_tags(asg_name, {ec2.ASG_DELETE_TAG_KEY: deletion_dttm_str})
+
+        asgs = ec2.get_asgs_pending_delete()
+        self.assertEqual(["test-asg-oldest", "test-asg-middle", "test-asg-newest"], [asg.name for asg in asgs])
+
+    @mock_autoscaling
+    @mock_ec2
+    @mock_elb
+    def test_tag_asgs_for_deletion(self):
+        asg_names = ["test-asg-{}".format(index) for index in range(ec2.ASG_TAGS_PER_REQUEST + 5)]
+        for asg_name in asg_names:
+            create_asg_with_tags(asg_name, {"foo": "bar"})
+
+        with mock.patch('tubular.ec2.get_all_autoscale_groups', wraps=ec2.get_all_autoscale_groups) as mock_get_asgs:
+            with mock.patch('boto.ec2.autoscale.AutoScaleConnection.create_or_update_tags',
+                            wraps=ec2.autoscale_connection().create_or_update_tags) as mock_create_tags:
+                tagged = ec2.tag_asgs_for_deletion(asg_names + ["test-asg-missing"], 0)
+
+        self.assertEqual(asg_names, tagged)
+        # The existence check and the tagging take one request per batch, not one per ASG.
+        self.assertEqual(2, mock_get_asgs.call_count)
+        self.assertEqual(2, mock_create_tags.call_count)
+        self.assertEqual(
+            [ec2.ASG_TAGS_PER_REQUEST, 5],
+            [len(call[0][0]) for call in mock_create_tags.call_args_list]
+        )
+        self.assertEqual(
+            sorted(asg_names),
+            sorted(asg.name for asg in ec2.get_asgs_pending_delete())
+        )
+
+        # Moto does not implement delete_tags().
+        with mock.patch('boto.ec2.autoscale.AutoScaleConnection.delete_tags') as mock_delete_tags:
+            self.assertEqual(asg_names[:3], ec2.remove_asg_deletion_tags(asg_names[:3] + ["test-asg-missing"]))
+        mock_delete_tags.assert_called_once_with(mock.ANY)
+        self.assertEqual(asg_names[:3], [tag.resource_id for tag in mock_delete_tags.call_args[0][0]])
+
+    @mock_autoscaling
+    @mock_ec2
+    @mock_elb
+    def test_asg_inventory(self):
+        past_dttm_str = (datetime.datetime.utcnow() - datetime.timedelta(minutes=5)).isoformat()
+        edp_tags = {"environment": "foo", "deployment": "bar", "play": "baz"}
+        create_asg_with_tags("test-asg-1", edp_tags)
+        create_asg_with_tags("test-asg-2", dict(edp_tags, **{ec2.ASG_DELETE_TAG_KEY: past_dttm_str}))
+        create_asg_with_tags("test-asg-3", {ec2.ASG_DELETE_TAG_KEY: past_dttm_str})
+        edp = EDP("foo", "bar", "baz")
+
+        with mock.patch('tubular.ec2.get_all_autoscale_groups', wraps=ec2.get_all_autoscale_groups) as mock_get_asgs:
+            with ec2.asg_inventory() as inventory:
+                self.assertEqual(["test-asg-2", "test-asg-3"], [asg.name for asg in ec2.get_asgs_pending_delete()])
+                self.assertEqual(["test-asg-1", "test-asg-2"], ec2.asgs_for_edp(edp, filter_asgs_pending_delete=False))
+                self.assertEqual(["test-asg-1"], ec2.asgs_for_edp(edp))
+
+                # Moto does not implement delete_tags().
+                with mock.patch('boto.ec2.autoscale.AutoScaleConnection.delete_tags') as mock_delete_tags:
+                    ec2.remove_asg_deletion_tag("test-asg-2")
+                self.assertEqual(1, mock_delete_tags.call_count)
+                ec2.tag_asg_for_deletion("test-asg-1", 3600)
+                self.assertEqual(["test-asg-2"], ec2.asgs_for_edp(edp))
+                self.assertEqual(["test-asg-3"], [asg.name for asg in ec2.get_asgs_pending_delete()])
+                self.assertTrue(inventory.is_tagged_for_deletion("test-asg-1"))
+
+                # The account was only listed once, however many questions were answered,
+                # and the tag changes were checked against the snapshot.
+                self.assertEqual([mock.call()], mock_get_asgs.call_args_list)
+
+                # ASGs created after the snapshot was taken are looked up by name.
+                create_asg_with_tags("test-asg-4", edp_tags)
+                self.assertIsNotNone(inventory.get("test-asg-4"))
+                self.assertEqual(["test-asg-2", "test-asg-4"], ec2.asgs_for_edp(edp))
+
+                # The snapshot is rebuilt from the account, where the deletion tag of test-asg-2 was never removed.
+                inventory.invalidate()
+                inventory.refresh()
+                self.assertEqual(["test-asg-4"], ec2.asgs_for_edp(edp))
+
+            # Outside of the with block, every call goes to AWS again.
+            ec2.get_asgs_pending_delete()
+        self.assertEqual(4, mock_get_asgs.call_count)
+
+    @mock_autoscaling
+    @mock_ec2
+    @mock_elb
+    def test_tag_asgs_batch_failures(self):
+        asg_names = ["test-asg-{}".format(index) for index in range(ec2.ASG_TAGS_PER_REQUEST + 5)]
+        for asg_name in asg_names:
+            create_asg_with_tags(asg_name, {"foo": "bar"})
+        create_or_update_tags = ec2.autoscale_connection().create_or_update_tags
+        describe_asgs = ec2._describe_asgs  # pylint: disable=protected-access
+        validation_error = BotoServerError(
+            400, "Bad Request",
+            '<ErrorResponse><Error><Type>Sender</Type><Code>ValidationError</Code>'
+            '<Message>AutoScalingGroup name not found</Message></Error></ErrorResponse>'
+        )
+        throttling_error = BotoServerError(
+            400, "Bad Request",
+            '<ErrorResponse><Error><Type>Sender</Type><Code>Throttling</Code>'
+            '<Message>Rate exceeded</Message></Error></ErrorResponse>'
+        )
+        sent_batches = []
+
+        def _create_or_update_tags(tags):
+            """
+            Fail the first batch because one of its ASGs was deleted after the existence check,
+            and throttle the second batch once.
+            """
+            names = [tag.resource_id for tag in tags]
+            sent_batches.append(names)
+            if len(sent_batches) == 1:
+                boto.ec2.autoscale.connect_to_region('us-east-1').delete_auto_scaling_group(
+                    "test-asg-0", force_delete=True
+                )
+                raise validation_error
+            if len(sent_batches) == 3:
+                raise throttling_error
+            return create_or_update_tags(tags)
+
+        with mock.patch('boto.ec2.autoscale.AutoScaleConnection.create_or_update_tags',
+                        side_effect=_create_or_update_tags):
+            with mock.patch('tubular.ec2._describe_asgs', wraps=describe_asgs) as mock_describe:
+                tagged = ec2.tag_asgs_for_deletion(asg_names, 0)
+
+        self.assertEqual(asg_names[1:], tagged)
+        # The existence check is made again only for the batch which failed validation.
+        self.assertEqual(2, mock_describe.call_count)
+        self.assertEqual(asg_names[:ec2.ASG_TAGS_PER_REQUEST], mock_describe.call_args[0][0])
+        # Only the throttled batch is sent again.
+        self.assertEqual(
+            [
+                asg_names[:ec2.ASG_TAGS_PER_REQUEST],
+                asg_names[1:ec2.ASG_TAGS_PER_REQUEST],
+                asg_names[ec2.ASG_TAGS_PER_REQUEST:],
+                asg_names[ec2.ASG_TAGS_PER_REQUEST:],
+            ],
+            sent_batches
+        )
+
+    @mock_autoscaling
+    @mock_ec2
+    @mock_elb
+    def test_tag_asgs_deleted_during_inventory(self):
+        create_asg_with_tags("test-asg-kept", {"foo": "bar"})
+        create_asg_with_tags("test-asg-deleted", {"foo": "bar"})
+
+        with ec2.asg_inventory() as inventory:
+            inventory.refresh()
+            # The ASG is deleted after the snapshot was taken, as may happen during a deploy.
+            boto.ec2.autoscale.connect_to_region('us-east-1').delete_auto_scaling_group(
+                "test-asg-deleted", force_delete=True
+            )
+            create_or_update_tags = ec2.autoscale_connection().create_or_update_tags
+            validation_error = BotoServerError(
+                400, "Bad Request",
+                '<ErrorResponse><Error><Type>Sender</Type><Code>ValidationError</Code>'
+                '<Message>AutoScalingGroup name not found</Message></Error></ErrorResponse>'
+            )
+
+            def _create_or_update_tags(tags):
+                """
+                Refuse the tags of a deleted ASG, as AWS does.
+                """
+                if "test-asg-deleted" in [tag.resource_id for tag in tags]:
+                    raise validation_error
+                return create_or_update_tags(tags)
+
+            with mock.patch('boto.ec2.autoscale.AutoScaleConnection.create_or_update_tags',
+                            side_effect=_create_or_update_tags) as mock_create_tags:
+                with mock.patch('tubular.ec2.get_all_autoscale_groups',
+                                wraps=ec2.get_all_autoscale_groups) as mock_get_asgs:
+                    tagged = ec2.tag_asgs_for_deletion(["test-asg-kept", "test-asg-deleted"])
+
+            self.assertEqual(["test-asg-kept"], tagged)
+            # The snapshot answered the existence check, and only the refused batch was described again.
+            mock_get_asgs.assert_called_once_with(["test-asg-kept", "test-asg-deleted"])
+            self.assertEqual(2, mock_create_tags.call_count)
+            self.assertEqual(["test-asg-kept"], [tag.resource_id for tag in mock_create_tags.call_args[0][0]])
+            self.assertEqual(["test-asg-kept"], [asg.name for asg in inventory.asgs()])
+            self.assertTrue(inventory.is_tagged_for_deletion("test-asg-kept"))
+
     @mock_autoscaling
     @mock_ec2
     @mock_elb
@@ -373,6 +983,59 @@ class TestEC2(unittest.TestCase):
         self.assertEqual(len([asg for asg in asgs if asg.name == asg_name1]), 1)
         self.assertEqual(len([asg for asg in asgs if asg.name == asg_name2]), 0)
 
+    @mock_autoscaling
+    @mock_ec2
+    @mock_elb
+    def test_get_asg_names_pending_delete(self):
+        now = datetime.datetime.utcnow()
+        for asg_name, minutes_from_now in (("test-asg-due", -5), ("test-asg-soon", 5), ("test-asg-later", 300)):
+            deletion_dttm_str = (now + datetime.timedelta(minutes=minutes_from_now)).isoformat()
+            create_asg_with_tags(asg_name, {ec2.ASG_DELETE_TAG_KEY: deletion_dttm_str})
+        create_asg_with_tags("test-asg-malformed", {ec2.ASG_DELETE_TAG_KEY: "not a timestamp"})
+        create_asg_with_tags("test-asg-untagged", {"foo": "bar"})
+
+        with mock.patch('tubular.ec2.get_all_autoscale_groups', wraps=ec2.get_all_autoscale_groups) as mock_get_asgs:
+            with mock.patch('tubular.ec2.LOG.warning') as mock_warning:
+                self.assertEqual(["test-asg-due"], ec2.get_asg_names_pending_delete())
+                self.assertEqual(["test-asg-due", "test-asg-soon"], ec2.get_asg_names_pending_delete(10))
+                self.assertEqual(["test-asg-due"], [asg.name for asg in ec2.get_asgs_pending_delete()])
+        # Only the due ASGs are described, and each run warns once about the malformed tags.
+        mock_get_asgs.assert_called_once_with(["test-asg-due"])
+        self.assertEqual(3, mock_warning.call_count)
+
+    @mock_autoscaling
+    @mock_ec2
+    @mock_elb
+    def test_get_asg_names_pending_delete_in_region(self):
+        deletion_dttm_str = (datetime.datetime.utcnow() - datetime.timedelta(minutes=5)).isoformat()
+        create_asg_with_tags("test-asg-us-east-1", {ec2.ASG_DELETE_TAG_KEY: deletion_dttm_str})
+
+        self.assertEqual(["test-asg-us-east-1"], ec2.get_asg_names_pending_delete(region='us-east-1'))
+        self.assertEqual([], ec2.get_asg_names_pending_delete(region='us-west-2'))
+        with ec2.asg_inventory():
+            # The shared snapshot only covers the default region.
+            self.assertEqual([], ec2.get_asg_names_pending_delete(region='us-west-2'))
+
+    def test_pending_delete_index(self):
+        now = datetime.datetime.utcnow()
+        index = ec2.PendingDeleteIndex()
+        self.assertTrue(index.add("asg-b", (now - datetime.timedelta(minutes=1)).isoformat()))
+        self.assertTrue(index.add("asg-a", (now - datetime.timedelta(minutes=2)).isoformat()))
+        self.assertTrue(index.add("asg-c", (now + datetime.timedelta(minutes=2)).isoformat()))
+        self.assertFalse(index.add("asg-d", "2016-05-18 18:19:46.144884"))
+
+        self.assertEqual(4, len(index))
+        self.assertIn("asg-d", index)
+        self.assertEqual({"asg-d": "2016-05-18 18:19:46.144884"}, index.malformed)
+        self.assertEqual(["asg-a", "asg-b"], index.due())
+        self.assertEqual(["asg-a", "asg-b", "asg-c"], index.due_within(5))
+
+        # Replacing and removing tags keeps the index in order.
+        index.add("asg-a", (now + datetime.timedelta(minutes=1)).isoformat())
+        index.remove("asg-b")
+        self.assertEqual([], index.due())
+        self.assertEqual(["asg-a", "asg-c"], index.due_within(5))
+
     def test_create_tag_for_asg_deletion(self):
         asg_name = "test-asg-tags"
         tag = ec2.create_tag_for_asg_deletion(asg_name, 1)
@@ -453,6 +1116,12 @@ class TestEC2(unittest.TestCase):
           '  <RequestId>8xb4df00d</RequestId>'
           '</ErrorResponse>'),
          False),
+        (400,
+         ('<Response><Errors><Error>'
+          '<Code>RequestLimitExceeded</Code>'
+          '<Message>Request limit exceeded.</Message>'
+          '</Error></Errors><RequestID>8xb4df00d</RequestID></Response>'),
+         False),
         ('junk', '<ErrorResponse xmlns="http://autoscaling.amazonaws.com/doc/2011-01-01/"></ErrorResponse>', True),
         (200, '<ErrorResponse xmlns="http://autoscaling.amazonaws.com/doc/2011-01-01/"></ErrorResponse>', True),
         (400, '<ErrorResponse xmlns="http://autoscaling.amazonaws.com/doc/2011-01-01/"></ErrorResponse>', True),
@@ -545,3 +1214,43 @@ class TestEC2(unittest.TestCase):
             skip_if_tag=skip_if_tag,
             tags=tags)
         self.assertEqual(len(terminated_instances), expected_count)
+
+    @mock_ec2
+    def test_reap_instances(self):
+        conn = boto.connect_ec2('dummy_key', 'dummy_secret')
+        for name in ['gocd automation run 001', 'gocd automation run 002', 'gocd automation run 003', 'Hamster']:
+            conn.run_instances('ami-1234fug').instances[0].add_tag('Name', name)
+        protected = conn.run_instances('ami-1234fug').instances[0]
+        protected.add_tag('Name', 'gocd automation run 004')
+        protected.add_tag('do_not_delete', 'true')
+
+        dry_run = ec2.reap_instances('us-east-1', {'tag:Name': 'gocd*'}, 0, 'do_not_delete', dry_run=True)
+        self.assertEqual(3, len(dry_run['instances']))
+        self.assertEqual([], dry_run['terminated'])
+        self.assertEqual(0, dry_run['batches'])
+
+        with mock.patch('boto.ec2.connection.EC2Connection.terminate_instances',
+                        wraps=ec2.ec2_connection('us-east-1').terminate_instances) as mock_terminate:
+            report = ec2.reap_instances('us-east-1', {'tag:Name': 'gocd*'}, 0, 'do_not_delete', batch_size=2)
+        self.assertEqual(sorted(inst['id'] for inst in dry_run['instances']), sorted(report['terminated']))
+        self.assertEqual(2, report['batches'])
+        self.assertEqual([2, 1], [len(call[1]['instance_ids']) for call in mock_terminate.call_args_list])
+
+        # Terminated instances are no longer found.
+        self.assertEqual([], ec2.terminate_instances('us-east-1', {'tag:Name': 'gocd*'}, 0, 'do_not_delete'))
+
+    def test_reap_instances_in_regions(self):
+        def _reap_instances(region, *args):  # pylint: disable=unused-argument
+            """
+            Fail in a single region.
+            """
+            if region == 'us-west-2':
+                raise BotoServerError(500, "Internal Failure")
+            return {'region': region}
+
+        with mock.patch('tubular.ec2.reap_instances', side_effect=_reap_instances):
+            results = ec2.reap_instances_in_regions(['us-east-1', 'us-west-2'], {}, 24, 'do_not_delete')
+
+        self.assertEqual(['us-east-1', 'us-west-2'], [result.item for result in results])
+        self.assertEqual({'region': 'us-east-1'}, results[0].result)
+        self.assertIsInstance(results[1].error, BotoServerError)
@@ -157,3 +157,54 @@ class TestLifecycleManager(unittest.TestCase):
         with mock.patch(retry.__name__ + '.LifecycleManager.get_delay_time', lambda x: 0):
             manager = retry.LifecycleManager(2, 1, 500)
             self.assertEqual("success", manager.execute(mock_func, 'arg1', 'arg2'))
+
+    def test_execute_giveup(self):
+        mock_func = mock.MagicMock()
+        mock_func.side_effect = [UniqueTestException, "success"]
+        mock_func.__name__ = 'TheMockTestFunction'
+        with mock.patch(retry.__name__ + '.LifecycleManager.get_delay_time', lambda x: 0):
+            manager = retry.LifecycleManager(2, 1, 500, giveup=retry.giveup_on(UniqueTestException))
+            self.assertRaises(UniqueTestException, manager.execute, mock_func, 'arg1', 'arg2')
+        self.assertEqual(1, mock_func.call_count)
+
+    def test_execute_retry_on(self):
+        mock_func = mock.MagicMock()
+        mock_func.side_effect = [UniqueTestException, ValueError, "success"]
+        mock_func.__name__ = 'TheMockTestFunction'
+        with mock.patch(retry.__name__ + '.LifecycleManager.get_delay_time', lambda x: 0):
+            manager = retry.LifecycleManager(3, 1, 500, retry_on=(UniqueTestException,))
+            self.assertRaises(ValueError, manager.execute, mock_func, 'arg1', 'arg2')
+        self.assertEqual(2, mock_func.call_count)
+
+    def test_execute_validate(self):
+        mock_func = mock.MagicMock()
+        mock_func.side_effect = ["waiting", "done"]
+        mock_func.__name__ = 'TheMockTestFunction'
+        with mock.patch(retry.__name__ + '.LifecycleManager.get_delay_time', lambda x: 0):
+            manager = retry.LifecycleManager(2, 1, 500, validate=lambda result: result == "done")
+            self.assertEqual("done", manager.execute(mock_func))
+
+            mock_func.side_effect = ["waiting", "waiting"]
+            manager = retry.LifecycleManager(2, 1, 500, validate=lambda result: result == "done")
+            self.assertRaises(retry.InvalidResultException, manager.execute, mock_func)
+
+    def test_wait_strategies(self):
+        self.assertEqual(
+            [1, 2, 4, 8, 10],
+            [retry.exponential(1, 2, max_seconds=10)(attempt, 0) for attempt in range(1, 6)]
+        )
+
+        jitter = retry.decorrelated_jitter(base_seconds=1, max_seconds=20)
+        self.assertEqual(1, jitter(1, 0))
+        for __ in range(50):
+            self.assertTrue(1 <= jitter(2, 4) <= 12)
+        self.assertEqual(20, retry.decorrelated_jitter(base_seconds=30, max_seconds=20)(2, 30))
+
+    def test_execute_uses_wait_strategy(self):
+        mock_func = mock.MagicMock()
+        mock_func.side_effect = [UniqueTestException, UniqueTestException, "success"]
+        mock_func.__name__ = 'TheMockTestFunction'
+        with mock.patch(retry.__name__ + '.time.sleep') as mock_sleep:
+            manager = retry.LifecycleManager(3, 1, None, wait=retry.exponential(base_seconds=2))
+            self.assertEqual("success", manager.execute(mock_func))
+        self.assertEqual([mock.call(2), mock.call(4)], mock_sleep.call_args_list)
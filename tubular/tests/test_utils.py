@@ -78,6 +78,37 @@ def create_asg_with_tags(asg_name, tags, ami_id="ami-abcd1234", elbs=None):
     return group
 
 
+def describe_asg_tags_with_moto(filters, region=None):
+    """
+    Stand-in for tubular.ec2.describe_asg_tags, as moto does not implement DescribeTags for ASGs.
+    Answers from the tags of the ASGs created in moto.
+
+    Arguments:
+        filters(dict): Maps 'auto-scaling-group', 'key' or 'value' to a list of values.
+        region(str): The region of the ASGs. Defaults to us-east-1.
+
+    Returns:
+        list(boto.ec2.autoscale.tag.Tag): The matching tags.
+    """
+    tag_attributes = {'auto-scaling-group': 'resource_id', 'key': 'key', 'value': 'value'}
+    conn = boto.ec2.autoscale.connect_to_region(region or 'us-east-1')
+    asgs = conn.get_all_groups()
+    tags = []
+    while True:
+        for asg in asgs:
+            for tag in asg.tags:
+                tag.resource_id = asg.name
+                tags.append(tag)
+        if not asgs.next_token:
+            break
+        asgs = conn.get_all_groups(next_token=asgs.next_token)
+
+    return [
+        tag for tag in tags
+        if all(getattr(tag, tag_attributes[name]) in values for name, values in six.iteritems(filters))
+    ]
+
+
 def create_elb(elb_name):
     """
     Method to create an Elastic Load Balancer.
@@ -0,0 +1,58 @@
+"""
+Code used to run independent calls concurrently.
+"""
+from __future__ import absolute_import
+from __future__ import unicode_literals
+import logging
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, FIRST_EXCEPTION, ALL_COMPLETED, wait
+
+LOG = logging.getLogger(__name__)
+
+# The outcome of calling a function for a single item.
+# Exactly one of result or error is meaningful: error is None when the call succeeded.
+CallResult = namedtuple('CallResult', ['item', 'result', 'error'])
+
+
+def run_concurrently(func, items, max_workers, cancel_on_error=False, executor=None):
+    """
+    Call func once for each item using a bounded pool of threads.
+
+    Arguments:
+        func (function): Function which takes a single item as its argument.
+        items (iterable): The items to call func with.
+        max_workers (int): Maximum number of calls in flight at once. Values below 1 are treated as 1.
+        cancel_on_error (bool): If True, calls which have not started when a call fails are cancelled.
+        executor (concurrent.futures.Executor): An executor to run the calls on, which is left running
+            so that its threads can be reused. If None, a new pool of up to max_workers threads is used.
+
+    Returns:
+        list(CallResult): One result for each call that was made, in the order of items.
+            Calls cancelled because of an earlier failure are not included.
+    """
+    items = list(items)
+    if not items:
+        return []
+
+    own_executor = executor is None
+    if own_executor:
+        executor = ThreadPoolExecutor(max_workers=max(1, min(int(max_workers), len(items))))
+    try:
+        futures = [executor.submit(func, item) for item in items]
+        __, not_done = wait(futures, return_when=FIRST_EXCEPTION if cancel_on_error else ALL_COMPLETED)
+        for future in not_done:
+            future.cancel()
+        if not own_executor:
+            wait([future for future in futures if not future.cancelled()])
+    finally:
+        if own_executor:
+            executor.shutdown(wait=True)
+
+    results = []
+    for item, future in zip(items, futures):
+        if future.cancelled():
+            LOG.debug("Call for {} was cancelled after an earlier call failed.".format(item))
+            continue
+        error = future.exception()
+        results.append(CallResult(item, None if error else future.result(), error))
+    return results
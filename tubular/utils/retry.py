@@ -6,6 +6,7 @@ from __future__ import unicode_literals
 import time
 import logging
 import os
+import random
 
 from functools import wraps
 from datetime import datetime, timedelta
@@ -17,7 +18,60 @@ MAX_TIME_SECONDS = os.environ.get('RETRY_MAX_TIME_SECONDS', None)
 LOG = logging.getLogger(__name__)
 
 
-def retry(attempts=MAX_ATTEMPTS, delay_seconds=DELAY_SECONDS, max_time_seconds=MAX_TIME_SECONDS):
+def exponential(base_seconds=1, factor=2, max_seconds=None):
+    """
+    Wait strategy which multiplies the wait by factor after every attempt.
+
+    Arguments:
+        base_seconds (float): Seconds to wait after the first attempt.
+        factor (float): The factor by which the wait grows after each attempt.
+        max_seconds (float): The longest wait. None means the wait is not capped.
+
+    Returns:
+        function: Takes the number of the attempt which failed and the previous delay, and returns the delay.
+    """
+    def _wait(attempt_number, previous_delay):  # pylint: disable=unused-argument
+        """
+        Wait base_seconds * factor ** (attempt_number - 1).
+        """
+        delay = base_seconds * factor ** (attempt_number - 1)
+        return delay if max_seconds is None else min(max_seconds, delay)
+    return _wait
+
+
+def decorrelated_jitter(base_seconds=1, max_seconds=60):
+    """
+    Wait strategy which waits a random time between base_seconds and three times the previous wait,
+    so that callers which failed together do not retry together.
+
+    Arguments:
+        base_seconds (float): The shortest wait, and the wait after the first attempt.
+        max_seconds (float): The longest wait.
+
+    Returns:
+        function: Takes the number of the attempt which failed and the previous delay, and returns the delay.
+    """
+    def _wait(attempt_number, previous_delay):  # pylint: disable=unused-argument
+        """
+        Wait a random time between base_seconds and three times previous_delay.
+        """
+        return min(max_seconds, random.uniform(base_seconds, max(base_seconds, previous_delay * 3)))
+    return _wait
+
+
+def giveup_on(*exception_types):
+    """
+    Arguments:
+        exception_types (type): Exceptions which would be raised again on every attempt, so are not retried.
+
+    Returns:
+        function: A giveup predicate for retry which is True for exceptions of any of exception_types.
+    """
+    return lambda err: isinstance(err, exception_types)
+
+
+def retry(attempts=MAX_ATTEMPTS, delay_seconds=DELAY_SECONDS, max_time_seconds=MAX_TIME_SECONDS,
+          wait=None, retry_on=(Exception,), giveup=None, validate=None):
     """
     Decorator wraps a function that will attempt to "retry" the function if an exception is raised during execution.
      If no exception is raised, the return value of the wrapped function will be returned to the caller.
@@ -26,12 +80,18 @@ def retry(attempts=MAX_ATTEMPTS, delay_seconds=DELAY_SECONDS, max_time_seconds=M
         attempts (int): Number of times to attempt the function
         delay_seconds (int): time in seconds to delay between each attempt
         max_time_seconds (int): Maximum time in seconds to attempt retrying this function
+        wait (function): Wait strategy, such as exponential() or decorrelated_jitter(), used instead of
+            waiting delay_seconds between each attempt
+        retry_on (tuple): The exceptions which are retried. Others are raised at once.
+        giveup (function): Called with each exception raised, returns True if it should be raised at once.
+        validate (function): Called with each return value, returns False if the function should be retried.
 
     Returns:
         The return value of the wrapped function
 
     Raises:
         The final exception raised by the wrapped function
+        InvalidResultException: If the final return value of the wrapped function did not pass validation
     """
     def retry_decorator(func_to_wrap):
         """
@@ -45,7 +105,10 @@ def retry(attempts=MAX_ATTEMPTS, delay_seconds=DELAY_SECONDS, max_time_seconds=M
             """
             Function to wrap the function which is retried.
             """
-            return LifecycleManager(attempts, delay_seconds, max_time_seconds).execute(func_to_wrap, *args, **kwargs)
+            return LifecycleManager(
+                attempts, delay_seconds, max_time_seconds,
+                wait=wait, retry_on=retry_on, giveup=giveup, validate=validate
+            ).execute(func_to_wrap, *args, **kwargs)
         return function_wrapper
     return retry_decorator
 
@@ -55,20 +118,21 @@ class LifecycleManager(object):
     Manages the lifecycle of a function to be retried using the retry wrapper: tubular.utils.retry.retry
     """
 
-    def __init__(self, max_attempts, delay_seconds, max_time_seconds):
+    def __init__(self, max_attempts, delay_seconds, max_time_seconds,
+                 wait=None, retry_on=(Exception,), giveup=None, validate=None):
         """
         Create a lifecycle manager. Validates arguments.
 
-        TODO: Allow caller to specify a list of exceptions that can be checked for and return if any of those are raised
-        TODO: Allow caller to pass in a validation function that can be used to evaluate the return value of the wrapped
-              function
-        TODO: Exponential back off with a ceiling might be another nice feature.
-
         Arguments:
             max_attempts (int): number of times to attempt the wrapped function. Must be >= 1
             delay_seconds (int): How long to delay between calls to the wrapped function. Must be >= 0
             max_time_seconds (int): maximum number of seconds to keep attempting to call this function. Default: None
                                      When None the method will continue to be called until max_attempts is reached.
+            wait (function): Wait strategy called with the number of the attempt which failed and the previous
+                             delay, returning the seconds to delay. Default: None, which delays delay_seconds.
+            retry_on (tuple): The exceptions which are retried. Others are raised at once.
+            giveup (function): Called with each exception raised, returns True if it should be raised at once.
+            validate (function): Called with each return value, returns False if the function should be retried.
         """
         if max_attempts < 1:
             raise RetryException(
@@ -91,6 +155,11 @@ class LifecycleManager(object):
         # pylint: disable=round-builtin
         self.max_attempts = round(max_attempts)
         self.delay_seconds = round(delay_seconds)
+        self.wait = wait
+        self.retry_on = tuple(retry_on)
+        self.giveup = giveup
+        self.validate = validate
+        self._previous_delay = 0
 
     def max_attempts_reached(self):
         """
@@ -113,13 +182,23 @@ class LifecycleManager(object):
         Returns:
             int: seconds to delay
         """
-        return self.delay_seconds
+        if self.wait is None:
+            return self.delay_seconds
+        return self.wait(self._current_attempt_number, self._previous_delay)
 
     def sleep(self):
         """
         Sleep this lifecycle manager
         """
-        time.sleep(self.get_delay_time())
+        self._previous_delay = self.get_delay_time()
+        time.sleep(self._previous_delay)
+
+    def should_retry(self, err):
+        """
+        Returns:
+            bool: True if the exception raised by an attempt is one to retry
+        """
+        return isinstance(err, self.retry_on) and not (self.giveup and self.giveup(err))
 
     def done(self):
         """
@@ -150,8 +229,18 @@ class LifecycleManager(object):
                     self._current_attempt_number
                 ))
                 result = func_to_retry(*args, **kwargs)
-                break
+                if self.validate is None or self.validate(result):
+                    break
+                msg = "Function {0} returned an invalid result: {1}".format(func_to_retry.__name__, result)
+                LOG.warning(msg)
+                result = InvalidResultException(msg)
             except Exception as err:  # pylint: disable=broad-except
+                if not self.should_retry(err):
+                    LOG.warning(
+                        "Error executing function {0}, not retrying. Exception type: {1} Message: {2}".format(
+                            func_to_retry.__name__, err.__class__, err
+                        ))
+                    raise
                 LOG.warning(
                     "Error executing function {0}, Exception type: {1} Message: {2}".format(
                         func_to_retry.__name__, err.__class__, err
@@ -172,3 +261,10 @@ class RetryException(Exception):
     Exception to use in retry tests.
     """
     pass
+
+
+class InvalidResultException(Exception):
+    """
+    Raised when the final return value of a retried function does not pass validation.
+    """
+    pass